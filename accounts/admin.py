@@ -1,6 +1,54 @@
 from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.contrib.auth.forms import AdminUserCreationForm, UserChangeForm as BaseUserChangeForm
 
 from accounts.models import User
+from event_management.utils.paginator import EstimatedCountPaginator
 
 
-admin.site.register(User)
+class UserCreationForm(AdminUserCreationForm):
+    class Meta:
+        model = User
+        fields = ('email', 'name')
+
+
+class UserChangeForm(BaseUserChangeForm):
+    class Meta:
+        model = User
+        fields = '__all__'
+
+
+@admin.register(User)
+class UserAdmin(BaseUserAdmin):
+    """
+    User admin with estimated counts and exact-match search on indexed columns.
+    Passwords are set through Django's add and password-change forms, never edited as hashes.
+    """
+    form = UserChangeForm
+    add_form = UserCreationForm
+    fieldsets = (
+        (None, {'fields': ('email', 'password')}),
+        ('Personal info', {'fields': ('name',)}),
+        ('Permissions', {'fields': ('is_active', 'is_staff', 'is_superuser', 'groups', 'user_permissions')}),
+        ('Important dates', {'fields': ('last_login',)}),
+    )
+    add_fieldsets = (
+        (None, {
+            'classes': ('wide',),
+            'fields': ('email', 'name', 'usable_password', 'password1', 'password2'),
+        }),
+    )
+    list_display = ('id', 'email', 'name', 'is_staff', 'is_active')
+    list_filter = ('is_staff', 'is_superuser', 'is_active')
+    search_fields = ('id__exact', 'email__exact')
+    search_help_text = "Exact user id or email."
+    readonly_fields = ('last_login',)
+    ordering = ('-id',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def formfield_for_manytomany(self, db_field, request=None, **kwargs):
+        if db_field.name == 'user_permissions':
+            # Permission.__str__ reads its content type once per option otherwise.
+            kwargs['queryset'] = db_field.remote_field.model.objects.select_related('content_type')
+        return super().formfield_for_manytomany(db_field, request=request, **kwargs)
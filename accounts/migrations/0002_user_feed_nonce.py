@@ -0,0 +1,19 @@
+# Generated by Django 5.2.3 on 2026-10-19 01:37
+
+import accounts.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='feed_nonce',
+            field=models.CharField(default=accounts.models.generate_feed_nonce, editable=False, max_length=16),
+        ),
+    ]
@@ -1,7 +1,13 @@
+import secrets
+
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.db import models
 
 
+def generate_feed_nonce():
+    return secrets.token_hex(8)
+
+
 class UserManager(BaseUserManager):
     """
     Custom user manager for handling user creation using email instead of username.
@@ -39,12 +45,14 @@ class User(AbstractBaseUser, PermissionsMixin):
         name (str): User's full name.
         is_active (bool): Whether the user's account is active.
         is_staff (bool): Whether the user is a staff member.
+        feed_nonce (str): Carried by the user's calendar feed tokens; rotating it revokes them.
     """
     email = models.EmailField(unique=True)
     name = models.CharField(max_length=100)
 
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
+    feed_nonce = models.CharField(max_length=16, default=generate_feed_nonce, editable=False)
 
     objects = UserManager()
 
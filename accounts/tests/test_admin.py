@@ -0,0 +1,61 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import User
+from accounts.tests.factories import UserFactory
+
+
+class UserAdminQueryCountTests(TestCase):
+    """
+    Caps the number of queries of each User admin page.
+    """
+    MAX_QUERIES = 10
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = UserFactory()
+        cls.admin_user.is_staff = True
+        cls.admin_user.is_superuser = True
+        cls.admin_user.save()
+        cls.users = UserFactory.create_batch(10)
+
+    def setUp(self):
+        self.client.force_login(self.admin_user)
+
+    def assertPageQueriesCapped(self, url, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(queries), self.MAX_QUERIES, [q['sql'] for q in queries])
+        return response
+
+    def test_user_pages(self):
+        self.assertPageQueriesCapped(reverse('admin:accounts_user_changelist'))
+        self.assertPageQueriesCapped(reverse('admin:accounts_user_changelist'), {'q': self.users[0].email})
+        self.assertPageQueriesCapped(reverse('admin:accounts_user_add'))
+        self.assertPageQueriesCapped(reverse('admin:accounts_user_change', args=[self.users[0].pk]))
+        self.assertPageQueriesCapped(reverse('admin:auth_user_password_change', args=[self.users[0].pk]))
+
+    def test_add_user_sets_password_hash(self):
+        response = self.client.post(reverse('admin:accounts_user_add'), {
+            'email': 'new@example.com',
+            'name': 'New User',
+            'usable_password': 'true',
+            'password1': 'MyNewPass123',
+            'password2': 'MyNewPass123',
+        })
+        self.assertEqual(response.status_code, 302)
+        user = User.objects.get(email='new@example.com')
+        self.assertTrue(user.check_password('MyNewPass123'))
+
+    def test_change_password_through_admin_form(self):
+        user = self.users[0]
+        response = self.client.post(reverse('admin:auth_user_password_change', args=[user.pk]), {
+            'password1': 'AnotherPass456',
+            'password2': 'AnotherPass456',
+        })
+        self.assertEqual(response.status_code, 302)
+        user.refresh_from_db()
+        self.assertTrue(user.check_password('AnotherPass456'))
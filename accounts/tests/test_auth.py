@@ -112,3 +112,33 @@ class UserAuthTests(APITestCase):
         """
         response = self.client.post(self.logout_url, {"refresh": self.refresh_token})
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_register_user_replayed_with_idempotency_key(self):
+        """
+        Test that a retried registration with the same Idempotency-Key replays the first response.
+        """
+        data = {
+            "name": fake.name(),
+            "email": fake.unique.email(),
+            "password": "MyNewPass123"
+        }
+        first = self.client.post(self.register_url, data, HTTP_IDEMPOTENCY_KEY="signup-1")
+        second = self.client.post(self.register_url, data, HTTP_IDEMPOTENCY_KEY="signup-1")
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second["Idempotent-Replayed"], "true")
+        self.assertEqual(User.objects.filter(email=data["email"]).count(), 1)
+
+    def test_idempotency_keys_of_anonymous_clients_are_scoped_by_ip(self):
+        """
+        Test that two anonymous clients reusing the same Idempotency-Key do not see each other's requests.
+        """
+        for address in ("203.0.113.1", "203.0.113.2"):
+            data = {"name": fake.name(), "email": fake.unique.email(), "password": "MyNewPass123"}
+            response = self.client.post(
+                self.register_url, data, HTTP_IDEMPOTENCY_KEY="signup-1", REMOTE_ADDR=address
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertNotIn("Idempotent-Replayed", response)
+            self.assertTrue(User.objects.filter(email=data["email"]).exists())
@@ -0,0 +1,148 @@
+import time
+
+from rest_framework import status
+from rest_framework.test import APITestCase, APIRequestFactory
+from rest_framework.views import APIView
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+
+from accounts.tests.factories import UserFactory
+from event_management.utils.throttling import IPBucketThrottle, UserBucketThrottle
+from events.tests.factories import EventFactory
+
+
+def rest_framework_with_rates(**rates):
+    return override_settings(REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        'DEFAULT_THROTTLE_RATES': rates,
+    })
+
+
+class ThrottledView(APIView):
+    throttle_scope = 'bench'
+
+
+class BucketThrottleTests(APITestCase):
+    """
+    Test suite for the cache-backed bucket throttles.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    @rest_framework_with_rates(login_ip='3/min')
+    def test_login_throttled_with_retry_after(self):
+        url = reverse('login')
+        data = {"email": "nobody@example.com", "password": "wrong"}
+
+        for _ in range(3):
+            response = self.client.post(url, data)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(url, data)
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertGreater(int(response["Retry-After"]), 0)
+
+    @rest_framework_with_rates(signup_ip='1/hour')
+    def test_signup_throttled(self):
+        url = reverse('register')
+        response = self.client.post(url, {"name": "A", "email": "a@example.com", "password": "MyNewPass123"})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        response = self.client.post(url, {"name": "B", "email": "b@example.com", "password": "MyNewPass123"})
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    @rest_framework_with_rates(registration_event='2/min')
+    def test_registration_throttled_per_event(self):
+        event = EventFactory(max_capacity=10)
+        other_event = EventFactory(max_capacity=10)
+        self.client.force_authenticate(user=UserFactory())
+
+        for _ in range(2):
+            url = reverse('register_attendee-list', kwargs={'event_id': event.id})
+            self.client.post(url, {"user": UserFactory().id})
+
+        response = self.client.post(url, {"user": UserFactory().id})
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        url = reverse('register_attendee-list', kwargs={'event_id': other_event.id})
+        response = self.client.post(url, {"user": UserFactory().id})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def make_request(self, user, ip='127.0.0.1'):
+        request = APIRequestFactory().get('/', REMOTE_ADDR=ip)
+        request.user = user
+        return request
+
+    def check(self, throttles, request, view):
+        # Like `APIView.check_throttles`: every throttle is consulted.
+        return all([throttle.allow_request(request, view) for throttle in throttles])
+
+    @rest_framework_with_rates(bench_user='2/min')
+    def test_rejected_requests_do_not_consume_capacity(self):
+        user = UserFactory()
+        view = ThrottledView()
+        throttle = UserBucketThrottle()
+        throttle.timer = lambda: 1000.0
+
+        self.assertTrue(throttle.allow_request(self.make_request(user), view))
+        self.assertTrue(throttle.allow_request(self.make_request(user), view))
+        for _ in range(5):
+            self.assertFalse(throttle.allow_request(self.make_request(user), view))
+
+        # Two windows later the history has fully slid out.
+        throttle.timer = lambda: 1000.0 + 120
+        self.assertTrue(throttle.allow_request(self.make_request(user), view))
+
+    @rest_framework_with_rates(bench_user='3/min', bench_ip='1/min')
+    def test_requests_rejected_by_another_throttle_are_refunded(self):
+        user = UserFactory()
+        view = ThrottledView()
+        throttles = [UserBucketThrottle(), IPBucketThrottle()]
+        for throttle in throttles:
+            throttle.timer = lambda: 1000.0
+
+        self.assertTrue(self.check(throttles, self.make_request(user), view))
+        for _ in range(5):
+            self.assertFalse(self.check(throttles, self.make_request(user), view))
+
+        # Only the admitted request counted against the user, whichever throttle came first.
+        self.assertTrue(self.check(throttles, self.make_request(user, '10.0.0.1'), view))
+        self.assertTrue(self.check(throttles[::-1], self.make_request(user, '10.0.0.2'), view))
+        self.assertFalse(self.check(throttles, self.make_request(user, '10.0.0.3'), view))
+
+    @rest_framework_with_rates(bench_user='3/min', bench_ip='1/min')
+    def test_refund_of_an_evicted_counter(self):
+        user = UserFactory()
+        view = ThrottledView()
+        user_throttle, ip_throttle = UserBucketThrottle(), IPBucketThrottle()
+        for throttle in (user_throttle, ip_throttle):
+            throttle.timer = lambda: 1000.0
+        self.assertTrue(ip_throttle.allow_request(self.make_request(user), view))
+
+        request = self.make_request(user)
+        self.assertTrue(user_throttle.allow_request(request, view))
+        cache.delete(f'{user_throttle.key}:{int(1000.0 // 60)}')
+        # The counter is gone by the time the IP throttle rejects and refunds it.
+        self.assertFalse(ip_throttle.allow_request(request, view))
+
+    @rest_framework_with_rates(bench_ip='1000000/min')
+    def test_overhead_per_request(self):
+        """
+        The throttle must stay in the microsecond range per request on a local cache.
+        """
+        request = APIRequestFactory().get('/')
+        view = ThrottledView()
+        throttle = IPBucketThrottle()
+        iterations = 2000
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            throttle.allow_request(request, view)
+        per_request = (time.perf_counter() - started) / iterations
+
+        self.assertLess(per_request, 500e-6)
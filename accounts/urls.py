@@ -1,11 +1,14 @@
 from django.urls import path
 
 from accounts.views import RegisterView, MeView, LoginView, LogoutView
+from events.views import MyEventsView, MyConflictsView
 
 
 urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
     path('me/', MeView.as_view(), name='me'),
+    path('me/events/', MyEventsView.as_view(), name='me-events'),
+    path('me/conflicts/', MyConflictsView.as_view(), name='me-conflicts'),
     path('login/', LoginView.as_view(), name='login'),
     path('logout/', LogoutView.as_view(), name='logout'),
 ]
@@ -5,13 +5,18 @@ from rest_framework_simplejwt.tokens import RefreshToken, TokenError
 from rest_framework import status
 
 from accounts.serializers import RegisterSerializer, UserSerializer, LoginSerializer, LogoutSerializer
+from event_management.utils.idempotency import IdempotentCreateMixin
+from event_management.utils.throttling import IPBucketThrottle
 
 
-class RegisterView(generics.CreateAPIView):
+class RegisterView(IdempotentCreateMixin, generics.CreateAPIView):
     """
     Register a new user with name, email, and password.
+    Retries carrying the same `Idempotency-Key` header replay the first response.
     """
     serializer_class = RegisterSerializer
+    throttle_classes = [IPBucketThrottle]
+    throttle_scope = 'signup'
 
 
 class MeView(generics.RetrieveAPIView):
@@ -30,6 +35,8 @@ class LoginView(generics.GenericAPIView):
     Authenticate user and return JWT access and refresh tokens.
     """
     serializer_class = LoginSerializer
+    throttle_classes = [IPBucketThrottle]
+    throttle_scope = 'login'
 
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
@@ -3,6 +3,13 @@ ASGI config for event_management project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Run the project under an ASGI server (e.g. uvicorn or daphne) to serve the
+Server-Sent Events streams at ``/events/<id>/live/``: each open stream is a
+coroutine on the event loop rather than a worker thread.
+
+Set ``WARMUP_ON_STARTUP=True`` to preload URL resolvers, serializers and
+zoneinfo data when a worker boots instead of on its first requests.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -14,3 +21,9 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'event_management.settings')
 
 application = get_asgi_application()
+
+from django.conf import settings  # noqa: E402  (settings are configured by the application above)
+
+if settings.WARMUP_ON_STARTUP:
+    from event_management.utils.warmup import warm_up
+    warm_up()
@@ -46,6 +46,7 @@ INSTALLED_APPS = [
     'drf_spectacular',
     'events',
     'accounts',
+    'jobs',
 ]
 
 MIDDLEWARE = [
@@ -56,6 +57,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'event_management.utils.profiling.ProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'event_management.urls'
@@ -93,6 +95,14 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -142,6 +152,14 @@ REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
+    # Per-endpoint limits for event_management.utils.throttling, keyed `<throttle_scope>_<kind>`
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': env('THROTTLE_LOGIN_IP', default='30/min'),
+        'signup_ip': env('THROTTLE_SIGNUP_IP', default='20/hour'),
+        'registration_user': env('THROTTLE_REGISTRATION_USER', default='60/min'),
+        'registration_ip': env('THROTTLE_REGISTRATION_IP', default='120/min'),
+        'registration_event': env('THROTTLE_REGISTRATION_EVENT', default='600/min'),
+    },
 }
 
 
@@ -165,3 +183,93 @@ SIMPLE_JWT = {
 
 
 AUTH_USER_MODEL = 'accounts.User'
+
+
+# iCalendar feed of a user's events (/events/feed.ics)
+EVENTS_FEED_CACHE_TIMEOUT = env.int('EVENTS_FEED_CACHE_TIMEOUT', default=60 * 60)
+# Lifetime of feed subscription URLs in seconds (0: until revoked through POST /events/feed-url/)
+EVENTS_FEED_TOKEN_MAX_AGE = env.int('EVENTS_FEED_TOKEN_MAX_AGE', default=0) or None
+
+
+# Idempotency-Key support on create endpoints (event_management.utils.idempotency)
+IDEMPOTENCY_KEY_TIMEOUT = env.int('IDEMPOTENCY_KEY_TIMEOUT', default=60 * 60 * 24)
+IDEMPOTENCY_LOCK_TIMEOUT = env.int('IDEMPOTENCY_LOCK_TIMEOUT', default=30)
+IDEMPOTENCY_WAIT_TIMEOUT = env.int('IDEMPOTENCY_WAIT_TIMEOUT', default=10)
+
+
+# Per-event cache entries reused by /events/batch/ (set EVENTS_CACHE_ALIAS to '' to disable)
+EVENTS_CACHE_ALIAS = env('EVENTS_CACHE_ALIAS', default='default')
+EVENTS_CACHE_TIMEOUT = env.int('EVENTS_CACHE_TIMEOUT', default=60 * 5)
+EVENTS_BATCH_MAX_IDS = env.int('EVENTS_BATCH_MAX_IDS', default=100)
+
+
+# Admin changelists switch from COUNT(*) to planner estimates above this many rows (PostgreSQL only)
+ADMIN_ESTIMATED_COUNT_THRESHOLD = env.int('ADMIN_ESTIMATED_COUNT_THRESHOLD', default=100_000)
+
+
+# Incremental change feed (/events/changes/)
+EVENTS_CHANGES_PAGE_SIZE = env.int('EVENTS_CHANGES_PAGE_SIZE', default=100)
+EVENTS_CHANGES_MAX_PAGE_SIZE = env.int('EVENTS_CHANGES_MAX_PAGE_SIZE', default=1000)
+# Changes younger than this are held back so late-committing transactions are never skipped
+EVENTS_CHANGES_SETTLE_SECONDS = env.int('EVENTS_CHANGES_SETTLE_SECONDS', default=2)
+
+
+# Live capacity stream (/events/{id}/live/): seconds between keep-alive comments
+EVENTS_LIVE_HEARTBEAT_SECONDS = env.int('EVENTS_LIVE_HEARTBEAT_SECONDS', default=15)
+# Seconds a signed stream URL from /events/{id}/live-url/ can be used to connect
+EVENTS_LIVE_TOKEN_MAX_AGE = env.int('EVENTS_LIVE_TOKEN_MAX_AGE', default=300)
+
+
+# Opt-in request profiling for staff (?__profile=1 or X-Profile: 1, `inline` to return it in place)
+PROFILING_SAMPLE_RATE = env.float('PROFILING_SAMPLE_RATE', default=0.0)
+PROFILING_STORE_DIR = env('PROFILING_STORE_DIR', default=str(BASE_DIR / 'profiles'))
+PROFILING_STORE_MAX_FILES = env.int('PROFILING_STORE_MAX_FILES', default=200)
+PROFILING_TOP_FUNCTIONS = env.int('PROFILING_TOP_FUNCTIONS', default=40)
+
+
+# Prebuilt OpenAPI schema served at /api/schema/
+# (regenerate with `python manage.py spectacular --format openapi-json --file event_management/openapi.json`)
+OPENAPI_SCHEMA_FILE = env('OPENAPI_SCHEMA_FILE', default=str(BASE_DIR / 'event_management' / 'openapi.json'))
+# Run `manage.py warmup` in each WSGI/ASGI worker before it serves requests
+WARMUP_ON_STARTUP = env.bool('WARMUP_ON_STARTUP', default=False)
+
+
+# Reject registrations for an event overlapping ([start_time, end_time)) one the user already attends
+EVENTS_REJECT_OVERLAPPING_REGISTRATIONS = env.bool('EVENTS_REJECT_OVERLAPPING_REGISTRATIONS', default=False)
+
+
+# Largest schedule accepted by POST /events/bulk/ in one request
+EVENTS_BULK_MAX_ITEMS = env.int('EVENTS_BULK_MAX_ITEMS', default=500)
+
+
+# Database-backed background jobs (run workers with `python manage.py run_jobs`)
+JOBS_BATCH_SIZE = env.int('JOBS_BATCH_SIZE', default=20)
+JOBS_POLL_INTERVAL = env.float('JOBS_POLL_INTERVAL', default=1.0)
+JOBS_MAX_ATTEMPTS = env.int('JOBS_MAX_ATTEMPTS', default=5)
+JOBS_RETRY_BACKOFF_SECONDS = env.int('JOBS_RETRY_BACKOFF_SECONDS', default=10)
+JOBS_RETRY_BACKOFF_MAX_SECONDS = env.int('JOBS_RETRY_BACKOFF_MAX_SECONDS', default=60 * 60)
+# Running jobs claimed longer ago than this are assumed orphaned by a dead worker and requeued
+JOBS_LOCK_TIMEOUT = env.int('JOBS_LOCK_TIMEOUT', default=60 * 10)
+
+# Side effects of registrations and new events, delivered by the job queue
+EMAIL_BACKEND = env('EMAIL_BACKEND', default='django.core.mail.backends.console.EmailBackend')
+DEFAULT_FROM_EMAIL = env('DEFAULT_FROM_EMAIL', default='events@localhost')
+# POSTed a JSON body for `attendee.registered` and `event.created` (leave empty to disable)
+EVENTS_WEBHOOK_URL = env('EVENTS_WEBHOOK_URL', default='')
+EVENTS_WEBHOOK_TIMEOUT = env.int('EVENTS_WEBHOOK_TIMEOUT', default=10)
+
+
+# Single-flight cache fills (event detail, attendee pages): one request recomputes an entry
+# under a lock while the others wait up to CACHE_WAIT_TIMEOUT or get the copy kept for CACHE_STALE_SECONDS
+CACHE_LOCK_TIMEOUT = env.int('CACHE_LOCK_TIMEOUT', default=10)
+CACHE_WAIT_TIMEOUT = env.float('CACHE_WAIT_TIMEOUT', default=2.0)
+CACHE_STALE_SECONDS = env.int('CACHE_STALE_SECONDS', default=60)
+# Probabilistic early refresh ("XFetch"): higher values renew hot entries earlier (0 disables)
+CACHE_EARLY_REFRESH_BETA = env.float('CACHE_EARLY_REFRESH_BETA', default=1.0)
+EVENTS_ATTENDEES_CACHE_TIMEOUT = env.int('EVENTS_ATTENDEES_CACHE_TIMEOUT', default=60)
+
+
+# Calendar grid (/events/calendar/): events returned per day, and the largest range served at once
+EVENTS_CALENDAR_PER_DAY = env.int('EVENTS_CALENDAR_PER_DAY', default=3)
+EVENTS_CALENDAR_MAX_PER_DAY = env.int('EVENTS_CALENDAR_MAX_PER_DAY', default=20)
+EVENTS_CALENDAR_MAX_DAYS = env.int('EVENTS_CALENDAR_MAX_DAYS', default=62)
@@ -15,12 +15,13 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from rest_framework_simplejwt.views import TokenRefreshView
 
 from django.contrib import admin
 from django.urls import path, include
 
+from event_management.views import ProfileListView, ProfileDetailView, schema_view, swagger_ui_view
+
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -31,10 +32,17 @@ urlpatterns = [
     # Events app API endpoints
     path('events/', include('events.urls')),
 
+    # Background job queue metrics (staff only)
+    path('jobs/', include('jobs.urls')),
+
     # JWT token refresh endpoint
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
 
-    # API schema and Swagger UI docs
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
+    # API schema (prebuilt snapshot, see `manage.py spectacular`) and Swagger UI docs
+    path('api/schema/', schema_view, name='schema'),
+    path('api/docs/', swagger_ui_view, name='swagger-ui'),
+
+    # Stored request profiles (staff only)
+    path('api/profiles/', ProfileListView.as_view(), name='profile-list'),
+    path('api/profiles/<str:profile_id>/', ProfileDetailView.as_view(), name='profile-detail'),
 ]
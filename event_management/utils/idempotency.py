@@ -0,0 +1,108 @@
+import hashlib
+import json
+import time
+
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.crypto import salted_hmac
+
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+IN_FLIGHT = 'in_flight'
+COMPLETED = 'completed'
+
+
+class IdempotentCreateMixin:
+    """
+    Honors an `Idempotency-Key` header on `create()`.
+
+    The first request with a given key runs normally and its successful response is
+    stored in the cache for `IDEMPOTENCY_KEY_TIMEOUT` seconds; retries with the same
+    key and payload replay it without re-running validation or creating duplicates.
+    A retry that arrives while the first request is still running waits for its
+    result instead of executing again. Error responses are not stored, so a client
+    can correct the payload and retry with the same key.
+
+    Keys are scoped to the authenticated user (or, for anonymous clients, to the
+    client IP as DRF's throttles identify it) and to the request path. Payloads are
+    fingerprinted with an HMAC keyed on `SECRET_KEY`, so the secrets they may carry
+    (e.g. a sign-up password) cannot be recovered from the cache.
+    """
+    poll_interval = 0.05
+
+    def create(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return super().create(request, *args, **kwargs)
+        if len(key) > 255:
+            raise ValidationError({IDEMPOTENCY_HEADER: "Must be at most 255 characters."})
+
+        cache_key = self.get_idempotency_cache_key(request, key)
+        fingerprint = self.get_request_fingerprint(request)
+        deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_TIMEOUT
+
+        while True:
+            pending = {'state': IN_FLIGHT, 'fingerprint': fingerprint}
+            if cache.add(cache_key, pending, settings.IDEMPOTENCY_LOCK_TIMEOUT):
+                return self._create_and_store(cache_key, fingerprint, request, *args, **kwargs)
+
+            record = cache.get(cache_key)
+            if record is None:
+                # The first attempt failed and released the key: execute this one instead.
+                continue
+            if record['fingerprint'] != fingerprint:
+                return Response(
+                    {"detail": "Idempotency-Key was already used with a different request payload."},
+                    status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                )
+            if record['state'] == COMPLETED:
+                return self._replay(record)
+            if time.monotonic() >= deadline:
+                return Response(
+                    {"detail": "A request with this Idempotency-Key is still being processed."},
+                    status=status.HTTP_409_CONFLICT,
+                    headers={'Retry-After': '1'},
+                )
+            time.sleep(self.poll_interval)
+
+    def get_idempotency_cache_key(self, request, key):
+        user = request.user
+        if user and user.is_authenticated:
+            scope = user.pk
+        else:
+            scope = 'anonymous-' + hashlib.sha256(BaseThrottle().get_ident(request).encode()).hexdigest()[:32]
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return f'idempotency:{scope}:{request.method}:{request.path}:{digest}'
+
+    def get_request_fingerprint(self, request):
+        payload = json.dumps(request.data, sort_keys=True, default=str)
+        return salted_hmac('event_management.idempotency', payload, algorithm='sha256').hexdigest()
+
+    def _create_and_store(self, cache_key, fingerprint, request, *args, **kwargs):
+        try:
+            response = super().create(request, *args, **kwargs)
+        except Exception:
+            cache.delete(cache_key)
+            raise
+
+        if status.is_success(response.status_code):
+            cache.set(cache_key, {
+                'state': COMPLETED,
+                'fingerprint': fingerprint,
+                'status': response.status_code,
+                'data': response.data,
+                'headers': {name: value for name, value in response.items() if name == 'Location'},
+            }, settings.IDEMPOTENCY_KEY_TIMEOUT)
+        else:
+            cache.delete(cache_key)
+        return response
+
+    def _replay(self, record):
+        headers = {**record['headers'], REPLAYED_HEADER: 'true'}
+        return Response(record['data'], status=record['status'], headers=headers)
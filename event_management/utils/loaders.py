@@ -0,0 +1,180 @@
+from collections import defaultdict
+
+from rest_framework import serializers
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+
+
+class BatchLoader:
+    """
+    Request-scoped cache of model instances by primary key.
+
+    Related objects are fetched with one `in_bulk` query per model for a whole
+    set of instances, and memoized, so objects already loaded earlier in the
+    request (including the authenticated user) are never read twice.
+    """
+
+    def __init__(self):
+        self._objects = defaultdict(dict)
+
+    def prime(self, *instances):
+        """
+        Makes already loaded instances available to later lookups.
+        """
+        for instance in instances:
+            if instance is not None and instance.pk is not None:
+                self._objects[instance._meta.concrete_model][instance.pk] = instance
+
+    def load_many(self, model, pks):
+        """
+        Returns `{pk: instance}` for the given primary keys, querying only the ones not loaded yet.
+        """
+        model = model._meta.concrete_model
+        loaded = self._objects[model]
+        missing = {pk for pk in pks if pk is not None and pk not in loaded}
+        if missing:
+            loaded.update(model._default_manager.in_bulk(missing))
+        return {pk: loaded[pk] for pk in pks if pk in loaded}
+
+    def load(self, model, pk):
+        """
+        Returns a single instance, or None when it does not exist.
+        """
+        return self.load_many(model, [pk]).get(pk)
+
+    def load_related(self, instances, field_name):
+        """
+        Sets a forward foreign key of every instance from a single batched lookup.
+
+        Instances whose relation is already cached (e.g. by `select_related`) are left alone,
+        and so are those whose related row is missing: accessing the relation then raises
+        `DoesNotExist` as usual instead of returning a cached None.
+
+        Returns:
+            list: The related objects, one per instance that has one.
+        """
+        related = []
+        pending = []
+        for instance in instances:
+            field = instance._meta.get_field(field_name)
+            if field.is_cached(instance):
+                value = field.get_cached_value(instance)
+                if value is not None:
+                    related.append(value)
+                    self.prime(value)
+            else:
+                pending.append((instance, field))
+
+        by_model = defaultdict(set)
+        for instance, field in pending:
+            pk = getattr(instance, field.attname)
+            if pk is not None:
+                by_model[field.related_model].add(pk)
+        loaded = {model: self.load_many(model, pks) for model, pks in by_model.items()}
+
+        for instance, field in pending:
+            pk = getattr(instance, field.attname)
+            if pk is None:
+                field.set_cached_value(instance, None)
+                continue
+            value = loaded[field.related_model].get(pk)
+            if value is not None:
+                field.set_cached_value(instance, value)
+                related.append(value)
+        return related
+
+
+def get_loader(request):
+    """
+    Returns the batch loader of a request, creating it (primed with the user) on first use.
+
+    The loader lives on the underlying Django request, so it is shared by every
+    serializer of the response and discarded with the request. Without a request
+    a fresh loader is returned, which still batches within one serializer call.
+    """
+    if request is None:
+        return BatchLoader()
+
+    http_request = getattr(request, '_request', request)
+    loader = getattr(http_request, 'batch_loader', None)
+    if loader is None:
+        loader = http_request.batch_loader = BatchLoader()
+        user = getattr(request, 'user', None)
+        if isinstance(user, models.Model):
+            loader.prime(user)
+    return loader
+
+
+def _is_forward_relation(instance, name):
+    if not isinstance(instance, models.Model):
+        return False
+    try:
+        field = instance._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return field.is_relation and field.concrete and (field.many_to_one or field.one_to_one)
+
+
+def load_nested(serializer, instances, loader):
+    """
+    Loads what the nested serializer fields of `serializer` will read from `instances`.
+
+    Nested serializers on a foreign key are batched through `loader`; nested
+    serializers on plain attributes or lists (e.g. `{"event": Event}` payloads)
+    are followed to their values. The walk recurses into every nesting level, so
+    a page costs one query per relation type however many rows it has.
+    """
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    instances = [instance for instance in instances if instance is not None]
+    if not instances or not hasattr(serializer, 'fields'):
+        return
+
+    for field in serializer.fields.values():
+        if not isinstance(field, serializers.BaseSerializer) or field.write_only or field.source == '*':
+            continue
+
+        if len(field.source_attrs) == 1 and _is_forward_relation(instances[0], field.source):
+            values = loader.load_related(instances, field.source)
+        else:
+            values = []
+            for instance in instances:
+                try:
+                    value = field.get_attribute(instance)
+                except (AttributeError, KeyError, serializers.SkipField):
+                    continue
+                if isinstance(value, models.Manager):
+                    # Reverse relations are not batched here: reading them would query per row.
+                    continue
+                if isinstance(field, serializers.ListSerializer):
+                    values.extend(value or [])
+                elif value is not None:
+                    values.append(value)
+        load_nested(field, values, loader)
+
+
+class BatchLoadingListSerializer(serializers.ListSerializer):
+    """
+    Loads the nested relations of the whole list in one pass before serializing its items.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        if self.parent is None:
+            load_nested(self, items, get_loader(self.context.get('request')))
+        return super().to_representation(items)
+
+
+class BatchLoadingSerializerMixin:
+    """
+    Serializer mixin routing nested relations through the request's `BatchLoader`.
+
+    Pair it with `Meta.list_serializer_class = BatchLoadingListSerializer` (or a
+    subclass), so lists are loaded as a whole rather than item by item.
+    """
+
+    def to_representation(self, instance):
+        if self.root is self:
+            load_nested(self, [instance], get_loader(self.context.get('request')))
+        return super().to_representation(instance)
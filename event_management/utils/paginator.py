@@ -0,0 +1,42 @@
+import json
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that replaces `COUNT(*)` with the planner's row estimate on large PostgreSQL tables.
+
+    An unfiltered queryset uses the table statistics in `pg_class.reltuples`; a filtered
+    one uses the row estimate of its query plan. Whenever the estimate is below
+    `ADMIN_ESTIMATED_COUNT_THRESHOLD`, or on other database backends, the exact count is used.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return super().count
+
+        if not queryset.query.where:
+            estimate = self._table_estimate(connection, queryset.model._meta.db_table)
+        else:
+            estimate = self._plan_estimate(queryset)
+
+        if estimate is None or estimate < settings.ADMIN_ESTIMATED_COUNT_THRESHOLD:
+            return super().count
+        return estimate
+
+    def _table_estimate(self, connection, table):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table])
+            row = cursor.fetchone()
+        return row[0] if row and row[0] >= 0 else None
+
+    def _plan_estimate(self, queryset):
+        plan = json.loads(queryset.order_by().explain(format='json'))
+        return int(plan[0]['Plan']['Plan Rows'])
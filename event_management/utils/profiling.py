@@ -0,0 +1,232 @@
+import cProfile
+import hashlib
+import io
+import json
+import pstats
+import random
+import re
+import secrets
+import time
+import uuid
+from collections import Counter
+from contextlib import ExitStack
+from pathlib import Path
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, markcoroutinefunction, sync_to_async
+from rest_framework import exceptions
+from rest_framework.serializers import BaseSerializer
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from django.conf import settings
+from django.db import connections
+from django.http import JsonResponse
+from django.utils import timezone
+
+
+PROFILE_QUERY_PARAM = '__profile'
+PROFILE_HEADER = 'X-Profile'
+PROFILE_ID_HEADER = 'X-Profile-Id'
+PROFILE_ID_PATTERN = re.compile(r'^[0-9A-Za-z-]+$')
+
+# Entry points whose cumulative time is "serializer time"; nested calls are folded in by cProfile.
+SERIALIZER_FUNCTIONS = [BaseSerializer.data.fget.__code__, BaseSerializer.is_valid.__code__]
+
+
+class ProfilingMiddleware:
+    """
+    Opt-in per-request profiling for staff.
+
+    A staff user (session or JWT) triggers it with `?__profile=1` or an
+    `X-Profile: 1` header; `inline` instead of `1` returns the profile in place of
+    the response body. `PROFILING_SAMPLE_RATE` additionally profiles that fraction
+    of all requests into the store. A profile holds a cProfile summary, every SQL
+    statement with its timing and duplicates, and serializer time split from view time.
+    Query parameters and query strings are never stored, as sampled requests may
+    carry passwords, emails or feed tokens.
+
+    Requests that do not ask for a profile only pay for a substring check and,
+    when sampling is enabled, one random draw. Under ASGI they stay asynchronous,
+    so long-lived streams (e.g. `event_live_view`) do not hold a thread; only a
+    profiled request runs the rest of the stack in one.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        mode = self.get_requested_mode(request)
+        if mode is None:
+            return self.get_response(request)
+        return self.handle(request, mode, self.get_response)
+
+    async def __acall__(self, request):
+        mode = self.get_requested_mode(request)
+        if mode is None:
+            return await self.get_response(request)
+        # cProfile and the query wrappers are synchronous: profile the request from a thread.
+        return await sync_to_async(self.handle)(request, mode, async_to_sync(self.get_response))
+
+    def handle(self, request, mode, get_response):
+        if mode != 'sampled' and not self.is_staff(request):
+            return get_response(request)
+
+        response, profile = self.profile(request, get_response)
+        if mode == 'inline':
+            return JsonResponse(profile)
+
+        response[PROFILE_ID_HEADER] = save_profile(profile)
+        return response
+
+    def get_requested_mode(self, request):
+        requested = request.headers.get(PROFILE_HEADER)
+        if PROFILE_QUERY_PARAM in request.META.get('QUERY_STRING', ''):
+            requested = request.GET.get(PROFILE_QUERY_PARAM) or requested
+        if requested:
+            return 'inline' if requested == 'inline' else 'stored'
+
+        sample_rate = settings.PROFILING_SAMPLE_RATE
+        if sample_rate and random.random() < sample_rate:
+            return 'sampled'
+        return None
+
+    def is_staff(self, request):
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            try:
+                result = JWTAuthentication().authenticate(request)
+            except exceptions.AuthenticationFailed:
+                return False
+            user = result[0] if result else None
+        return bool(user and user.is_staff)
+
+    def profile(self, request, get_response):
+        queries = []
+        # Identical queries are told apart by a keyed digest of their parameters, never by the values.
+        key = secrets.token_bytes(16)
+
+        def record_query(execute, sql, params, many, context):
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                queries.append({
+                    "sql": sql,
+                    "param_count": len(params) if params else 0,
+                    "params_digest": hashlib.blake2b(repr(params).encode(), key=key, digest_size=8).hexdigest(),
+                    "duration_ms": (time.perf_counter() - started) * 1000,
+                    "alias": context['connection'].alias,
+                })
+
+        profiler = cProfile.Profile()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(record_query))
+            started = time.perf_counter()
+            try:
+                profiler.enable()
+            except ValueError:
+                # Another request in this interpreter is already being profiled (Python 3.12+).
+                profiler = None
+            try:
+                response = get_response(request)
+            finally:
+                if profiler:
+                    profiler.disable()
+            total_ms = (time.perf_counter() - started) * 1000
+
+        return response, build_profile(request, response, profiler, queries, total_ms)
+
+
+def build_profile(request, response, profiler, queries, total_ms):
+    stream = io.StringIO()
+    serializer_ms = 0.0
+    if profiler:
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.sort_stats('cumulative').print_stats(settings.PROFILING_TOP_FUNCTIONS)
+        for code in SERIALIZER_FUNCTIONS:
+            entry = stats.stats.get((code.co_filename, code.co_firstlineno, code.co_name))
+            if entry:
+                serializer_ms += entry[3] * 1000
+
+    templates = Counter(query['sql'] for query in queries)
+    identical = Counter((query['sql'], query.pop('params_digest')) for query in queries)
+    duplicates = [
+        {
+            "sql": sql,
+            "count": count,
+            "identical": sum(n for (s, _), n in identical.items() if s == sql and n > 1),
+        }
+        for sql, count in templates.most_common()
+        if count > 1
+    ]
+
+    return {
+        "id": f"{timezone.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}",
+        "created_at": timezone.now().isoformat(),
+        "method": request.method,
+        "path": request.path,
+        "status": response.status_code,
+        "timings": {
+            "total_ms": total_ms,
+            "sql_ms": sum(query['duration_ms'] for query in queries),
+            "serializer_ms": serializer_ms,
+            "view_ms": max(total_ms - serializer_ms, 0.0),
+        },
+        "sql": {
+            "count": len(queries),
+            "duplicates": duplicates,
+            "queries": queries,
+        },
+        "cprofile": stream.getvalue(),
+    }
+
+
+def get_store_dir():
+    return Path(settings.PROFILING_STORE_DIR)
+
+
+def save_profile(profile):
+    """
+    Writes a profile to the local store, pruning the oldest beyond `PROFILING_STORE_MAX_FILES`.
+    """
+    store = get_store_dir()
+    store.mkdir(parents=True, exist_ok=True)
+    (store / f"{profile['id']}.json").write_text(json.dumps(profile, default=str))
+
+    stored = sorted(store.glob('*.json'))
+    for path in stored[:max(len(stored) - settings.PROFILING_STORE_MAX_FILES, 0)]:
+        path.unlink(missing_ok=True)
+    return profile['id']
+
+
+def list_profiles():
+    """
+    Returns summaries of the stored profiles, newest first.
+    """
+    summaries = []
+    for path in sorted(get_store_dir().glob('*.json'), reverse=True):
+        profile = json.loads(path.read_text())
+        summaries.append({
+            key: profile[key] for key in ('id', 'created_at', 'method', 'path', 'status')
+        } | {"total_ms": profile['timings']['total_ms'], "sql_count": profile['sql']['count']})
+    return summaries
+
+
+def load_profile(profile_id):
+    """
+    Returns a stored profile, or None if the id is unknown or malformed.
+    """
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    path = get_store_dir() / f"{profile_id}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
@@ -0,0 +1,48 @@
+import hashlib
+import json
+from pathlib import Path
+
+from django.conf import settings
+
+
+_snapshot = {}
+
+
+def _entry(body):
+    return body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def get_schema_snapshot(fmt='yaml'):
+    """
+    Returns `(body, etag)` of the prebuilt OpenAPI schema, or None if no snapshot was built.
+
+    The snapshot is stored as JSON; the YAML document (drf-spectacular's default
+    format) is rendered from it on first request. Both are rebuilt once per
+    modification of the file, so serving them costs a `stat` and the ETags are
+    stable across workers and restarts.
+    """
+    path = Path(settings.OPENAPI_SCHEMA_FILE)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    if _snapshot.get('key') != (path, mtime):
+        _snapshot.clear()
+        _snapshot.update(key=(path, mtime), json=_entry(path.read_bytes()))
+    if fmt not in _snapshot:
+        from drf_spectacular.renderers import OpenApiYamlRenderer
+        _snapshot[fmt] = _entry(OpenApiYamlRenderer().render(json.loads(_snapshot['json'][0])))
+    return _snapshot[fmt]
+
+
+def generate_schema():
+    """
+    Generates the OpenAPI schema from the views, as the JSON document stored in the snapshot.
+    """
+    # Imported here so workers serving the snapshot never load the generator.
+    from drf_spectacular.renderers import OpenApiJsonRenderer
+    from drf_spectacular.settings import spectacular_settings
+
+    schema = spectacular_settings.DEFAULT_GENERATOR_CLASS().get_schema(request=None, public=True)
+    return json.loads(OpenApiJsonRenderer().render(schema))
@@ -0,0 +1,67 @@
+import math
+import random
+import time
+
+from django.conf import settings
+
+
+def make_entry(value, timeout, compute_time=0.0):
+    """
+    Wraps a value with its soft expiry and the time it took to compute, as stored by `get_or_compute`.
+    """
+    return {'value': value, 'expires_at': time.time() + timeout, 'compute_time': compute_time}
+
+
+def is_fresh(entry):
+    """
+    Tells whether a cache entry can be served as is.
+
+    Entries stop being fresh at their soft expiry, and - probabilistic early
+    expiration ("XFetch") - increasingly likely shortly before it, in proportion to
+    how long they take to recompute and `CACHE_EARLY_REFRESH_BETA`. A hot key is
+    therefore renewed by a single request before it expires, not by all of them at once.
+    """
+    jitter = entry['compute_time'] * settings.CACHE_EARLY_REFRESH_BETA * -math.log(1.0 - random.random())
+    return time.time() + jitter < entry['expires_at']
+
+
+def get_or_compute(cache, key, compute, timeout):
+    """
+    Returns the cached value of `key`, computing it at most once at a time across workers.
+
+    When the entry is missing or due for refresh, the request that wins a short
+    cache lock (`cache.add`) recomputes it. The others serve the stale value if
+    there is one, or wait for the winner's result; if the winner takes longer than
+    `CACHE_WAIT_TIMEOUT` seconds they compute it themselves rather than fail.
+    Entries outlive their `timeout` by `CACHE_STALE_SECONDS`, so a stale copy is
+    usually available while the refresh runs.
+
+    Exceptions raised by `compute` (e.g. `Http404`) propagate and nothing is cached.
+    """
+    entry = cache.get(key)
+    if entry is not None and is_fresh(entry):
+        return entry['value']
+
+    lock_key = f'{key}:lock'
+    deadline = time.monotonic() + settings.CACHE_WAIT_TIMEOUT
+    while True:
+        if cache.add(lock_key, True, settings.CACHE_LOCK_TIMEOUT):
+            try:
+                started = time.perf_counter()
+                value = compute()
+                entry = make_entry(value, timeout, time.perf_counter() - started)
+                cache.set(key, entry, timeout + settings.CACHE_STALE_SECONDS)
+            finally:
+                cache.delete(lock_key)
+            return value
+
+        if entry is not None:
+            # Another request is refreshing: serve the stale copy meanwhile.
+            return entry['value']
+        if time.monotonic() >= deadline:
+            return compute()
+
+        time.sleep(0.05)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry['value']
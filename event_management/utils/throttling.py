@@ -0,0 +1,142 @@
+from rest_framework.settings import api_settings
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class BucketRateThrottle(SimpleRateThrottle):
+    """
+    Rate limiter backed by the shared Django cache using only atomic operations.
+
+    The bucket is approximated by a sliding window over two fixed-window counters:
+    each request atomically increments the current window, and the previous window
+    is weighted by how much of it still overlaps the sliding window. Unlike DRF's
+    built-in throttles, which read-modify-write a list of timestamps, this keeps one
+    integer per window and is safe under concurrency on memcached or Redis.
+
+    Rates are configured per endpoint in `REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']`
+    under `<view.throttle_scope>_<kind>` (e.g. `registration_user`). A missing rate
+    disables that throttle for the view.
+
+    A request only counts against a view's bucket throttles if all of them allow it:
+    DRF checks every throttle, so the throttles record their increments on the request
+    and the first rejection refunds the ones already counted (and any counted after it).
+    """
+    kind = None
+
+    def __init__(self):
+        # The rate depends on the view, so it is resolved in allow_request().
+        self.wait_seconds = None
+
+    def get_rate(self):
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def get_ident_key(self, request, view):
+        """
+        Returns the value identifying the client, or None to skip throttling.
+        """
+        raise NotImplementedError('.get_ident_key() must be overridden')
+
+    def get_cache_key(self, request, view):
+        ident = self.get_ident_key(request, view)
+        if ident is None:
+            return None
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+    def allow_request(self, request, view):
+        throttle_scope = getattr(view, 'throttle_scope', None)
+        if not throttle_scope:
+            return True
+
+        self.scope = f'{throttle_scope}_{self.kind}'
+        self.rate = self.get_rate()
+        if self.rate is None:
+            return True
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        now = self.timer()
+        window, offset = divmod(now, self.duration)
+        elapsed = offset / self.duration
+        current_key = f'{self.key}:{int(window)}'
+
+        self.cache.add(current_key, 0, self.duration * 2)
+        try:
+            current = self.cache.incr(current_key)
+        except ValueError:
+            # Evicted between add() and incr(): start the window over.
+            self.cache.set(current_key, 1, self.duration * 2)
+            current = 1
+        previous = self.cache.get(f'{self.key}:{int(window) - 1}', 0)
+
+        # Keys counted for this request, or None once a throttle has rejected it.
+        charges = request.__dict__.setdefault('_bucket_throttle_charges', [])
+        if previous * (1 - elapsed) + current <= self.num_requests:
+            if charges is None:
+                self._refund(current_key)
+            else:
+                charges.append(current_key)
+            return True
+
+        # Rejected requests must not consume capacity, or retry loops never recover.
+        for key in [current_key, *(charges or ())]:
+            self._refund(key)
+        request.__dict__['_bucket_throttle_charges'] = None
+        self.wait_seconds = self._compute_wait(previous, current - 1, elapsed)
+        return False
+
+    def _refund(self, key):
+        try:
+            self.cache.decr(key)
+        except ValueError:
+            # Evicted since it was counted: there is nothing left to refund.
+            pass
+
+    def _compute_wait(self, previous, current, elapsed):
+        """
+        Returns the seconds until one more request would fit in the window.
+        """
+        if current < self.num_requests and previous:
+            # Fits later in this window, once enough of the previous one has slid out.
+            needed = 1 - (self.num_requests - current - 1) / previous
+            return max(needed - elapsed, 0) * self.duration
+
+        # Wait for the next window, where the current count becomes the previous one.
+        needed = 1 - (self.num_requests - 1) / current if current else 0
+        return (1 - elapsed + max(needed, 0)) * self.duration
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class UserBucketThrottle(BucketRateThrottle):
+    """
+    Limits each authenticated user, falling back to the client IP for anonymous requests.
+    """
+    kind = 'user'
+
+    def get_ident_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return request.user.pk
+        return self.get_ident(request)
+
+
+class IPBucketThrottle(BucketRateThrottle):
+    """
+    Limits each client IP address.
+    """
+    kind = 'ip'
+
+    def get_ident_key(self, request, view):
+        return self.get_ident(request)
+
+
+class EventBucketThrottle(BucketRateThrottle):
+    """
+    Limits the total request rate against a single event, across all clients.
+    """
+    kind = 'event'
+
+    def get_ident_key(self, request, view):
+        return view.kwargs.get('event_id')
@@ -0,0 +1,79 @@
+import time
+import zoneinfo
+
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from event_management.utils.schema import get_schema_snapshot
+
+
+# Keeps loaded zones referenced so ZoneInfo's weak cache does not drop them.
+_zones = {}
+
+
+def iter_view_classes(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_view_classes(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            view_class = getattr(pattern.callback, 'cls', None) or getattr(pattern.callback, 'view_class', None)
+            if view_class is not None:
+                yield view_class
+
+
+def warm_up_urls():
+    resolver = get_resolver()
+    resolver.reverse_dict  # Populates the lookup tables of every included URLconf
+    return len(resolver.reverse_dict)
+
+
+def warm_up_serializers():
+    """
+    Builds the fields of every serializer attached to a routed view, which imports
+    their modules and fills Django's model and related-field caches.
+    """
+    serializer_classes = {
+        view_class.serializer_class
+        for view_class in iter_view_classes(get_resolver().url_patterns)
+        if getattr(view_class, 'serializer_class', None) is not None
+    }
+    for serializer_class in serializer_classes:
+        serializer_class(context={}).fields
+    return len(serializer_classes)
+
+
+def warm_up_timezones():
+    for key in zoneinfo.available_timezones():
+        if key not in _zones:
+            try:
+                _zones[key] = zoneinfo.ZoneInfo(key)
+            except (ValueError, OSError):
+                continue
+    return len(_zones)
+
+
+def warm_up_schema():
+    return 1 if get_schema_snapshot() else 0
+
+
+STEPS = {
+    "urls": warm_up_urls,
+    "serializers": warm_up_serializers,
+    "timezones": warm_up_timezones,
+    "schema": warm_up_schema,
+}
+
+
+def warm_up():
+    """
+    Loads what a worker would otherwise load lazily on its first requests: URL
+    resolvers, serializers, zoneinfo data and the OpenAPI snapshot.
+
+    Returns:
+        dict: For each step, the number of items loaded and the seconds it took.
+    """
+    results = {}
+    for name, step in STEPS.items():
+        started = time.perf_counter()
+        count = step()
+        results[name] = (count, time.perf_counter() - started)
+    return results
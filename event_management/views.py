@@ -0,0 +1,91 @@
+from rest_framework import generics
+from rest_framework.exceptions import NotFound
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+
+from django.http import HttpResponse
+from django.views.decorators.http import condition, require_GET
+
+from event_management.utils.profiling import list_profiles, load_profile
+from event_management.utils.schema import get_schema_snapshot
+
+
+SCHEMA_CONTENT_TYPES = {
+    'yaml': 'application/vnd.oai.openapi',
+    'json': 'application/vnd.oai.openapi+json',
+}
+
+
+def _schema_format(request):
+    return 'json' if request.GET.get('format') == 'json' else 'yaml'
+
+
+def _schema_etag(request, *args, **kwargs):
+    snapshot = get_schema_snapshot(_schema_format(request))
+    return snapshot[1] if snapshot else None
+
+
+@require_GET
+@condition(etag_func=_schema_etag)
+def schema_view(request, *args, **kwargs):
+    """
+    Serves the prebuilt OpenAPI schema (`OPENAPI_SCHEMA_FILE`) with an ETag, so
+    Swagger UI reloads are answered with a 304. Like drf-spectacular's view, the
+    schema is YAML unless `?format=json` is given.
+
+    Without a snapshot (e.g. during development) the schema is generated per
+    request by drf-spectacular.
+    """
+    fmt = _schema_format(request)
+    snapshot = get_schema_snapshot(fmt)
+    if snapshot is None:
+        from drf_spectacular.views import SpectacularAPIView
+        return SpectacularAPIView.as_view()(request, *args, **kwargs)
+
+    response = HttpResponse(snapshot[0], content_type=SCHEMA_CONTENT_TYPES[fmt])
+    response['Cache-Control'] = 'public, no-cache'
+    return response
+
+
+def swagger_ui_view(request, *args, **kwargs):
+    """
+    Swagger UI for `schema_view`; drf-spectacular's views are only imported on first use.
+    """
+    from drf_spectacular.views import SpectacularSwaggerView
+    return SpectacularSwaggerView.as_view(url_name='schema')(request, *args, **kwargs)
+
+
+@extend_schema(
+    tags=["Profiling"],
+    description="Staff only. Lists stored request profiles, newest first.",
+    responses={200: OpenApiResponse(description='List of profile summaries')},
+)
+class ProfileListView(generics.GenericAPIView):
+    """
+    Browse the local profile store written by `ProfilingMiddleware`.
+    """
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(operation_id="api_profiles_list")
+    def get(self, request):
+        return Response(list_profiles())
+
+
+@extend_schema(
+    tags=["Profiling"],
+    description="Staff only. Returns a stored request profile.",
+    responses={200: OpenApiResponse(description='Profile with timings, SQL and cProfile output')},
+)
+class ProfileDetailView(generics.GenericAPIView):
+    """
+    Retrieve one profile from the local profile store.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, profile_id):
+        profile = load_profile(profile_id)
+        if profile is None:
+            raise NotFound("Profile not found.")
+        return Response(profile)
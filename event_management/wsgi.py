@@ -3,6 +3,9 @@ WSGI config for event_management project.
 
 It exposes the WSGI callable as a module-level variable named ``application``.
 
+Set ``WARMUP_ON_STARTUP=True`` to preload URL resolvers, serializers and
+zoneinfo data when a worker boots instead of on its first requests.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/wsgi/
 """
@@ -14,3 +17,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'event_management.settings')
 
 application = get_wsgi_application()
+
+from django.conf import settings  # noqa: E402  (settings are configured by the application above)
+
+if settings.WARMUP_ON_STARTUP:
+    from event_management.utils.warmup import warm_up
+    warm_up()
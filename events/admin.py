@@ -1,7 +1,54 @@
 from django.contrib import admin
 
-from events.models import Event, Attendee
+from event_management.utils.paginator import EstimatedCountPaginator
+from events.models import Event, Attendee, CancelledOccurrence
 
 
-admin.site.register(Event)
-admin.site.register(Attendee)
+@admin.register(Event)
+class EventAdmin(admin.ModelAdmin):
+    """
+    Event admin that stays fast on large tables: estimated counts, no creator
+    dropdown, and search/filter fields that are served by indexes.
+    """
+    list_display = ('id', 'name', 'creator', 'start_time', 'end_time', 'max_capacity')
+    list_select_related = ('creator',)
+    list_filter = ('start_time',)
+    search_fields = ('id__exact', 'creator__email__exact')
+    search_help_text = "Exact event id or creator email."
+    raw_id_fields = ('creator', 'series')
+    ordering = ('-id',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(Attendee)
+class AttendeeAdmin(admin.ModelAdmin):
+    """
+    Attendee admin with related rows joined into the changelist query and raw-id
+    widgets instead of full user/event dropdowns.
+    """
+    list_display = ('id', 'user', 'event', 'created_at')
+    list_select_related = ('user', 'event')
+    search_fields = ('event__id__exact', 'user__email__exact')
+    search_help_text = "Exact event id or attendee email."
+    raw_id_fields = ('event', 'user')
+    ordering = ('-id',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        # The change form header renders Attendee.__str__, which reads both relations.
+        return super().get_queryset(request).select_related('user', 'event')
+
+
+@admin.register(CancelledOccurrence)
+class CancelledOccurrenceAdmin(admin.ModelAdmin):
+    """
+    Cancelled occurrences of recurring events, with a raw-id widget for the series.
+    """
+    list_display = ('id', 'series', 'occurrence_start')
+    list_select_related = ('series',)
+    search_fields = ('series__id__exact',)
+    search_help_text = "Exact series id."
+    raw_id_fields = ('series',)
+    ordering = ('-id',)
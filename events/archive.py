@@ -0,0 +1,105 @@
+from django.db import connection, transaction
+from django.utils import timezone
+
+from events.cache import invalidate_events
+from events.changes import restamp_changes
+from events.feeds import invalidate_feeds
+from events.models import Event, Attendee, ArchivedEvent, ArchivedAttendee, EventTombstone
+
+
+def events_with_archive():
+    """
+    Returns hot and archived events as a single queryset of `Event` instances.
+
+    `ArchivedEvent` mirrors the columns of `Event` in the same order, so the two
+    tables combine with a UNION ALL once the archive-only `archived_at` column is deferred.
+    Creators are batch-loaded by the serializer (see `event_management.utils.loaders`).
+    """
+    return Event.objects.union(ArchivedEvent.objects.defer('archived_at'), all=True)
+
+
+def _copy_rows(source, target, filter_column, ids, archived_at=None):
+    """
+    Copies rows from one table into its archive twin with INSERT ... SELECT,
+    preserving primary keys and timestamps (which `bulk_create` would overwrite).
+    """
+    quote = connection.ops.quote_name
+    columns = [field.column for field in source._meta.concrete_fields]
+    target_columns = list(columns)
+    select = [quote(column) for column in columns]
+    params = []
+
+    if archived_at is not None:
+        target_columns.append('archived_at')
+        select.append('%s')
+        params.append(archived_at)
+
+    placeholders = ', '.join(['%s'] * len(ids))
+    sql = (
+        f"INSERT INTO {quote(target._meta.db_table)} ({', '.join(quote(c) for c in target_columns)}) "
+        f"SELECT {', '.join(select)} FROM {quote(source._meta.db_table)} "
+        f"WHERE {quote(filter_column)} IN ({placeholders})"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params + list(ids))
+
+
+def _delete_rows(model, column, ids):
+    """
+    Deletes rows with a plain DELETE: no per-row signals, and no ORM cascade to
+    rows that stay behind (`RegistrationStat` buckets are kept for the archive).
+    """
+    quote = connection.ops.quote_name
+    placeholders = ', '.join(['%s'] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {quote(model._meta.db_table)} WHERE {quote(column)} IN ({placeholders})", list(ids)
+        )
+        return cursor.rowcount
+
+
+def archive_batch(cutoff, batch_size):
+    """
+    Moves up to `batch_size` events that ended before `cutoff`, plus their
+    attendees, into the archive tables in one transaction.
+
+    Rows are moved and deleted with set-based SQL; what the delete signals would
+    do per row (tombstones, cache and feed invalidation) is done once per batch.
+    Registration stats stay in place and keep serving `/events/{id}/stats/`.
+
+    Returns:
+        tuple: Number of (events, attendees) archived; (0, 0) when nothing is left.
+    """
+    with transaction.atomic():
+        ids = list(
+            Event.objects
+            # A series row is the template of its future occurrences, so it stays hot.
+            .filter(end_time__lt=cutoff, recurrence='')
+            .order_by('end_time', 'id')
+            .select_for_update(skip_locked=True)
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return 0, 0
+
+        user_ids = {
+            *Event.objects.filter(id__in=ids).values_list('creator_id', flat=True),
+            *Attendee.objects.filter(event_id__in=ids).values_list('user_id', flat=True),
+        }
+        now = timezone.now()
+        _copy_rows(Event, ArchivedEvent, 'id', ids, archived_at=now)
+        _copy_rows(Attendee, ArchivedAttendee, 'event_id', ids)
+
+        attendees = _delete_rows(Attendee, 'event_id', ids)
+        _delete_rows(Event, 'id', ids)
+        EventTombstone.objects.bulk_create(
+            [EventTombstone(event_id=event_id, deleted_at=now) for event_id in ids],
+            update_conflicts=True,
+            unique_fields=['event_id'],
+            update_fields=['deleted_at'],
+        )
+        transaction.on_commit(lambda: restamp_changes(deleted_event_ids=ids))
+
+    invalidate_events(ids)
+    invalidate_feeds(user_ids)
+    return len(ids), attendees
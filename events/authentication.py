@@ -0,0 +1,46 @@
+from rest_framework import authentication, exceptions
+
+from drf_spectacular.extensions import OpenApiAuthenticationExtension
+
+from django.core import signing
+
+from accounts.models import User
+from events.feeds import read_feed_token
+
+
+class FeedTokenAuthentication(authentication.BaseAuthentication):
+    """
+    Authenticates calendar apps through a signed `?token=` query parameter.
+
+    Calendar clients cannot send bearer tokens, so the feed URL itself carries
+    the credential. Tokens are issued by `EventViewSet.feed_url` and are only
+    valid while the user's `feed_nonce` is the one they were issued with.
+    """
+
+    def authenticate(self, request):
+        token = request.query_params.get('token')
+        if not token:
+            return None
+
+        try:
+            user_id, nonce = read_feed_token(token)
+        except signing.BadSignature as e:
+            raise exceptions.AuthenticationFailed("Invalid feed token.") from e
+
+        try:
+            user = User.objects.get(pk=user_id, feed_nonce=nonce, is_active=True)
+        except User.DoesNotExist as e:
+            raise exceptions.AuthenticationFailed("Invalid feed token.") from e
+
+        return user, None
+
+
+class FeedTokenScheme(OpenApiAuthenticationExtension):
+    """
+    Documents `FeedTokenAuthentication` as an API key passed in the query string.
+    """
+    target_class = FeedTokenAuthentication
+    name = 'feedToken'
+
+    def get_security_definition(self, auto_schema):
+        return {'type': 'apiKey', 'in': 'query', 'name': 'token'}
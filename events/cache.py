@@ -0,0 +1,131 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from event_management.utils.singleflight import get_or_compute, is_fresh, make_entry
+from events.models import Event
+
+
+EVENT_CACHE_KEY = 'events:event:{event_id}'
+ATTENDEE_PAGES_VERSION_KEY = 'events:attendees:version:{event_id}'
+ATTENDEE_PAGE_KEY = 'events:attendees:{event_id}:{version}:{page}'
+
+
+def get_event_cache():
+    """
+    Returns the cache holding per-event entries, or None when event caching is disabled.
+    """
+    alias = settings.EVENTS_CACHE_ALIAS
+    return caches[alias] if alias else None
+
+
+def get_event(event_id):
+    """
+    Returns an event (creator included) through the per-event cache, filling a
+    missing or expiring entry with a single query however many requests ask for it at once.
+
+    Raises:
+        Event.DoesNotExist: If there is no such event.
+    """
+    def load():
+        return Event.objects.select_related('creator').get(pk=event_id)
+
+    event_cache = get_event_cache()
+    if not event_cache:
+        return load()
+    return get_or_compute(event_cache, EVENT_CACHE_KEY.format(event_id=event_id), load, settings.EVENTS_CACHE_TIMEOUT)
+
+
+def get_events_by_ids(ids):
+    """
+    Returns the events with the given ids, in the given order, skipping unknown ids.
+
+    Events are read from the per-event cache first; the misses are fetched with a
+    single query (creator included) and written back, so the query count does not
+    depend on the number of ids.
+    """
+    event_cache = get_event_cache()
+    keys = {event_id: EVENT_CACHE_KEY.format(event_id=event_id) for event_id in ids}
+
+    cached = event_cache.get_many(keys.values()) if event_cache else {}
+    events = {
+        event_id: cached[key]['value']
+        for event_id, key in keys.items()
+        if key in cached and is_fresh(cached[key])
+    }
+
+    misses = [event_id for event_id in keys if event_id not in events]
+    if misses:
+        started = time.perf_counter()
+        fetched = Event.objects.select_related('creator').in_bulk(misses)
+        compute_time = (time.perf_counter() - started) / max(len(fetched), 1)
+        events.update(fetched)
+        if event_cache and fetched:
+            event_cache.set_many(
+                {
+                    keys[event_id]: make_entry(event, settings.EVENTS_CACHE_TIMEOUT, compute_time)
+                    for event_id, event in fetched.items()
+                },
+                timeout=settings.EVENTS_CACHE_TIMEOUT + settings.CACHE_STALE_SECONDS,
+            )
+
+    return [events[event_id] for event_id in keys if event_id in events]
+
+
+def invalidate_event(event_id):
+    event_cache = get_event_cache()
+    if event_cache:
+        event_cache.delete(EVENT_CACHE_KEY.format(event_id=event_id))
+
+
+def invalidate_events(event_ids):
+    """
+    Drops the cached entry and attendee pages of many events in one cache call
+    (events leaving the hot table). The next read of a page seeds a new version
+    from the clock, so deleting the version orphans the pages like a bump does.
+    """
+    event_cache = get_event_cache()
+    if event_cache:
+        event_cache.delete_many([
+            key.format(event_id=event_id)
+            for event_id in event_ids
+            for key in (EVENT_CACHE_KEY, ATTENDEE_PAGES_VERSION_KEY)
+        ])
+
+
+def get_attendee_page(event_id, page, compute):
+    """
+    Returns the attendee page data of an event, computed once per
+    `EVENTS_ATTENDEES_CACHE_TIMEOUT` however many requests ask for it at once.
+
+    Pages are keyed on the event's attendee version and `page`, a tuple of the
+    normalized parameters that select the rows (never the request URL, so
+    hosts and unrelated query parameters share one entry).
+    """
+    event_cache = get_event_cache()
+    if not event_cache:
+        return compute()
+
+    version_key = ATTENDEE_PAGES_VERSION_KEY.format(event_id=event_id)
+    version = event_cache.get(version_key)
+    if version is None:
+        # Seeded from the clock so a cache flush never brings back an older version.
+        event_cache.add(version_key, time.time_ns(), timeout=None)
+        version = event_cache.get(version_key)
+
+    key = ATTENDEE_PAGE_KEY.format(event_id=event_id, version=version, page=':'.join(map(str, page)))
+    return get_or_compute(event_cache, key, compute, settings.EVENTS_ATTENDEES_CACHE_TIMEOUT)
+
+
+def invalidate_attendee_pages(event_id):
+    """
+    Orphans every cached attendee page of an event by bumping its version.
+    """
+    event_cache = get_event_cache()
+    if event_cache:
+        try:
+            event_cache.incr(ATTENDEE_PAGES_VERSION_KEY.format(event_id=event_id))
+        except ValueError:
+            # No version yet: nothing is cached for this event.
+            pass
@@ -0,0 +1,64 @@
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from itertools import islice
+
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber, TruncDate
+
+from events.models import Event
+from events.recurrence import get_occurrences, merge_by_start
+
+
+def get_local_day_bounds(first_day, last_day, tzinfo):
+    """
+    Returns the aware datetimes `[start, end)` covering whole local days from `first_day` to `last_day`.
+    """
+    start = datetime.combine(first_day, time.min, tzinfo=tzinfo)
+    end = datetime.combine(last_day + timedelta(days=1), time.min, tzinfo=tzinfo)
+    return start, end
+
+
+def get_calendar(first_day, last_day, tzinfo, per_day):
+    """
+    Buckets events by local start day in the database, in one query, then adds the
+    occurrences of recurring events expanded for the same window.
+
+    The range is a `start_time` interval, served by `event_start_time_idx`.
+    `TruncDate` with a `tzinfo` becomes `(start_time AT TIME ZONE ...)::date`
+    on PostgreSQL (and Django's timezone-aware date cast on SQLite). Window
+    functions then count the events of each day and rank them, so only the
+    first `per_day` events per day leave the database. Series rows are templates
+    and are left out; their occurrences come from `get_occurrences`.
+
+    Returns:
+        list: `{"date", "count", "events"}` for each day that has events, in date order.
+    """
+    start, end = get_local_day_bounds(first_day, last_day, tzinfo)
+    day = TruncDate('start_time', tzinfo=tzinfo)
+    events = (
+        Event.objects
+        .filter(start_time__gte=start, start_time__lt=end, recurrence='')
+        .annotate(
+            day=day,
+            day_count=Window(Count('id'), partition_by=[day]),
+            day_rank=Window(RowNumber(), partition_by=[day], order_by=[F('start_time').asc(), F('id').asc()]),
+        )
+        .filter(day_rank__lte=per_day)
+        .order_by('start_time', 'id')
+    )
+
+    days = {}
+    for event in events:
+        days.setdefault(event.day, {"date": event.day, "count": event.day_count, "events": []})["events"].append(event)
+
+    occurrences = defaultdict(list)
+    for occurrence in get_occurrences(start, end):
+        date = occurrence.start_time.astimezone(tzinfo).date()
+        days.setdefault(date, {"date": date, "count": 0, "events": []})["count"] += 1
+        # Occurrences arrive in start order, so only the first `per_day` of a day can make the cut.
+        if len(occurrences[date]) < per_day:
+            occurrences[date].append(occurrence)
+
+    for date, bucket in days.items():
+        bucket["events"] = list(islice(merge_by_start(bucket["events"], occurrences[date]), per_day))
+    return [days[date] for date in sorted(days)]
@@ -0,0 +1,309 @@
+import hashlib
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.db.models import Max, Min, Q
+from django.utils import timezone
+
+from event_management.utils.timezone import convert_to_timezone
+from events.models import Event, Attendee, CancelledOccurrence
+
+
+FEED_TOKEN_SALT = 'events.feed'
+FEED_VERSION_KEY = 'events:feed:version:{user_id}'
+FEED_BODY_KEY = 'events:feed:body:{user_id}:{version}:{tz}'
+# How far past now VTIMEZONE transitions are written for series without an end.
+TIMEZONE_HORIZON = timedelta(days=5 * 365)
+
+
+def make_feed_token(user):
+    """
+    Returns a signed token identifying the user, for use in calendar subscription URLs.
+    The token carries the user's `feed_nonce`, so rotating the nonce revokes it.
+    """
+    return signing.dumps([user.pk, user.feed_nonce], salt=FEED_TOKEN_SALT)
+
+
+def read_feed_token(token):
+    """
+    Returns the `(user id, feed nonce)` stored in a feed token.
+
+    Raises:
+        signing.BadSignature: If the token was tampered with, is malformed, or is
+            older than `EVENTS_FEED_TOKEN_MAX_AGE` (signing.SignatureExpired).
+    """
+    value = signing.loads(token, salt=FEED_TOKEN_SALT, max_age=settings.EVENTS_FEED_TOKEN_MAX_AGE)
+    if not isinstance(value, list) or len(value) != 2:
+        raise signing.BadSignature("Malformed feed token.")
+    return tuple(value)
+
+
+def get_feed_version(user_id):
+    """
+    Returns the current feed version of a user.
+
+    The version is seeded from the clock when missing, so a cache flush can never
+    bring back a version (and therefore an ETag) that was handed out before.
+    """
+    key = FEED_VERSION_KEY.format(user_id=user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def invalidate_feeds(user_ids):
+    """
+    Bumps the feed version of every given user, which orphans their cached feeds and ETags.
+    """
+    for user_id in set(user_ids):
+        try:
+            cache.incr(FEED_VERSION_KEY.format(user_id=user_id))
+        except ValueError:
+            # No version yet: the next read seeds a fresh one.
+            pass
+
+
+def get_feed_etag(user_id, version, tz):
+    """
+    Returns a strong ETag for the feed of a user rendered in the given timezone.
+    """
+    tz_hash = hashlib.sha1(tz.encode()).hexdigest()[:8]
+    return f'"{user_id}-{version}-{tz_hash}"'
+
+
+def get_cached_feed(user_id, version, tz):
+    return cache.get(FEED_BODY_KEY.format(user_id=user_id, version=version, tz=tz))
+
+
+def get_feed_events(user):
+    """
+    Returns the events a user created or is registered for, ordered by start time.
+    """
+    registered = Attendee.objects.filter(user=user).values('event_id')
+    return (
+        Event.objects
+        .filter(Q(creator=user) | Q(id__in=registered))
+        .only(
+            'id', 'name', 'location', 'start_time', 'end_time', 'updated_at', 'recurrence',
+            'recurrence_interval', 'recurrence_until', 'recurrence_timezone', 'series', 'occurrence_start',
+        )
+        .order_by('start_time', 'id')
+    )
+
+
+def _escape(value):
+    return (
+        value.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def _fold(line):
+    """
+    Folds a content line to 75 octets as required by RFC 5545.
+    """
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line + '\r\n'
+
+    parts = []
+    while encoded:
+        limit = 75 if not parts else 74
+        cut = min(limit, len(encoded))
+        # Never split a multi-byte UTF-8 sequence.
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode())
+        encoded = encoded[cut:]
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def _format_datetime(name, dt, tz):
+    if tz:
+        local = convert_to_timezone(dt, tz)
+        return f"{name};TZID={tz}:{local.strftime('%Y%m%dT%H%M%S')}"
+    return f"{name}:{dt.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')}"
+
+
+def _format_offset(offset):
+    seconds = int(offset.total_seconds())
+    sign = '-' if seconds < 0 else '+'
+    hours, rest = divmod(abs(seconds), 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{sign}{hours:02d}{minutes:02d}{f'{seconds:02d}' if seconds else ''}"
+
+
+def _get_transitions(zone, start, end):
+    """
+    Yields `(instant, offset before, offset after)` for each change of a zone's UTC
+    offset between two aware datetimes, found day by day and bisected to the second.
+    """
+    offset_at = lambda seconds: datetime.fromtimestamp(seconds, zone).utcoffset()  # noqa: E731
+    at, end = int(start.timestamp()), int(end.timestamp())
+    offset = offset_at(at)
+    while at < end:
+        step = min(at + 86400, end)
+        if offset_at(step) != offset:
+            low, high = at, step
+            while high - low > 1:
+                middle = (low + high) // 2
+                if offset_at(middle) == offset:
+                    low = middle
+                else:
+                    high = middle
+            after = offset_at(high)
+            yield datetime.fromtimestamp(high, dt_timezone.utc), offset, after
+            offset = after
+            # The step may span more than one change: resume from this one.
+            step = high
+        at = step
+
+
+def _format_vtimezone(tz, start, end):
+    """
+    Returns the VTIMEZONE lines defining a TZID, with one observance per UTC offset
+    change between two aware datetimes (and one for the offset in effect at `start`).
+    """
+    zone = ZoneInfo(tz)
+
+    def observance(instant, before, after):
+        local = instant.astimezone(zone)
+        kind = 'DAYLIGHT' if local.dst() else 'STANDARD'
+        return [
+            f'BEGIN:{kind}',
+            f"DTSTART:{(instant + before).strftime('%Y%m%dT%H%M%S')}",
+            f'TZOFFSETFROM:{_format_offset(before)}',
+            f'TZOFFSETTO:{_format_offset(after)}',
+            f'TZNAME:{_escape(local.tzname())}',
+            f'END:{kind}',
+        ]
+
+    first = start.astimezone(zone).utcoffset()
+    lines = ['BEGIN:VTIMEZONE', f'TZID:{tz}', *observance(start.astimezone(dt_timezone.utc), first, first)]
+    for transition in _get_transitions(zone, start, end):
+        lines += observance(*transition)
+    lines.append('END:VTIMEZONE')
+    return lines
+
+
+def _format_rrule(event):
+    rule = f"RRULE:FREQ={event.recurrence.upper()};INTERVAL={event.recurrence_interval}"
+    if event.recurrence_until:
+        rule += f";UNTIL={event.recurrence_until.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')}"
+    return rule
+
+
+def _format_times(event, series, cancelled, tz):
+    """
+    Returns the UID, DTSTART/DTEND lines of an event, plus the recurrence lines of a series.
+
+    A series is written in its own timezone, so calendar apps expand it in the same
+    wall-clock time as `events.recurrence`. A materialized occurrence overrides the
+    series' instance through a RECURRENCE-ID in that same timezone, but only when
+    the series is in the feed too (`series` maps its id to its timezone); otherwise
+    it is written as an event of its own, as an override without its master is dropped.
+    """
+    if not event.recurrence:
+        if event.series_id not in series:
+            return [
+                f'UID:event-{event.id}@event-management',
+                _format_datetime('DTSTART', event.start_time, tz),
+                _format_datetime('DTEND', event.end_time, tz),
+            ]
+        return [
+            f'UID:event-{event.series_id}@event-management',
+            _format_datetime('DTSTART', event.start_time, tz),
+            _format_datetime('DTEND', event.end_time, tz),
+            _format_datetime('RECURRENCE-ID', event.occurrence_start, series[event.series_id]),
+        ]
+
+    series_tz = series[event.id]
+    return [
+        f'UID:event-{event.id}@event-management',
+        _format_datetime('DTSTART', event.start_time, series_tz),
+        _format_datetime('DTEND', event.end_time, series_tz),
+        _format_rrule(event),
+        *(_format_datetime('EXDATE', start, series_tz) for start in cancelled.get(event.id, ())),
+    ]
+
+
+def render_feed(events, tz=None):
+    """
+    Lazily renders events as an iCalendar document, yielding one chunk per event.
+    Recurring events are written once, with an RRULE, rather than per occurrence.
+
+    Args:
+        events (QuerySet): Events to include, typically from `get_feed_events`.
+        tz (str): Optional timezone for DTSTART/DTEND. Defaults to UTC.
+
+    Every TZID written (`tz` and the series' timezones) is defined by a VTIMEZONE
+    covering the feed's events, up to `TIMEZONE_HORIZON` ahead for open-ended series.
+    """
+    yield ''.join(_fold(line) for line in [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//Event Management API//Events Feed//EN',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+    ])
+
+    series = {}
+    open_ended = False
+    for series_id, series_tz, until in events.exclude(recurrence='').values_list(
+        'id', 'recurrence_timezone', 'recurrence_until'
+    ):
+        series[series_id] = series_tz or settings.TIME_ZONE
+        open_ended = open_ended or until is None
+
+    timezones = sorted({*series.values(), *([tz] if tz else [])})
+    bounds = {'start': None}
+    if timezones:
+        bounds = events.aggregate(start=Min('start_time'), end=Max('end_time'), until=Max('recurrence_until'))
+    if bounds['start'] is not None:
+        end = max(filter(None, [bounds['end'], bounds['until']]))
+        if open_ended:
+            end = max(end, timezone.now()) + TIMEZONE_HORIZON
+        for name in timezones:
+            yield ''.join(_fold(line) for line in _format_vtimezone(name, bounds['start'], end))
+
+    cancelled = defaultdict(list)
+    exceptions = CancelledOccurrence.objects.filter(series__in=list(series)).order_by('occurrence_start')
+    for series_id, start in exceptions.values_list('series_id', 'occurrence_start') if series else ():
+        cancelled[series_id].append(start)
+
+    for event in events.iterator(chunk_size=500):
+        yield ''.join(_fold(line) for line in [
+            'BEGIN:VEVENT',
+            *_format_times(event, series, cancelled, tz),
+            _format_datetime('DTSTAMP', event.updated_at, None),
+            f'SUMMARY:{_escape(event.name)}',
+            f'LOCATION:{_escape(event.location)}',
+            'END:VEVENT',
+        ])
+
+    yield _fold('END:VCALENDAR')
+
+
+def cache_feed_while_streaming(chunks, user_id, version, tz):
+    """
+    Passes chunks through unchanged and caches the complete body once the stream is exhausted.
+    """
+    body = []
+    for chunk in chunks:
+        body.append(chunk)
+        yield chunk
+    cache.set(
+        FEED_BODY_KEY.format(user_id=user_id, version=version, tz=tz),
+        ''.join(body),
+        timeout=settings.EVENTS_FEED_CACHE_TIMEOUT,
+    )
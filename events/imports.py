@@ -0,0 +1,462 @@
+import csv
+import io
+import json
+import uuid
+from datetime import datetime
+from functools import partial
+from itertools import islice
+
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from accounts.models import User
+from events import feeds
+from events.cache import invalidate_events
+from events.changes import restamp_changes
+from events.models import Event, Attendee, ArchivedEvent, StagedEvent, StagedAttendee
+from events.stats import rebuild_stats
+
+
+EVENT_FIELDS = ('ref', 'creator_email', 'name', 'location', 'start_time', 'end_time', 'max_capacity')
+ATTENDEE_FIELDS = ('event_ref', 'user_email', 'created_at', 'event_id')
+
+# Same messages as `EventSerializer.validate` and `AttendeeSerializer.validate`.
+END_BEFORE_START = 'End time must be after start time.'
+EVENT_NOT_FOUND = 'Event does not exist.'
+CREATOR_REGISTRATION = 'Event creator cannot register as an attendee.'
+DUPLICATE_REGISTRATION = 'This user is already registered for the event.'
+EVENT_FULL = 'Event is full. Max capacity reached.'
+
+
+def read_records(file, fmt):
+    """
+    Streams `(line number, record)` pairs from a CSV (with a header row) or NDJSON file.
+    Records that cannot be decoded are yielded as None.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(file)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for number, text in enumerate(file, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError:
+            record = None
+        yield number, record if isinstance(record, dict) else None
+
+
+def _text(record, key, required=True):
+    value = record.get(key)
+    value = '' if value is None else str(value).strip()
+    if not value:
+        if required:
+            raise ValueError(f"Missing {key}.")
+        return None
+    if len(value) > 255:
+        raise ValueError(f"Value of {key} is too long.")
+    return value
+
+
+def _datetime(record, key, required=True):
+    value = _text(record, key, required)
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as e:
+        raise ValueError(f"Invalid {key}: expected an ISO 8601 datetime.") from e
+    return timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
+
+
+def parse_event(record):
+    """
+    Converts an event record to the typed values of `EVENT_FIELDS`.
+
+    Raises:
+        ValueError: With the reason the row is rejected.
+    """
+    max_capacity = _text(record, 'max_capacity')
+    if not max_capacity.isdigit():
+        raise ValueError("Invalid max_capacity.")
+
+    return (
+        _text(record, 'ref'),
+        _text(record, 'creator_email'),
+        _text(record, 'name'),
+        _text(record, 'location'),
+        _datetime(record, 'start_time'),
+        _datetime(record, 'end_time'),
+        int(max_capacity),
+    )
+
+
+def parse_attendee(record):
+    """
+    Converts an attendee record to the typed values of `ATTENDEE_FIELDS`. A numeric
+    reference is also staged as a candidate id of an existing event, which is used
+    when no event of the file has that reference.
+
+    Raises:
+        ValueError: With the reason the row is rejected.
+    """
+    event_ref = _text(record, 'event_ref')
+    return (
+        event_ref,
+        _text(record, 'user_email'),
+        _datetime(record, 'created_at', required=False),
+        int(event_ref) if event_ref.isdigit() and len(event_ref) <= 18 else None,
+    )
+
+
+def _staging_rows(batch, records, fields, parse, ref_field):
+    """
+    Yields staging rows `(batch, line, *fields, error)`, keeping rows that fail to parse as rejects.
+    """
+    empty = (None,) * len(fields)
+    ref_index = fields.index(ref_field)
+    for line, record in records:
+        if record is None:
+            yield (batch, line, *empty, "Invalid record.")
+            continue
+        try:
+            yield (batch, line, *parse(record), None)
+        except ValueError as e:
+            ref = str(record.get(ref_field) or '')[:255] or None
+            yield (batch, line, *empty[:ref_index], ref, *empty[ref_index + 1:], str(e))
+
+
+def _copy_value(value):
+    if value is None:
+        return '\\N'
+    if isinstance(value, str):
+        return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _copy_rows(cursor, table, columns, rows):
+    """
+    Loads rows with PostgreSQL `COPY ... FROM STDIN` (text format), on psycopg 2 or 3.
+    """
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join(_copy_value(value) for value in row))
+        buffer.write('\n')
+    buffer.seek(0)
+
+    quote = connection.ops.quote_name
+    sql = f"COPY {quote(table)} ({', '.join(quote(column) for column in columns)}) FROM STDIN"
+    raw_cursor = cursor.cursor
+    if hasattr(raw_cursor, 'copy_expert'):
+        raw_cursor.copy_expert(sql, buffer)
+    else:
+        with raw_cursor.copy(sql) as copy:
+            copy.write(buffer.getvalue())
+
+
+def _insert_rows(cursor, model, columns, rows):
+    """
+    Loads rows with a multi-row `executemany` INSERT, the statement `bulk_create` would run,
+    adapting only the columns whose Python values the database driver cannot take as is.
+    """
+    adapt = [
+        (index, partial(field.get_db_prep_save, connection=connection))
+        for index, field in enumerate(model._meta.get_field(column) for column in columns)
+        if isinstance(field, (models.DateTimeField, models.UUIDField))
+    ]
+    for row in rows:
+        for index, prepare in adapt:
+            row[index] = prepare(row[index])
+
+    quote = connection.ops.quote_name
+    cursor.executemany(
+        f"INSERT INTO {quote(model._meta.db_table)} ({', '.join(quote(column) for column in columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))})",
+        rows,
+    )
+
+
+def stage(model, fields, rows, chunk_size):
+    """
+    Writes staging rows `(batch, line, *fields, error)` in chunks: `COPY` on PostgreSQL,
+    a batched INSERT elsewhere.
+
+    Returns:
+        int: Number of rows staged.
+    """
+    columns = ('batch', 'line', *fields, 'error')
+    count = 0
+    rows = iter(rows)
+    with connection.cursor() as cursor:
+        while chunk := list(islice(rows, chunk_size)):
+            if connection.vendor == 'postgresql':
+                _copy_rows(cursor, model._meta.db_table, columns, chunk)
+            else:
+                _insert_rows(cursor, model, columns, [list(row) for row in chunk])
+            count += len(chunk)
+    return count
+
+
+def _sql(sql):
+    """
+    Fills the `{table}` placeholders of a statement with quoted table names.
+    """
+    quote = connection.ops.quote_name
+    return sql.format(**{
+        'staged_event': quote(StagedEvent._meta.db_table),
+        'staged_attendee': quote(StagedAttendee._meta.db_table),
+        'event': quote(Event._meta.db_table),
+        'attendee': quote(Attendee._meta.db_table),
+        'archived_event': quote(ArchivedEvent._meta.db_table),
+        'user': quote(User._meta.db_table),
+    })
+
+
+def _execute(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(_sql(sql), params)
+        return cursor.rowcount
+
+
+def _batch_value(batch):
+    # UUIDs are stored as 32 hex digits on backends without a native uuid type.
+    return StagedEvent._meta.get_field('batch').get_db_prep_value(batch, connection)
+
+
+def _reject(table, error, condition, batch, params=()):
+    """
+    Sets `error` on the batch's still valid rows of a staging table matching a SQL condition.
+    """
+    return _execute(
+        f"UPDATE {{{table}}} SET error = %s WHERE batch = %s AND error IS NULL AND ({condition})",
+        [error, batch, *params],
+    )
+
+
+def validate_events(batch):
+    """
+    Rejects invalid staged events with one statement per rule, then allocates the
+    `Event` primary keys of the valid ones.
+
+    Rules: a reference appears once in the file (later lines are rejected),
+    the creator is an existing user, and the event ends after it starts.
+    """
+    batch = _batch_value(batch)
+    _reject('staged_event', "Duplicate event reference.", """
+        EXISTS (
+            SELECT 1 FROM {staged_event} AS other
+            WHERE other.batch = {staged_event}.batch AND other.ref = {staged_event}.ref
+            AND other.line < {staged_event}.line
+        )
+    """, batch)
+    _execute("""
+        UPDATE {staged_event}
+        SET creator_id = (SELECT u.id FROM {user} AS u WHERE u.email = {staged_event}.creator_email)
+        WHERE batch = %s AND error IS NULL
+    """, [batch])
+    _reject('staged_event', "Unknown creator.", "creator_id IS NULL", batch)
+    _reject('staged_event', END_BEFORE_START, "end_time <= start_time", batch)
+
+    if connection.vendor == 'postgresql':
+        _execute("""
+            UPDATE {staged_event} SET event_id = nextval(pg_get_serial_sequence(%s, 'id'))
+            WHERE batch = %s AND error IS NULL
+        """, [Event._meta.db_table, batch])
+    else:
+        # Single writer: start above every id in use, archived events included.
+        with connection.cursor() as cursor:
+            cursor.execute(_sql(
+                "SELECT MAX(id) FROM (SELECT MAX(id) AS id FROM {event} "
+                "UNION ALL SELECT MAX(id) FROM {archived_event}) AS ids"
+            ))
+            base = cursor.fetchone()[0] or 0
+        _execute("UPDATE {staged_event} SET event_id = %s + line WHERE batch = %s AND error IS NULL", [base, batch])
+
+
+def validate_attendees(batch):
+    """
+    Rejects invalid staged registrations with one statement per rule, in the order
+    of `AttendeeSerializer.validate`: the event exists (among the batch's valid
+    events or, for a numeric reference no event of the file uses, as an existing
+    non-series event), the user exists, the user is not the event's creator, the
+    user is not registered twice (the first line wins, existing registrations
+    included), and the event is not over capacity (registrations are admitted in
+    file order, after the event's existing ones).
+    """
+    batch = _batch_value(batch)
+    _execute("""
+        UPDATE {staged_attendee} SET
+            event_id = CASE
+                WHEN EXISTS (
+                    SELECT 1 FROM {staged_event} AS e
+                    WHERE e.batch = {staged_attendee}.batch AND e.ref = {staged_attendee}.event_ref
+                ) THEN (
+                    SELECT e.event_id FROM {staged_event} AS e
+                    WHERE e.batch = {staged_attendee}.batch AND e.ref = {staged_attendee}.event_ref AND e.error IS NULL
+                )
+                ELSE (SELECT x.id FROM {event} AS x WHERE x.id = {staged_attendee}.event_id AND x.recurrence = '')
+            END,
+            user_id = (SELECT u.id FROM {user} AS u WHERE u.email = {staged_attendee}.user_email)
+        WHERE batch = %s AND error IS NULL
+    """, [batch])
+    _reject('staged_attendee', EVENT_NOT_FOUND, "event_id IS NULL", batch)
+    _reject('staged_attendee', "Unknown user.", "user_id IS NULL", batch)
+    _reject('staged_attendee', CREATOR_REGISTRATION, """
+        EXISTS (
+            SELECT 1 FROM {staged_event} AS e
+            WHERE e.batch = {staged_attendee}.batch AND e.ref = {staged_attendee}.event_ref
+            AND e.error IS NULL AND e.creator_id = {staged_attendee}.user_id
+        )
+        OR EXISTS (
+            SELECT 1 FROM {event} AS x
+            WHERE x.id = {staged_attendee}.event_id AND x.creator_id = {staged_attendee}.user_id
+        )
+    """, batch)
+    _reject('staged_attendee', DUPLICATE_REGISTRATION, """
+        EXISTS (
+            SELECT 1 FROM {staged_attendee} AS other
+            WHERE other.batch = {staged_attendee}.batch AND other.event_id = {staged_attendee}.event_id
+            AND other.user_id = {staged_attendee}.user_id AND other.line < {staged_attendee}.line
+            AND other.error IS NULL
+        )
+        OR EXISTS (
+            SELECT 1 FROM {attendee} AS r
+            WHERE r.event_id = {staged_attendee}.event_id AND r.user_id = {staged_attendee}.user_id
+        )
+    """, batch)
+    _reject('staged_attendee', EVENT_FULL, """
+        id IN (
+            SELECT ranked.id FROM (
+                SELECT a.id, a.event_id, COALESCE(e.max_capacity, x.max_capacity) AS max_capacity,
+                    ROW_NUMBER() OVER (PARTITION BY a.event_id ORDER BY a.line) AS position
+                FROM {staged_attendee} AS a
+                LEFT JOIN {staged_event} AS e ON e.batch = a.batch AND e.ref = a.event_ref AND e.error IS NULL
+                LEFT JOIN {event} AS x ON x.id = a.event_id
+                WHERE a.batch = %s AND a.error IS NULL
+            ) AS ranked
+            WHERE ranked.position + (
+                SELECT COUNT(*) FROM {attendee} AS r WHERE r.event_id = ranked.event_id
+            ) > ranked.max_capacity
+        )
+    """, batch, [batch])
+
+
+def apply(batch):
+    """
+    Copies the batch's valid staged rows into `Event` and `Attendee` with INSERT ... SELECT.
+
+    Returns:
+        tuple: Number of (events, attendees) inserted.
+    """
+    batch = _batch_value(batch)
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    events = _execute("""
+        INSERT INTO {event} (
+            id, creator_id, name, location, start_time, end_time, max_capacity,
+            recurrence, recurrence_interval, recurrence_timezone, created_at, updated_at
+        )
+        SELECT event_id, creator_id, name, location, start_time, end_time, max_capacity, '', 1, '', %s, %s
+        FROM {staged_event} WHERE batch = %s AND error IS NULL
+    """, [now, now, batch])
+    attendees = _execute("""
+        INSERT INTO {attendee} (event_id, user_id, event_start, event_end, created_at, updated_at)
+        SELECT a.event_id, a.user_id, e.start_time, e.end_time, COALESCE(a.created_at, %s), %s
+        FROM {staged_attendee} AS a
+        JOIN {event} AS e ON e.id = a.event_id
+        WHERE a.batch = %s AND a.error IS NULL
+    """, [now, now, batch])
+    return events, attendees
+
+
+def get_rejects(batch):
+    """
+    Yields `(kind, line, reference, error)` for every rejected row of a batch, events first.
+    """
+    for line, ref, error in StagedEvent.objects.filter(batch=batch, error__isnull=False).order_by('line').values_list(
+        'line', 'ref', 'error'
+    ).iterator():
+        yield 'event', line, ref, error
+    for line, ref, error in StagedAttendee.objects.filter(batch=batch, error__isnull=False).order_by('line').values_list(
+        'line', 'event_ref', 'error'
+    ).iterator():
+        yield 'attendee', line, ref, error
+
+
+def import_events(events, attendees=None, chunk_size=10000, on_reject=None, dry_run=False):
+    """
+    Imports events and their registrations in one transaction.
+
+    Rows are staged in bulk, validated in set-based SQL and copied into the live
+    tables, so the cost per row is a few microseconds of parsing plus the database's
+    bulk load path, instead of one ORM round trip per object. Registration stats
+    are rebuilt and feed caches invalidated for what was imported. No webhooks or
+    confirmation emails are sent for imported rows.
+
+    Args:
+        events (iterable): `(line, record)` pairs of events, see `read_records`.
+        attendees (iterable): `(line, record)` pairs of registrations referencing the events' `ref`
+            or the id of an existing event.
+        chunk_size (int): Rows staged per `COPY` / `bulk_create`.
+        on_reject (callable): Called with `(kind, line, reference, error)` for each rejected row.
+        dry_run (bool): Validate and report only; nothing is written.
+
+    Returns:
+        dict: Counts of `events`, `attendees` (imported) and `rejected_events`, `rejected_attendees`.
+    """
+    batch = str(uuid.uuid4())
+    with transaction.atomic():
+        staged_events = stage(
+            StagedEvent, EVENT_FIELDS, _staging_rows(batch, events, EVENT_FIELDS, parse_event, 'ref'), chunk_size
+        )
+        staged_attendees = 0
+        if attendees is not None:
+            staged_attendees = stage(
+                StagedAttendee,
+                ATTENDEE_FIELDS,
+                _staging_rows(batch, attendees, ATTENDEE_FIELDS, parse_attendee, 'event_ref'),
+                chunk_size,
+            )
+
+        validate_events(batch)
+        validate_attendees(batch)
+
+        rejected = {'event': 0, 'attendee': 0}
+        for reject in get_rejects(batch):
+            rejected[reject[0]] += 1
+            if on_reject:
+                on_reject(*reject)
+
+        if dry_run:
+            imported = (staged_events - rejected['event'], staged_attendees - rejected['attendee'])
+            transaction.set_rollback(True)
+        else:
+            imported = apply(batch)
+            event_ids = list(StagedEvent.objects.filter(batch=batch, error__isnull=True).values_list('event_id', flat=True))
+            existing_ids = list(
+                StagedAttendee.objects.filter(batch=batch, error__isnull=True)
+                .exclude(event_id__in=StagedEvent.objects.filter(batch=batch).values('event_id'))
+                .values_list('event_id', flat=True).distinct()
+            )
+            registered_ids = event_ids + existing_ids
+            for start in range(0, len(registered_ids), chunk_size):
+                rebuild_stats(registered_ids[start:start + chunk_size])
+            user_ids = set(StagedEvent.objects.filter(batch=batch, error__isnull=True).values_list('creator_id', flat=True))
+            user_ids.update(StagedAttendee.objects.filter(batch=batch, error__isnull=True).values_list('user_id', flat=True))
+            StagedAttendee.objects.filter(batch=batch).delete()
+            StagedEvent.objects.filter(batch=batch).delete()
+            transaction.on_commit(lambda: feeds.invalidate_feeds(user_ids))
+            transaction.on_commit(lambda: invalidate_events(existing_ids))
+            # Rows are stamped inside this (possibly long) transaction: bring them ahead of change feed cursors.
+            transaction.on_commit(lambda: restamp_changes(event_ids, chunk_size=chunk_size))
+
+    return {
+        'events': imported[0],
+        'attendees': imported[1],
+        'rejected_events': rejected['event'],
+        'rejected_attendees': rejected['attendee'],
+    }
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core import signing
+from django.db.models import Count
+
+from events.models import Event
+
+
+LIVE_TOKEN_SALT = 'events.live'
+
+
+def make_live_token(user, event_id):
+    """
+    Returns a short-lived signed token letting the user connect to the stream of one event.
+
+    Browsers' `EventSource` cannot send an Authorization header, so the stream URL carries it.
+    """
+    return signing.dumps([user.pk, event_id], salt=LIVE_TOKEN_SALT)
+
+
+def read_live_token(token, event_id):
+    """
+    Returns the user id stored in a live token for the given event.
+
+    Raises:
+        signing.BadSignature: If the token was tampered with, has expired
+            (`EVENTS_LIVE_TOKEN_MAX_AGE`) or is for another event.
+    """
+    user_id, token_event_id = signing.loads(token, salt=LIVE_TOKEN_SALT, max_age=settings.EVENTS_LIVE_TOKEN_MAX_AGE)
+    if token_event_id != event_id:
+        raise signing.BadSignature("Token is for another event.")
+    return user_id
+
+
+class Subscription:
+    """
+    A single Server-Sent Events client waiting for capacity updates of one event.
+
+    Only the latest payload is kept: a slow client skips intermediate counts
+    instead of buffering them.
+    """
+
+    def __init__(self, event_id, loop):
+        self.event_id = event_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=1)
+
+    def offer(self, payload):
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(payload)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+class CapacityBroadcaster:
+    """
+    In-process fan-out of attendee counts to SSE subscribers.
+
+    Subscribers are plain queues awaited on the ASGI event loop, so idle clients
+    cost no thread. A publish computes the payload once and hands it to each loop
+    in a single thread-safe callback, whatever the number of subscribers. The last
+    payload is remembered while an event has subscribers, so new subscribers get a
+    snapshot without querying the database.
+
+    Subscribers only see registrations committed by the same process; run one
+    broadcaster per worker behind sticky routing, or feed it from a shared channel.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+        self._latest = {}
+
+    def subscribe(self, event_id, loop=None):
+        subscription = Subscription(event_id, loop or asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[event_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.event_id)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.event_id]
+                self._latest.pop(subscription.event_id, None)
+
+    def has_subscribers(self, event_id):
+        return event_id in self._subscribers
+
+    def latest(self, event_id):
+        return self._latest.get(event_id)
+
+    def publish(self, event_id, payload):
+        """
+        Delivers a payload to every subscriber of an event. Safe to call from any thread.
+        """
+        by_loop = defaultdict(list)
+        with self._lock:
+            if event_id not in self._subscribers:
+                return
+            self._latest[event_id] = payload
+            for subscription in self._subscribers[event_id]:
+                by_loop[subscription.loop].append(subscription)
+
+        for loop, subscriptions in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver, subscriptions, payload)
+            except RuntimeError:
+                # The loop has shut down without its streams unsubscribing.
+                for subscription in subscriptions:
+                    self.unsubscribe(subscription)
+
+
+def _deliver(subscriptions, payload):
+    for subscription in subscriptions:
+        subscription.offer(payload)
+
+
+broadcaster = CapacityBroadcaster()
+
+
+def get_capacity_snapshot(event_id):
+    """
+    Returns the current capacity payload of an event with one query, or None if it does not exist.
+    """
+    event = (
+        Event.objects
+        .filter(pk=event_id)
+        .annotate(attendee_count=Count('attendees'))
+        .values('id', 'max_capacity', 'attendee_count')
+        .first()
+    )
+    if event is None:
+        return None
+    return {
+        "event": event['id'],
+        "attendees": event['attendee_count'],
+        "max_capacity": event['max_capacity'],
+        "spots_left": max(event['max_capacity'] - event['attendee_count'], 0),
+    }
+
+
+def publish_capacity(event_id):
+    """
+    Pushes the committed attendee count of an event to its subscribers, if it has any.
+    """
+    if not broadcaster.has_subscribers(event_id):
+        return
+    snapshot = get_capacity_snapshot(event_id)
+    if snapshot is not None:
+        broadcaster.publish(event_id, snapshot)
+
+
+def format_sse(payload, event='capacity'):
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
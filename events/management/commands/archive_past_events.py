@@ -0,0 +1,59 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from events.archive import archive_batch
+
+
+class Command(BaseCommand):
+    help = "Moves events that have ended, and their attendees, out of the hot tables into the archive."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--before',
+            help="Archive events that ended before this ISO 8601 datetime (default: now).",
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help="Events moved per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            '--max-batches',
+            type=int,
+            default=None,
+            help="Stop after this many batches (default: until nothing is left).",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = self._parse_cutoff(options['before'])
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        batches = events = attendees = 0
+        while options['max_batches'] is None or batches < options['max_batches']:
+            moved_events, moved_attendees = archive_batch(cutoff, batch_size)
+            if not moved_events:
+                break
+            batches += 1
+            events += moved_events
+            attendees += moved_attendees
+            self.stdout.write(f"Batch {batches}: archived {moved_events} events, {moved_attendees} attendees")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Archived {events} events and {attendees} attendees that ended before {cutoff.isoformat()}."
+        ))
+
+    def _parse_cutoff(self, value):
+        if not value:
+            return timezone.now()
+        try:
+            cutoff = datetime.fromisoformat(value)
+        except ValueError as e:
+            raise CommandError(f"Invalid --before datetime: {value}") from e
+        if timezone.is_naive(cutoff):
+            cutoff = timezone.make_aware(cutoff)
+        return cutoff
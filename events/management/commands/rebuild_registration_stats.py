@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from events.models import Event
+from events.stats import rebuild_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the registration statistics rollup from Attendee rows (ArchivedAttendee rows "
+        "for archived events), in batches of events."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'event_ids',
+            nargs='*',
+            type=int,
+            help="Events to rebuild, hot or archived (default: all hot events).",
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help="Events recomputed per transaction (default: 500).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        event_ids = options['event_ids'] or Event.objects.order_by('id').values_list('id', flat=True).iterator()
+
+        events = buckets = 0
+        batch = []
+        for event_id in event_ids:
+            batch.append(event_id)
+            if len(batch) == batch_size:
+                buckets += rebuild_stats(batch)
+                events += len(batch)
+                batch = []
+        if batch:
+            buckets += rebuild_stats(batch)
+            events += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {buckets} buckets for {events} events."))
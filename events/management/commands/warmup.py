@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from event_management.utils.warmup import warm_up
+
+
+class Command(BaseCommand):
+    help = "Preloads URL resolvers, serializers, zoneinfo data and the OpenAPI snapshot, and reports the timings."
+
+    def handle(self, *args, **options):
+        results = warm_up()
+        for name, (count, seconds) in results.items():
+            self.stdout.write(f"{name}: {count} loaded in {seconds * 1000:.1f} ms")
+
+        total = sum(seconds for _, seconds in results.values())
+        self.stdout.write(self.style.SUCCESS(f"Warm-up finished in {total * 1000:.1f} ms."))
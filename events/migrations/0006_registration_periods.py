@@ -0,0 +1,72 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:05
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_event_periods(apps, schema_editor):
+    for attendee_model, event_model in (('Attendee', 'Event'), ('ArchivedAttendee', 'ArchivedEvent')):
+        Attendee = apps.get_model('events', attendee_model)
+        Event = apps.get_model('events', event_model)
+        event = Event.objects.filter(pk=OuterRef('event_id'))
+        Attendee.objects.update(
+            event_start=Subquery(event.values('start_time')[:1]),
+            event_end=Subquery(event.values('end_time')[:1]),
+        )
+
+
+def create_period_gist_index(apps, schema_editor):
+    """
+    PostgreSQL only: GiST index on (user, [event_start, event_end)) serving the `&&` overlap query.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS attendee_user_period_gist ON events_attendee "
+        "USING gist (user_id, tstzrange(event_start, event_end, '[)'))"
+    )
+
+
+def drop_period_gist_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS attendee_user_period_gist")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_change_feed'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedattendee',
+            name='event_end',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='archivedattendee',
+            name='event_start',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='attendee',
+            name='event_end',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='attendee',
+            name='event_start',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='attendee',
+            index=models.Index(fields=['user', 'event_end', 'event_start'], name='attendee_user_period_idx'),
+        ),
+        migrations.RunPython(copy_event_periods, migrations.RunPython.noop),
+        migrations.RunPython(create_period_gist_index, drop_period_gist_index),
+    ]
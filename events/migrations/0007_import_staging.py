@@ -0,0 +1,72 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:39
+
+from django.db import migrations, models
+
+
+STAGING_TABLES = ('events_stagedevent', 'events_stagedattendee')
+
+
+def set_staging_unlogged(apps, schema_editor):
+    """
+    PostgreSQL only: staging rows are transient, so skip the WAL for them.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in STAGING_TABLES:
+        schema_editor.execute(f"ALTER TABLE {schema_editor.quote_name(table)} SET UNLOGGED")
+
+
+def set_staging_logged(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in STAGING_TABLES:
+        schema_editor.execute(f"ALTER TABLE {schema_editor.quote_name(table)} SET LOGGED")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_registration_periods'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StagedAttendee',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('batch', models.UUIDField()),
+                ('line', models.PositiveIntegerField()),
+                ('event_ref', models.CharField(max_length=255, null=True)),
+                ('user_email', models.CharField(max_length=254, null=True)),
+                ('created_at', models.DateTimeField(null=True)),
+                ('event_id', models.BigIntegerField(null=True)),
+                ('user_id', models.BigIntegerField(null=True)),
+                ('error', models.CharField(max_length=255, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['batch', 'event_ref'], name='staged_attendee_ref_idx'), models.Index(fields=['batch', 'event_id', 'user_id', 'line'], name='staged_attendee_pair_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='StagedEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('batch', models.UUIDField()),
+                ('line', models.PositiveIntegerField()),
+                ('ref', models.CharField(max_length=255, null=True)),
+                ('creator_email', models.CharField(max_length=254, null=True)),
+                ('name', models.CharField(max_length=255, null=True)),
+                ('location', models.CharField(max_length=255, null=True)),
+                ('start_time', models.DateTimeField(null=True)),
+                ('end_time', models.DateTimeField(null=True)),
+                ('max_capacity', models.PositiveIntegerField(null=True)),
+                ('creator_id', models.BigIntegerField(null=True)),
+                ('event_id', models.BigIntegerField(null=True)),
+                ('error', models.CharField(max_length=255, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['batch', 'ref', 'line'], name='staged_event_ref_idx')],
+            },
+        ),
+        migrations.RunPython(set_staging_unlogged, set_staging_logged),
+    ]
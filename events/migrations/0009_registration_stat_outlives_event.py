@@ -0,0 +1,19 @@
+# Generated by Django 5.2.3 on 2026-10-19 01:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_recurring_events'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='registrationstat',
+            name='event',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='registration_stats', to='events.event'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 
 class TimeStampedModel(models.Model):
@@ -25,7 +26,18 @@ class Event(TimeStampedModel):
         - start_time: Date and time when the event starts.
         - end_time: Date and time when the event ends.
         - max_capacity: Maximum number of attendees allowed.
+        - recurrence, recurrence_interval, recurrence_until, recurrence_timezone: Repeat the
+          event every `recurrence_interval` days/weeks/months of wall-clock time in
+          `recurrence_timezone` (default: `TIME_ZONE`), starting at `start_time`. A recurring
+          event is a series: its occurrences are expanded on demand (see `events.recurrence`).
+        - series, occurrence_start: For an occurrence materialized from a series (when someone
+          registers), the series and the start the occurrence had in it.
     """
+    DAILY = 'daily'
+    WEEKLY = 'weekly'
+    MONTHLY = 'monthly'
+    RECURRENCE_CHOICES = [('', 'Does not repeat'), (DAILY, 'Daily'), (WEEKLY, 'Weekly'), (MONTHLY, 'Monthly')]
+
     creator = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -36,10 +48,75 @@ class Event(TimeStampedModel):
     start_time = models.DateTimeField()
     end_time = models.DateTimeField()
     max_capacity = models.PositiveIntegerField()
+    recurrence = models.CharField(max_length=7, choices=RECURRENCE_CHOICES, blank=True, default='')
+    recurrence_interval = models.PositiveSmallIntegerField(default=1)
+    recurrence_until = models.DateTimeField(null=True, blank=True)
+    recurrence_timezone = models.CharField(max_length=64, blank=True, default='')
+    series = models.ForeignKey(
+        'self',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='occurrences'
+    )
+    occurrence_start = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['start_time', 'id'], name='event_start_time_idx'),
+            models.Index(fields=['creator', 'start_time', 'id'], name='event_creator_start_idx'),
+            # Keyset scans of the change feed (/events/changes/)
+            models.Index(fields=['updated_at', 'id'], name='event_updated_at_idx'),
+            # Series overlapping a requested window (few rows, so a partial index)
+            models.Index(fields=['start_time'], condition=~models.Q(recurrence=''), name='event_series_start_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['series', 'occurrence_start'], name='event_occurrence_unique'),
+        ]
+
+    # Fields whose stored values `has_changed` compares against (see `events.signals`)
+    TRACKED_FIELDS = ('start_time', 'end_time', 'recurrence')
 
     def __str__(self):
         return f"{self.name} ({self.start_time} - {self.end_time})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: value for name, value in zip(field_names, values) if name in cls.TRACKED_FIELDS
+        }
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._remember_values(kwargs.get('update_fields'))
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        self._remember_values(fields)
+
+    def _remember_values(self, fields=None):
+        fields = self.TRACKED_FIELDS if fields is None else fields
+        deferred = self.get_deferred_fields()
+        loaded = self.__dict__.setdefault('_loaded_values', {})
+        for name in self.TRACKED_FIELDS:
+            if name in fields and name not in deferred:
+                loaded[name] = getattr(self, name)
+
+    def has_changed(self, *fields):
+        """
+        Whether any of the tracked `fields` differs from its stored value. A field
+        whose stored value is unknown (e.g. on an instance built by hand) counts as
+        changed, a deferred one as unchanged.
+        """
+        loaded = self.__dict__.get('_loaded_values', {})
+        deferred = self.get_deferred_fields()
+        return any(
+            name not in deferred and (name not in loaded or loaded[name] != getattr(self, name))
+            for name in fields
+        )
+
 
 class Attendee(TimeStampedModel):
     """
@@ -52,6 +129,8 @@ class Attendee(TimeStampedModel):
     Fields:
         - event: The event the user is attending.
         - user: The user attending the event.
+        - event_start, event_end: Copy of the event's period, so a user's overlapping
+          registrations can be found from this table's indexes alone (see `events.overlaps`).
     """
     event = models.ForeignKey(
         Event,
@@ -63,9 +142,249 @@ class Attendee(TimeStampedModel):
         on_delete=models.CASCADE,
         related_name='attendees'
     )
+    event_start = models.DateTimeField(null=True, editable=False)
+    event_end = models.DateTimeField(null=True, editable=False)
 
     class Meta:
         unique_together = ('event', 'user')  # Prevent duplicate registrations
+        indexes = [
+            # User-first lookups ("which events is this user attending?")
+            models.Index(fields=['user', 'event'], name='attendee_user_event_idx'),
+            # Overlap checks: registrations of a user ending after a given time
+            # (PostgreSQL additionally gets a GiST index on the period, see migration 0006)
+            models.Index(fields=['user', 'event_end', 'event_start'], name='attendee_user_period_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.event_start = self.event.start_time
+        self.event_end = self.event.end_time
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.user.name} ({self.user.email}) for {self.event.name}"
+
+
+class EventTombstone(models.Model):
+    """
+    Marks a deleted event so clients syncing through the change feed can drop their copy.
+
+    Fields:
+        - event_id: Primary key of the deleted event.
+        - deleted_at: When the event was deleted (or archived out of the hot table).
+    """
+    event_id = models.BigIntegerField(unique=True)
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['deleted_at', 'event_id'], name='event_tombstone_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f"Event {self.event_id} deleted at {self.deleted_at}"
+
+
+class ArchivedEvent(TimeStampedModel):
+    """
+    Cold-tier copy of an `Event` whose end time has passed.
+
+    Rows are moved here by the `archive_past_events` command, keeping their
+    original primary key and timestamps. The columns mirror `Event` in the same
+    order so both tables can be combined with a SQL UNION (see `events.archive`).
+
+    Fields:
+        - archived_at: When the event was moved out of the hot table.
+
+    Series themselves are never archived, only their materialized occurrences,
+    so `series` points into the hot table without a database constraint.
+    """
+    creator = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_events'
+    )
+    name = models.CharField(max_length=255)
+    location = models.CharField(max_length=255)
+    start_time = models.DateTimeField()
+    end_time = models.DateTimeField()
+    max_capacity = models.PositiveIntegerField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    recurrence = models.CharField(max_length=7, choices=Event.RECURRENCE_CHOICES, blank=True, default='')
+    recurrence_interval = models.PositiveSmallIntegerField(default=1)
+    recurrence_until = models.DateTimeField(null=True, blank=True)
+    recurrence_timezone = models.CharField(max_length=64, blank=True, default='')
+    series = models.ForeignKey(
+        Event,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name='archived_occurrences'
+    )
+    occurrence_start = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.start_time} - {self.end_time}) [archived]"
+
+
+class CancelledOccurrence(models.Model):
+    """
+    An occurrence left out of a recurring event's series (an exception date).
+
+    Fields:
+        - series: The recurring event.
+        - occurrence_start: Start of the cancelled occurrence in the series.
+    """
+    series = models.ForeignKey(
+        Event,
+        on_delete=models.CASCADE,
+        related_name='cancelled_occurrences'
+    )
+    occurrence_start = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['series', 'occurrence_start'], name='cancelled_occurrence_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.series_id} cancelled at {self.occurrence_start}"
+
+
+class ArchivedAttendee(TimeStampedModel):
+    """
+    Cold-tier copy of an `Attendee` registration for an archived event.
+    """
+    event = models.ForeignKey(
+        ArchivedEvent,
+        on_delete=models.CASCADE,
+        related_name='attendees'
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_attendees'
+    )
+    event_start = models.DateTimeField(null=True, editable=False)
+    event_end = models.DateTimeField(null=True, editable=False)
+
+    class Meta:
+        unique_together = ('event', 'user')
+        indexes = [
+            models.Index(fields=['user', 'event'], name='archived_attendee_user_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} for archived event {self.event_id}"
+
+
+class RegistrationStat(models.Model):
+    """
+    Rollup of registrations per event and time bucket, maintained incrementally
+    by `events.stats` so reporting never has to aggregate `Attendee` rows.
+
+    Fields:
+        - event: The event the registrations belong to.
+        - granularity: Bucket size, hourly or daily (UTC boundaries).
+        - bucket_start: Start of the bucket.
+        - count: Registrations made within the bucket.
+
+    Buckets outlive the move of their event to `ArchivedEvent` (same id), so the
+    foreign key has no database constraint; they are deleted with the event
+    itself (see `events.signals`).
+    """
+    HOUR = 'hour'
+    DAY = 'day'
+    GRANULARITY_CHOICES = [(HOUR, 'Hourly'), (DAY, 'Daily')]
+
+    event = models.ForeignKey(
+        Event,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name='registration_stats'
+    )
+    granularity = models.CharField(max_length=4, choices=GRANULARITY_CHOICES)
+    bucket_start = models.DateTimeField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['event', 'granularity', 'bucket_start'],
+                name='registration_stat_bucket_unique',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.event_id} {self.granularity} {self.bucket_start}: {self.count}"
+
+
+class StagedEvent(models.Model):
+    """
+    Staging row of an event being imported by the `import_events` command.
+
+    Rows are loaded in bulk (COPY on PostgreSQL), validated with set-based SQL and
+    then copied into `Event`; see `events.imports`. Columns are nullable so that
+    rows failing to parse can be staged too and show up in the rejects report.
+
+    Fields:
+        - batch: Import run the row belongs to.
+        - line: Line (or record) number in the source file.
+        - ref: Source system identifier, referenced by the attendee rows.
+        - creator_email: Email of the existing user creating the event.
+        - creator_id, event_id: Resolved creator and allocated `Event` primary key.
+        - error: Why the row is rejected, or null.
+    """
+    batch = models.UUIDField()
+    line = models.PositiveIntegerField()
+    ref = models.CharField(max_length=255, null=True)
+    creator_email = models.CharField(max_length=254, null=True)
+    name = models.CharField(max_length=255, null=True)
+    location = models.CharField(max_length=255, null=True)
+    start_time = models.DateTimeField(null=True)
+    end_time = models.DateTimeField(null=True)
+    max_capacity = models.PositiveIntegerField(null=True)
+    creator_id = models.BigIntegerField(null=True)
+    event_id = models.BigIntegerField(null=True)
+    error = models.CharField(max_length=255, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['batch', 'ref', 'line'], name='staged_event_ref_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.batch} line {self.line}: {self.ref}"
+
+
+class StagedAttendee(models.Model):
+    """
+    Staging row of a registration being imported by the `import_events` command.
+
+    Fields:
+        - batch: Import run the row belongs to.
+        - line: Line (or record) number in the source file.
+        - event_ref: `StagedEvent.ref` of the event, from the same batch, or the id of an existing event.
+        - user_email: Email of the existing user attending.
+        - created_at: Registration time (default: time of the import).
+        - event_id, user_id: Resolved `Event` and user primary keys (staged with the
+          numeric value of `event_ref`, if any, until resolved).
+        - error: Why the row is rejected, or null.
+    """
+    batch = models.UUIDField()
+    line = models.PositiveIntegerField()
+    event_ref = models.CharField(max_length=255, null=True)
+    user_email = models.CharField(max_length=254, null=True)
+    created_at = models.DateTimeField(null=True)
+    event_id = models.BigIntegerField(null=True)
+    user_id = models.BigIntegerField(null=True)
+    error = models.CharField(max_length=255, null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['batch', 'event_ref'], name='staged_attendee_ref_idx'),
+            models.Index(fields=['batch', 'event_id', 'user_id', 'line'], name='staged_attendee_pair_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.batch} line {self.line}: {self.user_email} for {self.event_ref}"
@@ -0,0 +1,66 @@
+import heapq
+from collections import defaultdict
+
+from django.db import connections
+from django.db.models import Func
+from django.utils import timezone
+
+from events.models import Event, Attendee
+
+
+def overlapping_registrations(user, start, end):
+    """
+    Returns the registrations of a user whose event overlaps the half-open period `[start, end)`.
+
+    On PostgreSQL the query uses the `&&` range operator, answered by the GiST index
+    on `(user_id, tstzrange(event_start, event_end))`. Elsewhere it is a range scan
+    on `attendee_user_period_idx`: only the user's registrations ending after `start`
+    are visited, which excludes their past events however long the history is.
+    """
+    registrations = Attendee.objects.filter(user=user)
+    if connections[registrations.db].vendor == 'postgresql':
+        from django.contrib.postgres.fields import DateTimeRangeField, RangeBoundary
+
+        period = Func(
+            'event_start', 'event_end', RangeBoundary(),
+            function='TSTZRANGE', output_field=DateTimeRangeField(),
+        )
+        return registrations.alias(period=period).filter(period__overlap=(start, end))
+
+    return registrations.filter(event_end__gt=start, event_start__lt=end)
+
+
+def get_conflicts(user, include_past=False):
+    """
+    Finds the user's registrations that overlap each other.
+
+    The registrations are read in start order from the user's period index and
+    swept once, keeping a heap of the periods still open, so the cost is
+    O(n log n) in the user's registrations plus the number of overlapping pairs.
+
+    Returns:
+        list: `{"event": Event, "overlaps": [event ids]}` for each conflicting event, in start order.
+    """
+    registrations = Attendee.objects.filter(user=user, event_start__isnull=False)
+    if not include_past:
+        registrations = registrations.filter(event_end__gt=timezone.now())
+    rows = registrations.order_by('event_start', 'event_id').values_list('event_id', 'event_start', 'event_end')
+
+    overlaps = defaultdict(set)
+    order = []
+    open_periods = []
+    for event_id, start, end in rows:
+        while open_periods and open_periods[0][0] <= start:
+            heapq.heappop(open_periods)
+        for _, other_id in open_periods:
+            overlaps[event_id].add(other_id)
+            overlaps[other_id].add(event_id)
+        heapq.heappush(open_periods, (end, event_id))
+        order.append(event_id)
+
+    events = Event.objects.in_bulk(list(overlaps))
+    return [
+        {"event": events[event_id], "overlaps": sorted(overlaps[event_id])}
+        for event_id in order
+        if event_id in overlaps and event_id in events
+    ]
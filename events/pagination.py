@@ -0,0 +1,48 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class EventCursorPagination(CursorPagination):
+    """
+    Keyset pagination over `(start_time, id)`, served by the start-time indexes on `Event`.
+    Unlike page numbers, the cost of a page does not grow with its depth.
+    """
+    ordering = ('start_time', 'id')
+
+
+class CachedPageNumberPagination(PageNumberPagination):
+    """
+    Page number pagination for pages cached apart from the request that computed them:
+    a page is identified by its normalized number and size only, and the `next` and
+    `previous` links (which carry the host and the other query parameters) are built
+    for each request from the cached count.
+    """
+
+    def get_page_key(self, request):
+        """
+        Returns `(page number, page size)` of the request, or None when the page is not
+        given as a positive integer (`last` or invalid), which is left uncached.
+        """
+        page_number = str(self.get_page_number(request, self))
+        if not page_number.isdigit() or int(page_number) < 1:
+            return None
+        return int(page_number), self.get_page_size(request)
+
+    def get_cached_response(self, request, page_key, count, results):
+        page_number, page_size = page_key
+        url = request.build_absolute_uri()
+        next_link = None
+        if page_number * page_size < count:
+            next_link = replace_query_param(url, self.page_query_param, page_number + 1)
+        previous_link = None
+        if page_number == 2:
+            previous_link = remove_query_param(url, self.page_query_param)
+        elif page_number > 2:
+            previous_link = replace_query_param(url, self.page_query_param, page_number - 1)
+        return Response({
+            'count': count,
+            'next': next_link,
+            'previous': previous_link,
+            'results': results,
+        })
@@ -0,0 +1,10 @@
+from rest_framework.permissions import BasePermission
+
+
+class IsCreatorOrStaff(BasePermission):
+    """
+    Allows access to an event (hot or archived) only to its creator and staff users.
+    """
+
+    def has_object_permission(self, request, view, obj):
+        return request.user.is_staff or obj.creator_id == request.user.pk
@@ -0,0 +1,323 @@
+import heapq
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.utils import timezone
+
+from events.models import Event, Attendee, ArchivedEvent, CancelledOccurrence
+
+
+STEP_DAYS = {
+    Event.DAILY: 1,
+    Event.WEEKLY: 7,
+}
+
+# Fields a series passes on to its materialized occurrences when edited.
+SERIES_FIELDS = ('name', 'location', 'max_capacity')
+RULE_FIELDS = ('start_time', 'end_time', 'recurrence', 'recurrence_interval', 'recurrence_until', 'recurrence_timezone')
+
+
+def _add_months(value, months):
+    """
+    Returns `value` shifted by whole months, or None when the day does not exist in that month.
+    """
+    month = value.month - 1 + months
+    try:
+        return value.replace(year=value.year + month // 12, month=month % 12 + 1)
+    except ValueError:
+        return None
+
+
+def _get_timezone(event):
+    return ZoneInfo(event.recurrence_timezone or settings.TIME_ZONE)
+
+
+def _to_local(event, value):
+    return value.astimezone(_get_timezone(event)).replace(tzinfo=None)
+
+
+def _get_index(event, value):
+    """
+    Returns the index of the last occurrence of a series starting on or before the
+    local day of `value`; exact when `value` is the start of an occurrence.
+    """
+    first, local = _to_local(event, event.start_time), _to_local(event, value)
+    interval = max(event.recurrence_interval, 1)
+    if event.recurrence in STEP_DAYS:
+        return (local.date() - first.date()).days // (STEP_DAYS[event.recurrence] * interval)
+    return ((local.year - first.year) * 12 + local.month - first.month) // interval
+
+
+def _get_local_start(event, index):
+    """
+    Returns the naive local start of the `index`-th occurrence of a series, or None
+    when its day does not exist (the 31st of a shorter month).
+    """
+    first = _to_local(event, event.start_time)
+    interval = max(event.recurrence_interval, 1)
+    if event.recurrence in STEP_DAYS:
+        return first + timedelta(days=STEP_DAYS[event.recurrence] * interval * index)
+    return _add_months(first, index * interval)
+
+
+def iter_occurrence_starts(event, start, end):
+    """
+    Lazily yields the start of every occurrence of a series in `[start, end)`, in order.
+
+    Occurrences repeat in wall-clock time of the series' timezone, so a weekly 19:00
+    meetup stays at 19:00 across DST changes. Occurrences before the window are
+    skipped arithmetically rather than generated, so the cost is proportional to the
+    window, not to the age of the series. Nothing here touches the database.
+    """
+    if event.recurrence not in (*STEP_DAYS, Event.MONTHLY):
+        return
+    tzinfo = _get_timezone(event)
+    until = event.recurrence_until
+    if start < event.start_time:
+        start = event.start_time
+
+    index = max(_get_index(event, start), 0)
+    while True:
+        local = _get_local_start(event, index)
+        index += 1
+        if local is None:
+            continue
+        occurrence = local.replace(tzinfo=tzinfo)
+        if occurrence >= end or (until is not None and occurrence > until):
+            return
+        if occurrence >= start:
+            yield occurrence
+
+
+def is_occurrence_start(series, start):
+    """
+    Returns whether a series has an occurrence starting exactly at `start`.
+    """
+    return next(iter_occurrence_starts(series, start, start + timedelta(microseconds=1)), None) == start
+
+
+def build_occurrence(series, start):
+    """
+    Returns an unsaved `Event` standing for the occurrence of a series starting at `start`.
+    """
+    occurrence = Event(
+        creator_id=series.creator_id,
+        name=series.name,
+        location=series.location,
+        start_time=start,
+        end_time=start + (series.end_time - series.start_time),
+        max_capacity=series.max_capacity,
+        series_id=series.pk,
+        occurrence_start=start,
+        created_at=series.created_at,
+        updated_at=series.updated_at,
+    )
+    creator_field = Event._meta.get_field('creator')
+    if creator_field.is_cached(series):
+        creator_field.set_cached_value(occurrence, creator_field.get_cached_value(series))
+    return occurrence
+
+
+def get_series(start, end):
+    """
+    Returns the recurring events that may have occurrences starting in `[start, end)`.
+    """
+    return Event.objects.exclude(recurrence='').filter(
+        Q(recurrence_until__isnull=True) | Q(recurrence_until__gte=start),
+        start_time__lt=end,
+    )
+
+
+def get_occurrences(start, end, series=None):
+    """
+    Yields the virtual (not materialized, not cancelled) occurrences of recurring
+    events starting in `[start, end)`, as unsaved `Event` instances in start order.
+
+    Materialized occurrences are real `Event` rows and are read along with the
+    other events, so they are left out here. The whole expansion costs a fixed
+    number of queries - the series, their materialized and cancelled occurrences -
+    however many occurrences the window holds.
+    """
+    series = list(get_series(start, end) if series is None else series)
+    if not series:
+        return
+
+    ids = [event.pk for event in series]
+    taken = set(
+        Event.objects.filter(series_id__in=ids, occurrence_start__gte=start, occurrence_start__lt=end)
+        .values_list('series_id', 'occurrence_start')
+        .union(
+            ArchivedEvent.objects.filter(series_id__in=ids, occurrence_start__gte=start, occurrence_start__lt=end)
+            .values_list('series_id', 'occurrence_start'),
+            CancelledOccurrence.objects.filter(series_id__in=ids, occurrence_start__gte=start, occurrence_start__lt=end)
+            .values_list('series_id', 'occurrence_start'),
+        )
+    )
+
+    def expand(event):
+        for occurrence_start in iter_occurrence_starts(event, start, end):
+            if (event.pk, occurrence_start) not in taken:
+                yield build_occurrence(event, occurrence_start)
+
+    yield from heapq.merge(*(expand(event) for event in series), key=lambda event: (event.start_time, event.series_id))
+
+
+def get_occurrence(series, start):
+    """
+    Returns the occurrence of a series starting at `start`: its materialized `Event`
+    if there is one, else an unsaved one. Returns None when the series has no
+    such occurrence or it was cancelled.
+    """
+    materialized = Event.objects.filter(series=series, occurrence_start=start).first()
+    if materialized:
+        return materialized
+    if CancelledOccurrence.objects.filter(series=series, occurrence_start=start).exists():
+        return None
+    if not is_occurrence_start(series, start):
+        return None
+    return build_occurrence(series, start)
+
+
+def materialize(occurrence):
+    """
+    Saves an occurrence built by `build_occurrence`, or returns the row a
+    concurrent request saved first.
+    """
+    try:
+        with transaction.atomic():
+            occurrence.save()
+            return occurrence
+    except IntegrityError:
+        return Event.objects.get(series_id=occurrence.series_id, occurrence_start=occurrence.occurrence_start)
+
+
+def get_series_state(pk):
+    """
+    Returns the stored state of a series (None for other events), to compare with
+    an edited instance in `sync_occurrences`.
+    """
+    return Event.objects.filter(pk=pk, series__isnull=True).exclude(recurrence='').only(
+        *RULE_FIELDS, *SERIES_FIELDS
+    ).first()
+
+
+def remap_occurrence_start(previous, series, start):
+    """
+    Returns the start that the occurrence of `previous` (a series before an edit)
+    starting at `start` has in the edited `series`, or None when it has no such
+    occurrence anymore.
+
+    An occurrence keeps its position in the series when the repeat rule is kept
+    (so moving the series moves every occurrence), and its local day otherwise.
+    """
+    if not series.recurrence:
+        return None
+    if (previous.recurrence, previous.recurrence_interval) == (series.recurrence, series.recurrence_interval):
+        local = _get_local_start(series, _get_index(previous, start))
+    else:
+        local = datetime.combine(_to_local(previous, start).date(), _to_local(series, series.start_time).time())
+    if local is None:
+        return None
+    moved = local.replace(tzinfo=_get_timezone(series))
+    return moved if is_occurrence_start(series, moved) else None
+
+
+def sync_occurrences(previous, series):
+    """
+    Applies an edit of a series to its materialized occurrences and cancellations.
+
+    Occurrences are moved to their start in the edited series (with the
+    registrations' copy of their period) or deleted when the series no longer
+    has them. Times, duration and `SERIES_FIELDS` are only passed on to
+    occurrences that still have the series' previous value, so changes made to
+    a single occurrence are kept.
+
+    Returns:
+        list: Ids of the occurrences that were updated.
+    """
+    if all(getattr(previous, field) == getattr(series, field) for field in (*RULE_FIELDS, *SERIES_FIELDS)):
+        return []
+
+    previous_length = previous.end_time - previous.start_time
+    now = timezone.now()
+    updated, removed = [], []
+    for occurrence in Event.objects.filter(series=series):
+        start = remap_occurrence_start(previous, series, occurrence.occurrence_start)
+        if start is None:
+            removed.append(occurrence)
+            continue
+
+        length = occurrence.end_time - occurrence.start_time
+        if length == previous_length:
+            length = series.end_time - series.start_time
+        if occurrence.start_time == occurrence.occurrence_start:
+            occurrence.start_time = start
+        occurrence.end_time = occurrence.start_time + length
+        occurrence.occurrence_start = start
+        for field in SERIES_FIELDS:
+            if getattr(occurrence, field) == getattr(previous, field):
+                setattr(occurrence, field, getattr(series, field))
+        occurrence.updated_at = now
+        updated.append(occurrence)
+
+    cancellations = []
+    for cancellation in CancelledOccurrence.objects.filter(series=series):
+        start = remap_occurrence_start(previous, series, cancellation.occurrence_start)
+        if start is not None:
+            cancellations.append(CancelledOccurrence(series=series, occurrence_start=start))
+
+    with transaction.atomic():
+        for occurrence in removed:
+            occurrence.delete()
+        # Clear the starts first: occurrences may move onto each other's previous start.
+        Event.objects.filter(pk__in=[occurrence.pk for occurrence in updated]).update(occurrence_start=None)
+        Event.objects.bulk_update(
+            updated, ['start_time', 'end_time', 'occurrence_start', *SERIES_FIELDS, 'updated_at']
+        )
+        events = Event.objects.filter(pk=OuterRef('event_id'))
+        Attendee.objects.filter(event__series=series).update(
+            event_start=Subquery(events.values('start_time')),
+            event_end=Subquery(events.values('end_time')),
+        )
+        CancelledOccurrence.objects.filter(series=series).delete()
+        CancelledOccurrence.objects.bulk_create(cancellations)
+
+    return [occurrence.pk for occurrence in updated]
+
+
+def merge_by_start(*iterables):
+    """
+    Merges start-ordered iterables of events (saved or virtual) into one start-ordered iterator.
+    """
+    return heapq.merge(*iterables, key=lambda event: (event.start_time, event.pk or 0))
+
+
+class EventWindow:
+    """
+    The stored events and virtual occurrences starting in a window, in start order,
+    as a sequence Django's paginator can slice.
+
+    Stored events come from a `(start_time, id)` ordered queryset and are read only
+    up to the end of the requested slice; occurrences are expanded once.
+    """
+
+    def __init__(self, queryset, occurrences):
+        self.queryset = queryset
+        self.occurrences = list(occurrences)
+
+    def count(self):
+        return self.queryset.count() + len(self.occurrences)
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index:index + 1][0]
+        stop = index.stop if index.stop is not None else self.count()
+        merged = merge_by_start(self.queryset[:stop], self.occurrences)
+        return [event for _, event in zip(range(stop), merged)][index]
+
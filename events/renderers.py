@@ -0,0 +1,20 @@
+from rest_framework.renderers import BaseRenderer
+
+
+class ICalendarRenderer(BaseRenderer):
+    """
+    Renderer for `text/calendar` responses.
+
+    Feed views return ready-made HTTP responses, so this only takes part in content
+    negotiation; error payloads are rendered as plain text.
+    """
+    media_type = 'text/calendar'
+    format = 'ics'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if isinstance(data, dict) and 'detail' in data:
+            data = data['detail']
+        return str(data).encode(self.charset)
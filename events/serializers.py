@@ -1,15 +1,36 @@
 from rest_framework import serializers
 
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.db import transaction
+
+from event_management.utils.loaders import BatchLoadingListSerializer, BatchLoadingSerializerMixin, get_loader
 from event_management.utils.timezone import convert_to_timezone
+from accounts.models import User
 from accounts.serializers import UserSerializer
 from events.models import Event, Attendee
+from events.overlaps import overlapping_registrations
+from events.recurrence import get_occurrence, materialize
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventListSerializer(BatchLoadingListSerializer):
+    """
+    Creates many events with a single `bulk_create`, in the order they were given.
+    Validation still runs per item, so errors are reported per item.
+    """
+
+    def create(self, validated_data):
+        creator = self.context['request'].user
+        return Event.objects.bulk_create([Event(creator=creator, **attrs) for attrs in validated_data])
+
+
+class EventSerializer(BatchLoadingSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for Event model.
     Sets creator to the authenticated user from request context.
-    Validates that end_time is after start_time.
+    Validates that end_time is after start_time, and the recurrence of recurring events.
+    Occurrences of a series that are not stored yet are returned with a null `id`.
     """
     creator = UserSerializer(read_only=True)
 
@@ -23,11 +44,29 @@ class EventSerializer(serializers.ModelSerializer):
             'start_time',
             'end_time',
             'max_capacity',
+            'recurrence',
+            'recurrence_interval',
+            'recurrence_until',
+            'recurrence_timezone',
+            'series',
+            'occurrence_start',
         ]
+        read_only_fields = ['series', 'occurrence_start']
+        list_serializer_class = EventListSerializer
 
     def validate(self, attrs):
         if attrs['end_time'] <= attrs['start_time']:
             raise serializers.ValidationError('End time must be after start time.')
+
+        if attrs.get('recurrence_interval', 1) < 1:
+            raise serializers.ValidationError({"recurrence_interval": "Must be at least 1."})
+        if attrs.get('recurrence_until') and attrs['recurrence_until'] < attrs['start_time']:
+            raise serializers.ValidationError({"recurrence_until": "Must not be before start time."})
+        if attrs.get('recurrence_timezone'):
+            try:
+                ZoneInfo(attrs['recurrence_timezone'])
+            except (ValueError, ZoneInfoNotFoundError) as e:
+                raise serializers.ValidationError({"recurrence_timezone": "Unknown timezone."}) from e
         return attrs
 
     def create(self, validated_data):
@@ -43,6 +82,9 @@ class EventSerializer(serializers.ModelSerializer):
             try:
                 data["start_time"] = convert_to_timezone(instance.start_time, tz).isoformat()
                 data["end_time"] = convert_to_timezone(instance.end_time, tz).isoformat()
+                for field in ("recurrence_until", "occurrence_start"):
+                    if getattr(instance, field):
+                        data[field] = convert_to_timezone(getattr(instance, field), tz).isoformat()
             except Exception:
                 # fallback: leave the original
                 pass
@@ -50,40 +92,131 @@ class EventSerializer(serializers.ModelSerializer):
         return data
 
 
-class AttendeeSerializer(serializers.ModelSerializer):
+class AttendeeSerializer(BatchLoadingSerializerMixin, serializers.ModelSerializer):
     """
     Serializer for registering an attendee to an event.
     Enforces the following:
     - Event creator cannot register as attendee.
     - User cannot register more than once for the same event.
     - Event must not exceed its max capacity.
+    - With `EVENTS_REJECT_OVERLAPPING_REGISTRATIONS`, the event must not overlap another
+      event the user attends. The check is repeated in `create` with the user's row locked,
+      so concurrent registrations of one user cannot both pass it.
+    - For a recurring event, `occurrence` must be the start of one of its (not cancelled)
+      occurrences; the registration is for that occurrence, which is stored on first use.
     """
     event = EventSerializer(read_only=True)
+    occurrence = serializers.DateTimeField(write_only=True, required=False)
 
     class Meta:
         model = Attendee
-        fields = ['id', 'event', 'user', 'created_at', 'updated_at']
+        fields = ['id', 'event', 'user', 'occurrence', 'created_at', 'updated_at']
         read_only_fields = ['event', 'created_at', 'updated_at']
+        list_serializer_class = BatchLoadingListSerializer
 
     def validate(self, attrs):
         attrs = super().validate(attrs)
 
         event_id = self.context['view'].kwargs['event_id']
-        try:
-            event = Event.objects.prefetch_related('attendees__user').get(id=event_id)
-        except Event.DoesNotExist as e:
-            raise serializers.ValidationError("Event does not exist.") from e
+        event = get_loader(self.context.get('request')).load(Event, int(event_id))
+        if event is None:
+            raise serializers.ValidationError("Event does not exist.")
+
+        occurrence = attrs.pop('occurrence', None)
+        if event.recurrence:
+            if occurrence is None:
+                raise serializers.ValidationError({"occurrence": "Required to register for a recurring event."})
+            event = get_occurrence(event, occurrence)
+            if event is None:
+                raise serializers.ValidationError({"occurrence": "The event has no such occurrence."})
+        elif occurrence is not None:
+            raise serializers.ValidationError({"occurrence": "The event is not recurring."})
 
         user = attrs['user']
         attrs['event'] = event
+        # A virtual occurrence has no registrations yet.
+        registrations = event.attendees if event.pk is not None else Attendee.objects.none()
 
-        if user == event.creator:
+        if user.pk == event.creator_id:
             raise serializers.ValidationError("Event creator cannot register as an attendee.")
 
-        if event.attendees.filter(user=user).exists():
+        if registrations.filter(user=user).exists():
             raise serializers.ValidationError("This user is already registered for the event.")
 
-        if event.attendees.count() >= event.max_capacity:
+        if settings.EVENTS_REJECT_OVERLAPPING_REGISTRATIONS:
+            self.check_overlap(user, event)
+
+        if registrations.count() >= event.max_capacity:
             raise serializers.ValidationError("Event is full. Max capacity reached.")
 
         return attrs
+
+    def check_overlap(self, user, event):
+        if overlapping_registrations(user, event.start_time, event.end_time).exists():
+            raise serializers.ValidationError("This user is already registered for an overlapping event.")
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            if settings.EVENTS_REJECT_OVERLAPPING_REGISTRATIONS:
+                # Serializes the user's registrations until commit, then checks again.
+                User.objects.select_for_update().filter(pk=validated_data['user'].pk).values_list('pk').get()
+                self.check_overlap(validated_data['user'], validated_data['event'])
+            if validated_data['event'].pk is None:
+                validated_data['event'] = materialize(validated_data['event'])
+            return super().create(validated_data)
+
+
+class RegistrationBucketSerializer(serializers.Serializer):
+    """
+    One bucket of the registration time series.
+    """
+    start = serializers.DateTimeField()
+    count = serializers.IntegerField()
+    cumulative = serializers.IntegerField()
+
+
+class EventStatsSerializer(serializers.Serializer):
+    """
+    Read-only serializer for the registration statistics of an event.
+    Datetimes are converted to the optional `tz` query parameter like in `EventSerializer`.
+    """
+    registrations = serializers.IntegerField()
+    fill_rate = serializers.FloatField(allow_null=True)
+    sold_out_at = serializers.DateTimeField(allow_null=True)
+    time_to_sellout = serializers.FloatField(allow_null=True, help_text="Seconds from event creation to sell-out")
+    buckets = RegistrationBucketSerializer(many=True)
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        tz = self.context['request'].query_params.get("tz")
+
+        if tz:
+            if instance["sold_out_at"]:
+                data["sold_out_at"] = convert_to_timezone(instance["sold_out_at"], tz).isoformat()
+            for bucket, raw in zip(data["buckets"], instance["buckets"]):
+                bucket["start"] = convert_to_timezone(raw["start"], tz).isoformat()
+
+        return data
+
+
+class EventConflictSerializer(BatchLoadingSerializerMixin, serializers.Serializer):
+    """
+    A registered event together with the ids of the user's other events overlapping it.
+    """
+    event = EventSerializer()
+    overlaps = serializers.ListField(child=serializers.IntegerField())
+
+    class Meta:
+        list_serializer_class = BatchLoadingListSerializer
+
+
+class CalendarDaySerializer(BatchLoadingSerializerMixin, serializers.Serializer):
+    """
+    One local day of the calendar grid: its number of events and the first few of them.
+    """
+    date = serializers.DateField()
+    count = serializers.IntegerField()
+    events = EventSerializer(many=True)
+
+    class Meta:
+        list_serializer_class = BatchLoadingListSerializer
@@ -0,0 +1,148 @@
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from accounts.models import User
+from events.cache import invalidate_attendee_pages, invalidate_event, invalidate_events
+from events.feeds import invalidate_feeds
+from events.live import broadcaster, publish_capacity
+from events.models import Event, Attendee, ArchivedEvent, CancelledOccurrence, EventTombstone, RegistrationStat
+from events.recurrence import get_series_state, sync_occurrences
+from events.stats import record_registration, remove_registration
+
+
+@receiver([post_save, post_delete], sender=Attendee)
+def invalidate_attendee_feed(sender, instance, **kwargs):
+    """
+    Registering or unregistering changes the attendee's calendar feed.
+    """
+    invalidate_feeds([instance.user_id])
+
+
+@receiver([post_save, post_delete], sender=Event)
+def invalidate_event_feeds(sender, instance, created=False, **kwargs):
+    """
+    A changed event appears in the feed of its creator and of every attendee.
+    """
+    user_ids = [instance.creator_id]
+    if not created:
+        user_ids += Attendee.objects.filter(event_id=instance.pk).values_list('user_id', flat=True)
+    invalidate_feeds(user_ids)
+
+
+@receiver([post_save, post_delete], sender=CancelledOccurrence)
+def invalidate_series_feed(sender, instance, **kwargs):
+    """
+    A cancelled occurrence is an EXDATE in the feed of the series' creator.
+    """
+    invalidate_feeds(Event.objects.filter(pk=instance.series_id).values_list('creator_id', flat=True))
+
+
+@receiver(post_save, sender=Event)
+def sync_registration_periods(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Keeps the period copied onto `Attendee` rows in step with a rescheduled event.
+    """
+    period = {'start_time', 'end_time'}
+    if not created and (instance.has_changed(*period) or period & set(update_fields or ())):
+        (
+            Attendee.objects
+            .filter(event_id=instance.pk)
+            .exclude(event_start=instance.start_time, event_end=instance.end_time)
+            .update(event_start=instance.start_time, event_end=instance.end_time)
+        )
+
+
+@receiver(pre_save, sender=Event)
+def remember_series_state(sender, instance, raw=False, **kwargs):
+    """
+    Keeps the stored state of an edited series, so `sync_series_occurrences` can tell what changed.
+    """
+    if raw or instance._state.adding or instance.series_id is not None:
+        return
+    # Only a series (before or after the edit) has occurrences to sync.
+    if instance.recurrence or instance.has_changed('recurrence'):
+        instance._previous_series = get_series_state(instance.pk)
+
+
+@receiver(post_save, sender=Event)
+def sync_series_occurrences(sender, instance, created, **kwargs):
+    """
+    Passes an edit of a series on to its materialized occurrences (see `events.recurrence.sync_occurrences`).
+    """
+    previous = instance.__dict__.pop('_previous_series', None)
+    if previous is not None:
+        updated = sync_occurrences(previous, instance)
+        for event_id in updated:
+            invalidate_event(event_id)
+        invalidate_feeds(Attendee.objects.filter(event_id__in=updated).values_list('user_id', flat=True))
+
+
+@receiver([post_save, post_delete], sender=Event)
+def invalidate_cached_event(sender, instance, **kwargs):
+    invalidate_event(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def invalidate_cached_user_details(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """
+    Cached events embed their creator and attendee pages list their users, so an
+    edited profile drops the entries of the user's events and of the events they attend.
+    """
+    if created or raw or (update_fields is not None and not {'name', 'email'} & update_fields):
+        return
+    event_ids = {
+        *Event.objects.filter(creator=instance).values_list('pk', flat=True),
+        *Attendee.objects.filter(user=instance).values_list('event_id', flat=True),
+    }
+    invalidate_events(event_ids)
+
+
+@receiver([post_save, post_delete], sender=Attendee)
+def invalidate_cached_attendee_pages(sender, instance, **kwargs):
+    invalidate_attendee_pages(instance.event_id)
+
+
+@receiver(post_delete, sender=Event)
+def record_event_tombstone(sender, instance, **kwargs):
+    """
+    Leaves a tombstone so the change feed can report the deletion.
+    """
+    EventTombstone.objects.update_or_create(event_id=instance.pk, defaults={'deleted_at': timezone.now()})
+
+
+@receiver(post_delete, sender=Event)
+@receiver(post_delete, sender=ArchivedEvent)
+def delete_registration_stats(sender, instance, **kwargs):
+    """
+    Stats have no database constraint (they outlive archiving), so they are deleted with their event here.
+    """
+    RegistrationStat.objects.filter(event_id=instance.pk).delete()
+
+
+@receiver(post_save, sender=Attendee)
+def count_registration(sender, instance, created, raw=False, **kwargs):
+    """
+    Adds a new registration, from the API or the admin, to the stats rollup.
+    """
+    if created and not raw:
+        record_registration(instance.event_id, instance.created_at)
+
+
+@receiver(post_delete, sender=Attendee)
+def uncount_registration(sender, instance, **kwargs):
+    """
+    Takes a deleted registration (directly or through a cascade) out of the stats rollup.
+    """
+    remove_registration(instance.event_id, instance.created_at)
+
+
+@receiver([post_save, post_delete], sender=Attendee)
+def push_capacity_update(sender, instance, **kwargs):
+    """
+    Pushes the new attendee count to live subscribers once the registration commits.
+    """
+    event_id = instance.event_id
+    if broadcaster.has_subscribers(event_id):
+        transaction.on_commit(lambda: publish_capacity(event_id))
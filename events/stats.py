@@ -0,0 +1,153 @@
+from datetime import timedelta, timezone as dt_timezone
+
+from django.db import IntegrityError, connections, transaction
+from django.db.models import Count, F, Value
+from django.db.models.functions import TruncDay, TruncHour
+
+from events.models import Attendee, ArchivedAttendee, RegistrationStat
+
+
+BUCKET_SIZES = {
+    RegistrationStat.HOUR: timedelta(hours=1),
+    RegistrationStat.DAY: timedelta(days=1),
+}
+TRUNCATE = {
+    RegistrationStat.HOUR: TruncHour,
+    RegistrationStat.DAY: TruncDay,
+}
+
+
+def get_bucket_starts(registered_at):
+    """
+    Returns the hourly and daily bucket starts (UTC) containing a registration time.
+    """
+    hour = registered_at.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+    return {
+        RegistrationStat.HOUR: hour,
+        RegistrationStat.DAY: hour.replace(hour=0),
+    }
+
+
+def record_registration(event_id, registered_at):
+    """
+    Increments the hourly and daily buckets of a new registration.
+
+    Runs from the `Attendee` post_save signal, inside the transaction that creates
+    the row (if any), so the rollup commits or rolls back together with it.
+    """
+    for granularity, bucket_start in get_bucket_starts(registered_at).items():
+        bucket = RegistrationStat.objects.filter(
+            event_id=event_id, granularity=granularity, bucket_start=bucket_start
+        )
+        if bucket.update(count=F('count') + 1):
+            continue
+        try:
+            with transaction.atomic():
+                RegistrationStat.objects.create(
+                    event_id=event_id, granularity=granularity, bucket_start=bucket_start, count=1
+                )
+        except IntegrityError:
+            # A concurrent registration created the bucket first.
+            bucket.update(count=F('count') + 1)
+
+
+def remove_registration(event_id, registered_at):
+    """
+    Decrements the hourly and daily buckets of a deleted registration, dropping emptied buckets.
+    """
+    for granularity, bucket_start in get_bucket_starts(registered_at).items():
+        bucket = RegistrationStat.objects.filter(
+            event_id=event_id, granularity=granularity, bucket_start=bucket_start
+        )
+        if not bucket.filter(count__gt=1).update(count=F('count') - 1):
+            bucket.delete()
+
+
+def rebuild_stats(event_ids):
+    """
+    Recomputes the buckets of the given events, hot or archived, from their
+    `Attendee` / `ArchivedAttendee` rows in set-based queries. Used to catch up on
+    registrations written without signals (imports, raw fixtures, bulk inserts).
+
+    Buckets are written with one INSERT ... SELECT per granularity and table, so no
+    row travels through Python however many registrations the events have.
+    """
+    with transaction.atomic():
+        RegistrationStat.objects.filter(event_id__in=event_ids).delete()
+
+        created = 0
+        for model in (Attendee, ArchivedAttendee):
+            for granularity, truncate in TRUNCATE.items():
+                buckets = (
+                    model.objects
+                    .filter(event_id__in=event_ids)
+                    .annotate(bucket_start=truncate('created_at', tzinfo=dt_timezone.utc))
+                    .values('event_id', 'bucket_start')
+                    .annotate(count=Count('id'), granularity=Value(granularity))
+                    .order_by()
+                )
+                created += _insert_from(RegistrationStat, buckets)
+    return created
+
+
+def _insert_from(model, queryset):
+    """
+    Runs `INSERT INTO <model> SELECT ...` from a `values()` queryset whose names are the model's fields.
+    """
+    connection = connections[queryset.db]
+    quote = connection.ops.quote_name
+    names = [*queryset.query.values_select, *queryset.query.annotation_select]
+    columns = ', '.join(quote(model._meta.get_field(name).column) for name in names)
+    select, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {quote(model._meta.db_table)} ({columns}) {select}", params)
+        return cursor.rowcount
+
+
+def get_event_stats(event, granularity):
+    """
+    Summarizes registrations of an event from its rollup buckets, in O(buckets).
+
+    Returns:
+        dict: Total registrations, fill rate, sell-out time (hour resolution) and
+        the bucket series of the requested granularity with running totals.
+    """
+    # By id rather than through the relation, so archived events (same id) work too.
+    stats = RegistrationStat.objects.filter(event_id=event.pk)
+    buckets = list(
+        stats
+        .filter(granularity=granularity)
+        .order_by('bucket_start')
+        .values_list('bucket_start', 'count')
+    )
+    if granularity == RegistrationStat.HOUR:
+        hourly = buckets
+    else:
+        hourly = list(
+            stats
+            .filter(granularity=RegistrationStat.HOUR)
+            .order_by('bucket_start')
+            .values_list('bucket_start', 'count')
+        )
+
+    series = []
+    cumulative = 0
+    for bucket_start, count in buckets:
+        cumulative += count
+        series.append({"start": bucket_start, "count": count, "cumulative": cumulative})
+
+    sold_out_at = None
+    running = 0
+    for bucket_start, count in hourly:
+        running += count
+        if event.max_capacity and running >= event.max_capacity:
+            sold_out_at = bucket_start + BUCKET_SIZES[RegistrationStat.HOUR]
+            break
+
+    return {
+        "registrations": cumulative,
+        "fill_rate": cumulative / event.max_capacity if event.max_capacity else None,
+        "sold_out_at": sold_out_at,
+        "time_to_sellout": (sold_out_at - event.created_at).total_seconds() if sold_out_at else None,
+        "buckets": series,
+    }
@@ -0,0 +1,85 @@
+import json
+import urllib.request
+
+from django.conf import settings
+from django.core.mail import send_mail
+
+from events.models import Attendee
+from jobs.queue import enqueue, enqueue_many
+from jobs.registry import job
+
+
+SEND_REGISTRATION_CONFIRMATION = 'events.send_registration_confirmation'
+DELIVER_WEBHOOK = 'events.deliver_webhook'
+
+
+def enqueue_registration_jobs(attendee):
+    """
+    Queues the side effects of a registration. Call inside the registration's transaction.
+    """
+    enqueue(SEND_REGISTRATION_CONFIRMATION, attendee_id=attendee.pk)
+    if settings.EVENTS_WEBHOOK_URL:
+        enqueue(DELIVER_WEBHOOK, event_type='attendee.registered', data={
+            "id": attendee.pk,
+            "event": attendee.event_id,
+            "user": attendee.user_id,
+            "created_at": attendee.created_at.isoformat(),
+        })
+
+
+def enqueue_event_created_jobs(events):
+    """
+    Queues the side effects of newly created events. Call inside the creating transaction.
+    """
+    if settings.EVENTS_WEBHOOK_URL:
+        enqueue_many(DELIVER_WEBHOOK, [
+            {
+                "event_type": 'event.created',
+                "data": {
+                    "id": event.pk,
+                    "creator": event.creator_id,
+                    "name": event.name,
+                    "start_time": event.start_time.isoformat(),
+                    "end_time": event.end_time.isoformat(),
+                },
+            }
+            for event in events
+        ])
+
+
+@job(SEND_REGISTRATION_CONFIRMATION)
+def send_registration_confirmation(attendee_id):
+    attendee = Attendee.objects.select_related('user', 'event').filter(pk=attendee_id).first()
+    if attendee is None:
+        # Unregistered before the job ran.
+        return
+    event = attendee.event
+    send_mail(
+        subject=f"You're registered for {event.name}",
+        message=(
+            f"Hi {attendee.user.name},\n\n"
+            f"You are registered for {event.name} at {event.location}, "
+            f"from {event.start_time:%Y-%m-%d %H:%M} to {event.end_time:%Y-%m-%d %H:%M} UTC.\n"
+        ),
+        from_email=None,
+        recipient_list=[attendee.user.email],
+    )
+
+
+@job(DELIVER_WEBHOOK)
+def deliver_webhook(event_type, data):
+    """
+    POSTs `{"type": ..., "data": ...}` to `EVENTS_WEBHOOK_URL`. Any error or non-2xx
+    status raises, so the job is retried with backoff.
+    """
+    url = settings.EVENTS_WEBHOOK_URL
+    if not url:
+        return
+    request = urllib.request.Request(
+        url,
+        data=json.dumps({"type": event_type, "data": data}).encode(),
+        headers={'Content-Type': 'application/json'},
+        method='POST',
+    )
+    with urllib.request.urlopen(request, timeout=settings.EVENTS_WEBHOOK_TIMEOUT):
+        pass
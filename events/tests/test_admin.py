@@ -0,0 +1,49 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.tests.factories import UserFactory
+from events.tests.factories import EventFactory, AttendeeFactory
+
+
+class EventAdminQueryCountTests(TestCase):
+    """
+    Caps the number of queries of each Event/Attendee admin page, so that they
+    do not grow with the number of rows shown.
+    """
+    MAX_QUERIES = 10
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = UserFactory()
+        cls.admin_user.is_staff = True
+        cls.admin_user.is_superuser = True
+        cls.admin_user.save()
+
+        cls.events = EventFactory.create_batch(5)
+        cls.attendees = [AttendeeFactory(event=event) for event in cls.events for _ in range(4)]
+
+    def setUp(self):
+        self.client.force_login(self.admin_user)
+
+    def assertPageQueriesCapped(self, url, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(queries), self.MAX_QUERIES, [q['sql'] for q in queries])
+        return response
+
+    def test_event_pages(self):
+        self.assertPageQueriesCapped(reverse('admin:events_event_changelist'))
+        self.assertPageQueriesCapped(reverse('admin:events_event_changelist'), {'q': self.events[0].creator.email})
+        self.assertPageQueriesCapped(reverse('admin:events_event_changelist'), {'q': 'not-an-id'})
+        self.assertPageQueriesCapped(reverse('admin:events_event_add'))
+        self.assertPageQueriesCapped(reverse('admin:events_event_change', args=[self.events[0].pk]))
+
+    def test_attendee_pages(self):
+        response = self.assertPageQueriesCapped(reverse('admin:events_attendee_changelist'))
+        self.assertContains(response, self.attendees[0].user.email)
+        self.assertPageQueriesCapped(reverse('admin:events_attendee_changelist'), {'q': str(self.events[0].pk)})
+        self.assertPageQueriesCapped(reverse('admin:events_attendee_add'))
+        self.assertPageQueriesCapped(reverse('admin:events_attendee_change', args=[self.attendees[0].pk]))
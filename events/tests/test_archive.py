@@ -0,0 +1,109 @@
+from datetime import timedelta
+from io import StringIO
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.tests.factories import UserFactory
+from events.models import Event, Attendee, ArchivedEvent, ArchivedAttendee, EventTombstone, RegistrationStat
+from events.stats import rebuild_stats
+from events.tests.factories import EventFactory, AttendeeFactory
+
+
+class ArchivePastEventsTests(APITestCase):
+    """
+    Test suite for the archive tier and the `archive_past_events` command.
+    """
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+
+        self.past = EventFactory(
+            creator=self.user,
+            start_time=timezone.now() - timedelta(days=3),
+            end_time=timezone.now() - timedelta(days=2),
+        )
+        self.past_attendees = [AttendeeFactory(event=self.past) for _ in range(2)]
+        self.upcoming = EventFactory(creator=self.user)
+        AttendeeFactory(event=self.upcoming)
+
+    def archive(self, *args):
+        call_command('archive_past_events', *args, stdout=StringIO())
+
+    def test_moves_past_events_and_attendees(self):
+        self.archive('--batch-size', '1')
+
+        self.assertFalse(Event.objects.filter(pk=self.past.pk).exists())
+        self.assertFalse(Attendee.objects.filter(event_id=self.past.pk).exists())
+        self.assertTrue(Event.objects.filter(pk=self.upcoming.pk).exists())
+
+        archived = ArchivedEvent.objects.get(pk=self.past.pk)
+        self.assertEqual(archived.name, self.past.name)
+        self.assertEqual(archived.created_at, self.past.created_at)
+        self.assertEqual(
+            set(ArchivedAttendee.objects.filter(event=archived).values_list('user_id', flat=True)),
+            {a.user_id for a in self.past_attendees},
+        )
+
+    def test_before_cutoff(self):
+        self.archive('--before', (timezone.now() - timedelta(days=5)).isoformat())
+        self.assertTrue(Event.objects.filter(pk=self.past.pk).exists())
+        self.assertFalse(ArchivedEvent.objects.exists())
+
+    def test_list_reads_hot_tier_by_default(self):
+        self.archive()
+        url = reverse('event-list')
+
+        response = self.client.get(url)
+        ids = {event["id"] for event in response.data["results"]}
+        self.assertEqual(ids, {self.upcoming.id})
+
+        response = self.client.get(url, {"include_past": "true"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2)
+        ids = {event["id"] for event in response.data["results"]}
+        self.assertEqual(ids, {self.upcoming.id, self.past.id})
+
+    def test_attendees_of_archived_event(self):
+        self.archive()
+        url = reverse('list_attendee-list', kwargs={'event_id': self.past.id})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(url, {"include_past": "true"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        emails = {user["email"] for user in response.data["results"]}
+        self.assertEqual(emails, {a.user.email for a in self.past_attendees})
+
+    def test_keeps_registration_stats_and_records_tombstones(self):
+        rebuild_stats([self.past.id])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.archive()
+            committed_at = timezone.now()
+        self.assertGreaterEqual(EventTombstone.objects.get(event_id=self.past.id).deleted_at, committed_at)
+
+        self.assertTrue(RegistrationStat.objects.filter(event_id=self.past.id).exists())
+        self.assertTrue(EventTombstone.objects.filter(event_id=self.past.id).exists())
+        self.assertFalse(EventTombstone.objects.filter(event_id=self.upcoming.id).exists())
+
+        response = self.client.get(reverse('event-stats', kwargs={'pk': self.past.id}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["registrations"], 2)
+        self.client.force_authenticate(user=UserFactory())
+        response = self.client.get(reverse('event-stats', kwargs={'pk': self.past.id}))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        # Rebuilding an archived event reads its archived registrations.
+        call_command('rebuild_registration_stats', str(self.past.id), stdout=StringIO())
+        daily = RegistrationStat.objects.filter(event_id=self.past.id, granularity=RegistrationStat.DAY)
+        self.assertEqual(sum(daily.values_list('count', flat=True)), 2)
+
+        # Deleting the event itself still deletes its stats.
+        ArchivedEvent.objects.filter(pk=self.past.id).delete()
+        self.assertFalse(RegistrationStat.objects.filter(event_id=self.past.id).exists())
@@ -0,0 +1,141 @@
+from unittest import mock
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+
+from accounts.tests.factories import UserFactory
+from event_management.utils.singleflight import get_or_compute, make_entry
+from events.tests.factories import EventFactory, AttendeeFactory
+
+
+class SingleFlightTests(APITestCase):
+    """
+    Test suite for single-flight cache fills with stale serving and early refresh.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+    def compute(self):
+        self.calls += 1
+        return f"value {self.calls}"
+
+    def test_computes_once_then_serves_cache(self):
+        self.assertEqual(get_or_compute(cache, 'key', self.compute, 60), "value 1")
+        self.assertEqual(get_or_compute(cache, 'key', self.compute, 60), "value 1")
+        self.assertEqual(self.calls, 1)
+
+    def test_serves_stale_value_while_another_request_refreshes(self):
+        cache.set('key', make_entry("stale", timeout=-1))
+        cache.add('key:lock', True)
+
+        self.assertEqual(get_or_compute(cache, 'key', self.compute, 60), "stale")
+        self.assertEqual(self.calls, 0)
+
+    @override_settings(CACHE_WAIT_TIMEOUT=1)
+    def test_waits_for_the_lock_holder(self):
+        cache.add('key:lock', True)
+
+        def fill_during_wait(seconds):
+            cache.set('key', make_entry("filled", timeout=60))
+
+        with mock.patch('event_management.utils.singleflight.time.sleep', side_effect=fill_during_wait):
+            self.assertEqual(get_or_compute(cache, 'key', self.compute, 60), "filled")
+        self.assertEqual(self.calls, 0)
+
+    @override_settings(CACHE_WAIT_TIMEOUT=0)
+    def test_computes_itself_when_lock_holder_is_too_slow(self):
+        cache.add('key:lock', True)
+        self.assertEqual(get_or_compute(cache, 'key', self.compute, 60), "value 1")
+
+    def test_early_refresh_before_expiry(self):
+        cache.set('key', make_entry("old", timeout=1, compute_time=5))
+
+        # A draw close to 1 stands for the unlucky request that refreshes early.
+        with mock.patch('event_management.utils.singleflight.random.random', return_value=0.99):
+            self.assertEqual(get_or_compute(cache, 'key', self.compute, 60), "value 1")
+
+        cache.set('key', make_entry("old", timeout=60, compute_time=0.001))
+        self.assertEqual(get_or_compute(cache, 'key', self.compute, 60), "old")
+
+    def test_lock_released_when_compute_fails(self):
+        def fail():
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            get_or_compute(cache, 'key', fail, 60)
+        self.assertIsNone(cache.get('key:lock'))
+
+
+class CachedReadTests(APITestCase):
+    """
+    Test suite for the cached event detail and attendee pages.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(user=UserFactory())
+        self.event = EventFactory()
+
+    def test_event_detail_cached_and_invalidated(self):
+        url = reverse('event-detail', kwargs={'pk': self.event.id})
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.data["creator"]["id"], self.event.creator_id)
+
+        self.event.name = "Renamed"
+        self.event.save()
+        self.assertEqual(self.client.get(url).data["name"], "Renamed")
+
+    def test_profile_edit_invalidates_cached_events_and_pages(self):
+        attendee = AttendeeFactory(event=self.event)
+        detail_url = reverse('event-detail', kwargs={'pk': self.event.id})
+        attendees_url = reverse('list_attendee-list', kwargs={'event_id': self.event.id})
+        self.client.get(detail_url)
+        self.client.get(attendees_url)
+
+        # Logging in only touches last_login.
+        self.event.creator.save(update_fields=['last_login'])
+        with self.assertNumQueries(0):
+            self.client.get(detail_url)
+
+        self.event.creator.name = "Renamed creator"
+        self.event.creator.save()
+        attendee.user.name = "Renamed attendee"
+        attendee.user.save(update_fields=['name'])
+        self.assertEqual(self.client.get(detail_url).data["creator"]["name"], "Renamed creator")
+        self.assertEqual(self.client.get(attendees_url).data["results"][0]["name"], "Renamed attendee")
+
+    def test_event_detail_not_found(self):
+        response = self.client.get(reverse('event-detail', kwargs={'pk': self.event.id + 1}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_attendee_page_cached_and_invalidated(self):
+        AttendeeFactory(event=self.event)
+        url = reverse('list_attendee-list', kwargs={'event_id': self.event.id})
+        self.assertEqual(self.client.get(url).data["count"], 1)
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        AttendeeFactory(event=self.event)
+        self.assertEqual(self.client.get(url).data["count"], 2)
+
+    @override_settings(ALLOWED_HOSTS=['testserver', 'other.example.com'])
+    def test_attendee_page_key_ignores_host_and_unrelated_parameters(self):
+        AttendeeFactory.create_batch(11, event=self.event)
+        url = reverse('list_attendee-list', kwargs={'event_id': self.event.id})
+        self.client.get(url, {"page": "2"})
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, {"page": "02", "utm_source": "mail"}, HTTP_HOST="other.example.com")
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNone(response.data["next"])
+        # Links are built for the request, not taken from the one that filled the cache.
+        self.assertEqual(
+            response.data["previous"], f"http://other.example.com{url}?utm_source=mail",
+        )
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import threading
+
+from asgiref.sync import sync_to_async
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from accounts.tests.factories import UserFactory
+from events.live import CapacityBroadcaster
+from events.tests.factories import EventFactory, AttendeeFactory
+
+
+class CapacityBroadcasterTests(TestCase):
+    """
+    Test suite for the in-process capacity broadcaster.
+    """
+
+    async def test_fan_out_to_many_subscribers_from_another_thread(self):
+        hub = CapacityBroadcaster()
+        subscriptions = [hub.subscribe(1) for _ in range(2000)]
+
+        publisher = threading.Thread(target=hub.publish, args=(1, {"attendees": 3}))
+        publisher.start()
+        publisher.join()
+
+        payloads = await asyncio.wait_for(asyncio.gather(*(s.get() for s in subscriptions)), timeout=5)
+        self.assertTrue(all(payload == {"attendees": 3} for payload in payloads))
+        self.assertEqual(hub.latest(1), {"attendees": 3})
+
+    async def test_slow_subscriber_only_keeps_latest(self):
+        hub = CapacityBroadcaster()
+        subscription = hub.subscribe(1)
+        for count in range(5):
+            hub.publish(1, {"attendees": count})
+        await asyncio.sleep(0)
+
+        self.assertEqual(await subscription.get(), {"attendees": 4})
+        self.assertTrue(subscription.queue.empty())
+
+    async def test_unsubscribe_forgets_event(self):
+        hub = CapacityBroadcaster()
+        subscription = hub.subscribe(1)
+        hub.publish(1, {"attendees": 1})
+        hub.unsubscribe(subscription)
+
+        self.assertFalse(hub.has_subscribers(1))
+        self.assertIsNone(hub.latest(1))
+
+
+class EventLiveViewTests(TestCase):
+    """
+    Test suite for the Server-Sent Events capacity stream.
+    """
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.event = EventFactory(max_capacity=3)
+        self.url = reverse('event-live', kwargs={'event_id': self.event.id})
+        self.auth = f"Bearer {RefreshToken.for_user(self.user).access_token}"
+
+    async def read_event(self, stream):
+        chunk = await asyncio.wait_for(anext(stream), timeout=5)
+        chunk = chunk.decode() if isinstance(chunk, bytes) else chunk
+        return json.loads(chunk.split("data: ", 1)[1])
+
+    async def test_stream_pushes_committed_registrations(self):
+        response = await self.async_client.get(self.url, headers={"Authorization": self.auth})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+
+        snapshot = await self.read_event(stream)
+        self.assertEqual(snapshot["spots_left"], 3)
+
+        def register():
+            with self.captureOnCommitCallbacks(execute=True):
+                AttendeeFactory(event=self.event)
+
+        await sync_to_async(register)()
+        update = await self.read_event(stream)
+        self.assertEqual(update["attendees"], 1)
+        self.assertEqual(update["spots_left"], 2)
+
+        await stream.aclose()
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+
+    async def test_signed_url_needs_no_headers(self):
+        def get_url(event_id):
+            return self.client_class().get(reverse('event-live-url', kwargs={'pk': event_id}), HTTP_AUTHORIZATION=self.auth)
+
+        response = await sync_to_async(get_url)(self.event.id)
+        self.assertEqual(response.status_code, 200)
+        url = response.json()["url"]
+
+        # Like `new EventSource(url)`: no Authorization header, no cookies.
+        stream_response = await self.async_client_class().get(url)
+        self.assertEqual(stream_response.status_code, 200)
+        stream = aiter(stream_response.streaming_content)
+        self.assertEqual((await self.read_event(stream))["spots_left"], 3)
+        await stream.aclose()
+
+        other = await sync_to_async(EventFactory)()
+        other_url = reverse('event-live', kwargs={'event_id': other.id}) + "?" + url.split("?", 1)[1]
+        self.assertEqual((await self.async_client_class().get(other_url)).status_code, 401)
+        with override_settings(EVENTS_LIVE_TOKEN_MAX_AGE=-1):
+            self.assertEqual((await self.async_client_class().get(url)).status_code, 401)
+
+    async def test_unknown_event(self):
+        url = reverse('event-live', kwargs={'event_id': 999999})
+        response = await self.async_client.get(url, headers={"Authorization": self.auth})
+        self.assertEqual(response.status_code, 404)
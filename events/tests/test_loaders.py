@@ -0,0 +1,81 @@
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import User
+from accounts.tests.factories import UserFactory
+from event_management.utils.loaders import get_loader
+from events.models import Event, Attendee
+from events.serializers import AttendeeSerializer
+from events.tests.factories import EventFactory, AttendeeFactory
+
+
+class BatchLoaderTests(APITestCase):
+    """
+    Test suite for request-scoped batch loading of nested serializer relations.
+    """
+
+    def setUp(self):
+        self.request = Request(APIRequestFactory().get('/'))
+
+    def test_nested_relations_cost_one_query_per_type(self):
+        AttendeeFactory.create_batch(5)
+        attendees = list(Attendee.objects.all())
+
+        # One query for the events, one for their creators; none per row.
+        with self.assertNumQueries(2):
+            data = AttendeeSerializer(attendees, many=True, context={'request': self.request}).data
+        self.assertEqual(
+            [item["event"]["creator"]["id"] for item in data],
+            [attendee.event.creator_id for attendee in attendees],
+        )
+
+    def test_objects_are_memoized_for_the_request(self):
+        event = EventFactory()
+        loader = get_loader(self.request)
+        self.assertIs(get_loader(self.request), loader)
+
+        with self.assertNumQueries(2):
+            loaded = loader.load(Event, event.id)
+            loader.load_related([loaded], 'creator')
+        with self.assertNumQueries(0):
+            self.assertIs(loader.load(Event, event.id), loaded)
+            self.assertIs(loader.load(User, event.creator_id), loaded.creator)
+
+    def test_missing_related_object_is_not_cached(self):
+        event = EventFactory()
+        dangling = Event(creator_id=event.creator_id + 1000)
+        loader = get_loader(self.request)
+
+        self.assertEqual(loader.load_related([event, dangling], 'creator'), [event.creator])
+        # Normal access still raises rather than returning a cached None.
+        with self.assertRaises(User.DoesNotExist):
+            dangling.creator
+
+    def test_authenticated_user_is_never_reloaded(self):
+        user = UserFactory()
+        EventFactory.create_batch(3, creator=user)
+        self.client.force_authenticate(user=user)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('me-events'))
+        self.assertEqual({item["creator"]["id"] for item in response.data["results"]}, {user.id})
+
+    def test_registration_reads_the_event_once(self):
+        user = UserFactory()
+        event = EventFactory()
+        self.client.force_authenticate(user=user)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse('register_attendee-list', kwargs={'event_id': event.id}), {"user": user.id}, format='json'
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["event"]["creator"]["id"], event.creator_id)
+
+        table = Event._meta.db_table
+        event_reads = [q for q in queries if q['sql'].startswith('SELECT') and f'FROM "{table}"' in q['sql']]
+        self.assertEqual(len(event_reads), 1)
@@ -0,0 +1,112 @@
+import json
+import tempfile
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import reverse
+
+from accounts.tests.factories import UserFactory
+from event_management.utils.profiling import ProfilingMiddleware, load_profile
+from events.tests.factories import EventFactory
+
+
+class ProfilingMiddlewareTests(APITestCase):
+    """
+    Test suite for opt-in request profiling and the profile store.
+    """
+
+    def setUp(self):
+        store = tempfile.TemporaryDirectory()
+        self.addCleanup(store.cleanup)
+        settings_override = override_settings(PROFILING_STORE_DIR=store.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.staff = UserFactory()
+        self.staff.is_staff = True
+        self.staff.save()
+        self.url = reverse('event-list')
+        EventFactory.create_batch(3)
+
+    def authenticate(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+
+    def test_inline_profile_for_staff(self):
+        self.authenticate(self.staff)
+        response = self.client.get(self.url, {"__profile": "inline"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile = response.json()
+        self.assertEqual(profile["status"], status.HTTP_200_OK)
+        self.assertGreater(profile["sql"]["count"], 0)
+        self.assertGreater(profile["timings"]["serializer_ms"], 0)
+        self.assertIn("cumulative", profile["cprofile"])
+        # Creators are joined into the list query, so no query template repeats.
+        self.assertEqual(profile["sql"]["duplicates"], [])
+
+    def test_stored_profile_can_be_browsed(self):
+        self.authenticate(self.staff)
+        response = self.client.get(self.url, HTTP_X_PROFILE="1")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("results", response.data)
+        profile_id = response["X-Profile-Id"]
+
+        listing = self.client.get(reverse('profile-list'))
+        self.assertEqual([p["id"] for p in listing.data], [profile_id])
+
+        detail = self.client.get(reverse('profile-detail', kwargs={'profile_id': profile_id}))
+        self.assertEqual(detail.data["path"], self.url)
+
+        missing = self.client.get(reverse('profile-detail', kwargs={'profile_id': '..secret'}))
+        self.assertEqual(missing.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_sampled_profiles_store_no_parameters(self):
+        data = {"name": "Sampled User", "email": "sampled@example.com", "password": "MyNewPass123"}
+        with override_settings(PROFILING_SAMPLE_RATE=1.0):
+            response = self.client.post(f"{reverse('register')}?token=secret-token", data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        profile = load_profile(response["X-Profile-Id"])
+        self.assertEqual(profile["path"], reverse('register'))
+        self.assertTrue(any(query["param_count"] for query in profile["sql"]["queries"]))
+        stored = json.dumps(profile)
+        for secret in ("sampled@example.com", "Sampled User", "secret-token", "pbkdf2_sha256$"):
+            self.assertNotIn(secret, stored)
+
+    def test_ignored_for_non_staff(self):
+        user = UserFactory()
+        self.authenticate(user)
+        response = self.client.get(self.url, {"__profile": "inline"})
+
+        self.assertIn("results", response.data)
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertEqual(self.client.get(reverse('profile-list')).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_disabled_adds_no_queries(self):
+        cache.clear()
+        self.client.force_authenticate(user=self.staff)
+        with self.assertNumQueries(1):
+            self.client.get(reverse('event-batch'), {"ids": "1,2"})
+
+    def test_async_stack_stays_async(self):
+        calls = []
+
+        async def get_response(request):
+            calls.append(request.path)
+            return HttpResponse("streamed")
+
+        middleware = ProfilingMiddleware(get_response)
+        self.assertTrue(iscoroutinefunction(middleware))
+        response = async_to_sync(middleware)(RequestFactory().get('/events/1/live/'))
+        self.assertEqual((response.content, calls), (b"streamed", ['/events/1/live/']))
+
+        request = RequestFactory().get('/events/', {"__profile": "inline"})
+        request.user = self.staff
+        profile = json.loads(async_to_sync(middleware)(request).content)
+        self.assertEqual((profile["path"], profile["status"]), ('/events/', status.HTTP_200_OK))
@@ -0,0 +1,275 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.tests.factories import UserFactory
+from events.models import Event, Attendee, CancelledOccurrence
+from events.recurrence import get_series_state, iter_occurrence_starts
+from events.tests.factories import EventFactory
+
+
+UTC = dt_timezone.utc
+
+
+def make_series(start, recurrence=Event.WEEKLY, **kwargs):
+    kwargs.setdefault('recurrence_timezone', 'UTC')
+    return EventFactory(start_time=start, end_time=start + timedelta(hours=1), recurrence=recurrence, **kwargs)
+
+
+class OccurrenceExpansionTests(APITestCase):
+    """
+    Test suite for the lazy expansion of recurring events.
+    """
+
+    def starts(self, event, start, end):
+        return list(iter_occurrence_starts(event, start, end))
+
+    def test_weekly_keeps_wall_clock_time_across_dst(self):
+        london = ZoneInfo('Europe/London')
+        start = datetime(2030, 3, 19, 19, 0, tzinfo=london)
+        event = Event(start_time=start, end_time=start + timedelta(hours=1), recurrence=Event.WEEKLY,
+                      recurrence_timezone='Europe/London')
+
+        # Pure computation: expanding a series never touches the database.
+        with self.assertNumQueries(0):
+            starts = self.starts(event, datetime(2030, 3, 1, tzinfo=UTC), datetime(2030, 4, 10, tzinfo=UTC))
+        self.assertEqual([value.astimezone(london).hour for value in starts], [19, 19, 19, 19])
+        self.assertEqual(
+            [value.astimezone(UTC).hour for value in starts], [19, 19, 18, 18],  # BST starts on March 31
+        )
+
+    def test_monthly_skips_missing_days(self):
+        start = datetime(2030, 1, 31, 10, 0, tzinfo=UTC)
+        event = Event(start_time=start, end_time=start, recurrence=Event.MONTHLY, recurrence_timezone='UTC')
+        starts = self.starts(event, datetime(2030, 1, 1, tzinfo=UTC), datetime(2030, 7, 1, tzinfo=UTC))
+        self.assertEqual([value.month for value in starts], [1, 3, 5])
+
+    def test_interval_and_until(self):
+        start = datetime(2030, 1, 1, 10, 0, tzinfo=UTC)
+        event = Event(start_time=start, end_time=start, recurrence=Event.DAILY, recurrence_interval=3,
+                      recurrence_until=datetime(2030, 1, 10, 10, 0, tzinfo=UTC), recurrence_timezone='UTC')
+        starts = self.starts(event, datetime(2029, 1, 1, tzinfo=UTC), datetime(2031, 1, 1, tzinfo=UTC))
+        self.assertEqual([value.day for value in starts], [1, 4, 7, 10])
+
+    def test_window_far_from_the_first_occurrence(self):
+        start = datetime(2030, 1, 1, 10, 0, tzinfo=UTC)
+        event = Event(start_time=start, end_time=start, recurrence=Event.DAILY, recurrence_timezone='UTC')
+        starts = self.starts(event, datetime(2060, 6, 1, tzinfo=UTC), datetime(2060, 6, 3, tzinfo=UTC))
+        self.assertEqual(starts, [datetime(2060, 6, 1, 10, tzinfo=UTC), datetime(2060, 6, 2, 10, tzinfo=UTC)])
+
+
+class RecurringEventApiTests(APITestCase):
+    """
+    Test suite for recurring events in the events API: window listing, calendar,
+    registration on occurrences and the iCalendar feed.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.list_url = reverse('event-list')
+        self.series = make_series(datetime(2030, 1, 7, 18, 0, tzinfo=UTC), creator=self.user)
+
+    def register(self, occurrence=None, event=None):
+        user = UserFactory()
+        self.client.force_authenticate(user=user)
+        data = {"user": user.id}
+        if occurrence is not None:
+            data["occurrence"] = occurrence
+        url = reverse('register_attendee-list', kwargs={'event_id': (event or self.series).id})
+        return self.client.post(url, data, format='json')
+
+    def test_create_validates_recurrence(self):
+        data = {
+            "name": "Meetup",
+            "location": "Pune",
+            "start_time": "2030-01-07T18:00:00Z",
+            "end_time": "2030-01-07T19:00:00Z",
+            "max_capacity": 10,
+            "recurrence": "weekly",
+            "recurrence_timezone": "Europe/Paris",
+        }
+        response = self.client.post(self.list_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["recurrence"], "weekly")
+        self.assertIsNone(response.data["series"])
+
+        for invalid in (
+            {"recurrence": "hourly"},
+            {"recurrence_timezone": "Mars/Olympus"},
+            {"recurrence_interval": 0},
+            {"recurrence_until": "2030-01-01T00:00:00Z"},
+        ):
+            response = self.client.post(self.list_url, {**data, **invalid}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, invalid)
+
+    def test_window_lists_occurrences_in_start_order(self):
+        single = EventFactory(start_time=datetime(2030, 1, 15, 9, 0, tzinfo=UTC))
+
+        response = self.client.get(self.list_url, {"from": "2030-01-01", "to": "2030-01-21", "tz": "UTC"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 4)
+        self.assertEqual(
+            [(item["id"], item["series"], item["start_time"][:10]) for item in response.data["results"]],
+            [
+                (None, self.series.id, "2030-01-07"),
+                (None, self.series.id, "2030-01-14"),
+                (single.id, None, "2030-01-15"),
+                (None, self.series.id, "2030-01-21"),
+            ],
+        )
+
+    def test_window_pagination(self):
+        make_series(datetime(2030, 1, 1, 8, 0, tzinfo=UTC), recurrence=Event.DAILY)
+        params = {"from": "2030-01-01", "to": "2030-01-30", "tz": "UTC"}
+
+        response = self.client.get(self.list_url, {**params, "page": 2})
+        self.assertEqual(response.data["count"], 34)
+        self.assertEqual(
+            [item["start_time"][:13] for item in response.data["results"][:3]],
+            ["2030-01-10T08", "2030-01-11T08", "2030-01-12T08"],
+        )
+
+    def test_window_query_count_does_not_grow_with_occurrences(self):
+        make_series(datetime(2030, 1, 1, 8, 0, tzinfo=UTC), recurrence=Event.DAILY)
+
+        def count_queries(to):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.list_url, {"from": "2030-01-01", "to": to, "tz": "UTC"})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries)
+
+        self.assertEqual(count_queries("2030-01-02"), count_queries("2030-03-01"))
+
+    def test_calendar_counts_occurrences(self):
+        EventFactory(start_time=datetime(2030, 1, 14, 9, 0, tzinfo=UTC))
+
+        response = self.client.get(reverse('event-calendar'), {"from": "2030-01-13", "to": "2030-01-14", "tz": "UTC"})
+        day = response.data["days"][0]
+        self.assertEqual((day["date"], day["count"]), ("2030-01-14", 2))
+        self.assertEqual([item["series"] for item in day["events"]], [None, self.series.id])
+
+    def test_registration_materializes_the_occurrence_once(self):
+        occurrence = "2030-01-14T18:00:00Z"
+        first = self.register(occurrence)
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        second = self.register(occurrence)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+
+        child = Event.objects.get(series=self.series)
+        self.assertEqual(child.occurrence_start, datetime(2030, 1, 14, 18, 0, tzinfo=UTC))
+        self.assertEqual(first.data["event"]["id"], child.id)
+        self.assertEqual(Attendee.objects.filter(event=child).count(), 2)
+        self.assertFalse(self.series.attendees.exists())
+
+        # The stored occurrence replaces the virtual one in listings.
+        response = self.client.get(self.list_url, {"from": "2030-01-14", "to": "2030-01-14", "tz": "UTC"})
+        self.assertEqual([item["id"] for item in response.data["results"]], [child.id])
+
+    def test_series_edit_moves_stored_occurrences(self):
+        self.register("2030-01-14T18:00:00Z")
+        self.register("2030-01-21T18:00:00Z")
+        edited = Event.objects.get(series=self.series, occurrence_start=datetime(2030, 1, 21, 18, 0, tzinfo=UTC))
+        edited.name = "Special"
+        edited.save()
+        CancelledOccurrence.objects.create(
+            series=self.series, occurrence_start=datetime(2030, 1, 28, 18, 0, tzinfo=UTC)
+        )
+
+        self.series.start_time = datetime(2030, 1, 7, 19, 0, tzinfo=UTC)
+        self.series.end_time = datetime(2030, 1, 7, 21, 0, tzinfo=UTC)
+        self.series.name = "Renamed"
+        self.series.save()
+
+        response = self.client.get(self.list_url, {"from": "2030-01-14", "to": "2030-01-28", "tz": "UTC"})
+        self.assertEqual(
+            [(item["name"], item["start_time"], item["end_time"]) for item in response.data["results"]],
+            [
+                ("Renamed", "2030-01-14T19:00:00+00:00", "2030-01-14T21:00:00+00:00"),
+                ("Special", "2030-01-21T19:00:00+00:00", "2030-01-21T21:00:00+00:00"),
+            ],
+        )
+        self.assertEqual(
+            set(Attendee.objects.values_list('event_start', 'event_end')),
+            {
+                (datetime(2030, 1, 14, 19, 0, tzinfo=UTC), datetime(2030, 1, 14, 21, 0, tzinfo=UTC)),
+                (datetime(2030, 1, 21, 19, 0, tzinfo=UTC), datetime(2030, 1, 21, 21, 0, tzinfo=UTC)),
+            },
+        )
+
+    def test_series_edit_removes_occurrences_it_no_longer_has(self):
+        self.register("2030-01-21T18:00:00Z")
+        self.series.recurrence_until = datetime(2030, 1, 15, tzinfo=UTC)
+        self.series.save()
+
+        self.assertFalse(Event.objects.filter(series=self.series).exists())
+        self.assertFalse(Attendee.objects.exists())
+
+    def test_only_series_edits_read_the_stored_series(self):
+        event = Event.objects.get(pk=EventFactory(creator=self.user).pk)
+        series = Event.objects.get(pk=self.series.pk)
+        with mock.patch('events.signals.get_series_state', wraps=get_series_state) as get_state:
+            event.name = "Renamed"
+            event.save()
+            get_state.assert_not_called()
+
+            series.name = "Renamed"
+            series.save()
+            # A series turned into a one-off event still drops its occurrences.
+            series.recurrence = ''
+            series.save()
+            self.assertEqual(get_state.call_count, 2)
+
+    def test_registration_requires_a_valid_occurrence(self):
+        CancelledOccurrence.objects.create(
+            series=self.series, occurrence_start=datetime(2030, 1, 21, 18, 0, tzinfo=UTC)
+        )
+        for occurrence in (None, "2030-01-15T18:00:00Z", "2030-01-21T18:00:00Z", "2029-12-31T18:00:00Z"):
+            response = self.register(occurrence)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, occurrence)
+            self.assertIn("occurrence", response.data)
+
+        response = self.register("2030-01-14T18:00:00Z", event=EventFactory())
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Event.objects.filter(series=self.series).exists())
+
+    def test_cancelled_occurrence_is_left_out(self):
+        CancelledOccurrence.objects.create(
+            series=self.series, occurrence_start=datetime(2030, 1, 14, 18, 0, tzinfo=UTC)
+        )
+        response = self.client.get(self.list_url, {"from": "2030-01-01", "to": "2030-01-21", "tz": "UTC"})
+        self.assertEqual(
+            [item["start_time"][:10] for item in response.data["results"]], ["2030-01-07", "2030-01-21"]
+        )
+
+    def test_feed_writes_series_once_with_rrule(self):
+        self.series.recurrence_until = datetime(2030, 3, 1, tzinfo=UTC)
+        self.series.save()
+        CancelledOccurrence.objects.create(
+            series=self.series, occurrence_start=datetime(2030, 1, 14, 18, 0, tzinfo=UTC)
+        )
+        occurrence = self.register("2030-01-21T18:00:00Z").data["event"]["id"]
+
+        # The attendee of one occurrence gets it as an event of its own: there is no series to override.
+        response = self.client.get(reverse('event-feed'), {"tz": "Asia/Kolkata"})
+        body = b"".join(response.streaming_content).decode()
+        self.assertIn(f"UID:event-{occurrence}@", body)
+        self.assertNotIn("RECURRENCE-ID", body)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse('event-feed'), {"tz": "Asia/Kolkata"})
+        body = b"".join(response.streaming_content).decode()
+        self.assertEqual(body.count(f"UID:event-{self.series.id}@"), 2)
+        self.assertNotIn(f"UID:event-{occurrence}@", body)
+        self.assertIn("RRULE:FREQ=WEEKLY;INTERVAL=1;UNTIL=20300301T000000Z", body)
+        self.assertIn("EXDATE;TZID=UTC:20300114T180000", body)
+        # In the series' timezone, like its DTSTART, whatever `tz` the feed is rendered in.
+        self.assertIn("RECURRENCE-ID;TZID=UTC:20300121T180000", body)
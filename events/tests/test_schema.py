@@ -0,0 +1,69 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+import yaml
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.conf import settings
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+
+from event_management.utils.schema import generate_schema
+
+
+class SchemaSnapshotTests(APITestCase):
+    """
+    Test suite for the prebuilt OpenAPI schema and the warm-up command.
+    """
+
+    def test_snapshot_matches_annotations(self):
+        snapshot = json.loads(Path(settings.OPENAPI_SCHEMA_FILE).read_text())
+        self.assertEqual(
+            snapshot, generate_schema(),
+            "The OpenAPI snapshot is stale; regenerate it with "
+            "`python manage.py spectacular --format openapi-json --file event_management/openapi.json`.",
+        )
+
+    def test_schema_served_with_etag(self):
+        response = self.client.get(reverse('schema'), {"format": "json"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/vnd.oai.openapi+json")
+        self.assertEqual(json.loads(response.content)["info"]["title"], "Event Management API")
+        self.assertIn("ETag", response)
+
+        response = self.client.get(reverse('schema'), {"format": "json"}, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_schema_defaults_to_yaml(self):
+        response = self.client.get(reverse('schema'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/vnd.oai.openapi")
+        self.assertEqual(yaml.safe_load(response.content), generate_schema())
+
+        json_etag = self.client.get(reverse('schema'), {"format": "json"})["ETag"]
+        self.assertNotEqual(response["ETag"], json_etag)
+        response = self.client.get(reverse('schema'), HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_schema_generated_without_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with override_settings(OPENAPI_SCHEMA_FILE=f"{directory}/missing.json"):
+                response = self.client.get(reverse('schema'), {"format": "json"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("ETag", response)
+        self.assertIn("/events/", json.loads(response.content)["paths"])
+
+    def test_swagger_ui(self):
+        response = self.client.get(reverse('swagger-ui'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_warmup_command(self):
+        out = StringIO()
+        call_command('warmup', stdout=out)
+        self.assertIn("timezones:", out.getvalue())
+        self.assertIn("Warm-up finished", out.getvalue())
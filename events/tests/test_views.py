@@ -1,10 +1,27 @@
+import hashlib
+import json
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
+
 from rest_framework import status
 from rest_framework.test import APITestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.crypto import salted_hmac
 
+from events.models import Event, RegistrationStat
+from events.serializers import AttendeeSerializer
 from events.tests.factories import EventFactory, AttendeeFactory
 from accounts.tests.factories import UserFactory
 from accounts.models import User
+from event_management.utils.timezone import convert_to_timezone
 
 
 class EventViewSetTests(APITestCase):
@@ -124,3 +141,648 @@ class AttendeeListViewSetTests(APITestCase):
         attendee_emails = [item['email'] for item in results if item['email'] in [u.email for u in users]]
         self.assertEqual(len(attendee_emails), 3)
         self.assertEqual(sorted(attendee_emails), sorted([u.email for u in users]))
+
+
+class EventFeedTests(APITestCase):
+    """
+    Test suite for the iCalendar feed endpoint.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('event-feed')
+
+    def test_feed_contains_created_and_registered_events(self):
+        created = EventFactory(creator=self.user, name="Created Event")
+        registered = EventFactory(name="Registered Event")
+        AttendeeFactory(event=registered, user=self.user)
+        EventFactory(name="Unrelated Event")
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/calendar"))
+        body = b"".join(response.streaming_content).decode()
+        self.assertIn(f"UID:event-{created.id}@", body)
+        self.assertIn(f"UID:event-{registered.id}@", body)
+        self.assertNotIn("Unrelated Event", body)
+
+    def test_feed_renders_requested_timezone(self):
+        event = EventFactory(creator=self.user)
+        response = self.client.get(self.url, {"tz": "Asia/Kolkata"})
+        body = b"".join(response.streaming_content).decode()
+        local_start = convert_to_timezone(event.start_time, "Asia/Kolkata").strftime("%Y%m%dT%H%M%S")
+        self.assertIn(f"DTSTART;TZID=Asia/Kolkata:{local_start}", body)
+        # Every TZID is defined before the events that use it.
+        self.assertLess(body.index("TZID:Asia/Kolkata\r\n"), body.index("BEGIN:VEVENT"))
+        self.assertIn("TZOFFSETTO:+0530", body)
+
+    def test_feed_defines_series_timezone_transitions(self):
+        start = datetime(2030, 1, 7, 9, tzinfo=dt_timezone.utc)
+        EventFactory(
+            creator=self.user, start_time=start, end_time=start + timedelta(hours=1),
+            recurrence='weekly', recurrence_until=start + timedelta(days=180), recurrence_timezone='Europe/Berlin',
+        )
+        body = b"".join(self.client.get(self.url).streaming_content).decode()
+        self.assertEqual(body.count("BEGIN:VTIMEZONE"), 1)
+        self.assertIn("DTSTART:20300331T020000\r\nTZOFFSETFROM:+0100\r\nTZOFFSETTO:+0200", body)
+        self.assertIn("DTSTART;TZID=Europe/Berlin:20300107T100000", body)
+
+    def test_feed_without_timezones_has_no_vtimezone(self):
+        EventFactory(creator=self.user)
+        body = b"".join(self.client.get(self.url).streaming_content).decode()
+        self.assertNotIn("VTIMEZONE", body)
+
+    def test_feed_invalid_timezone(self):
+        response = self.client.get(self.url, {"tz": "Mars/Olympus"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_feed_conditional_get_and_cache(self):
+        EventFactory(creator=self.user)
+        first = self.client.get(self.url)
+        b"".join(first.streaming_content)
+        etag = first["ETag"]
+
+        with self.assertNumQueries(0):
+            not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(self.url)
+        self.assertEqual(cached.status_code, status.HTTP_200_OK)
+        self.assertEqual(cached["ETag"], etag)
+
+    def test_feed_invalidated_by_registration(self):
+        first = self.client.get(self.url)
+        b"".join(first.streaming_content)
+
+        event = EventFactory(name="Fresh Event")
+        AttendeeFactory(event=event, user=self.user)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertIn("Fresh Event", b"".join(response.streaming_content).decode())
+
+    def test_feed_token_authentication(self):
+        EventFactory(creator=self.user, name="Token Event")
+        feed_url = self.client.get(reverse('event-feed-url')).data["url"]
+
+        self.client.force_authenticate(user=None)
+        response = self.client.get(feed_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("Token Event", b"".join(response.streaming_content).decode())
+
+        response = self.client.get(self.url, {"token": "forged"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_feed_token_revoked_by_rotation(self):
+        old_url = self.client.get(reverse('event-feed-url')).data["url"]
+        new_url = self.client.post(reverse('event-feed-url')).data["url"]
+        self.assertNotEqual(old_url, new_url)
+
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get(old_url).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.client.get(new_url).status_code, status.HTTP_200_OK)
+
+    @override_settings(EVENTS_FEED_TOKEN_MAX_AGE=60)
+    def test_feed_token_expires(self):
+        feed_url = self.client.get(reverse('event-feed-url')).data["url"]
+        self.client.force_authenticate(user=None)
+        with mock.patch('django.core.signing.time.time', return_value=time.time() + 61):
+            self.assertEqual(self.client.get(feed_url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class MyEventsViewTests(APITestCase):
+    """
+    Test suite for the /accounts/me/events/ endpoint.
+    """
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('me-events')
+
+    def test_lists_created_and_attending_events(self):
+        created = EventFactory(creator=self.user)
+        attending = EventFactory()
+        AttendeeFactory(event=attending, user=self.user)
+        EventFactory()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = {event["id"] for event in response.data["results"]}
+        self.assertEqual(ids, {created.id, attending.id})
+
+    def test_upcoming_filter(self):
+        upcoming = EventFactory(creator=self.user)
+        past = EventFactory(
+            creator=self.user,
+            start_time=timezone.now() - timedelta(days=2),
+            end_time=timezone.now() - timedelta(days=1),
+        )
+
+        response = self.client.get(self.url, {"upcoming": "true"})
+        ids = [event["id"] for event in response.data["results"]]
+        self.assertIn(upcoming.id, ids)
+        self.assertNotIn(past.id, ids)
+
+    def test_cursor_pagination_orders_by_start_time(self):
+        events = EventFactory.create_batch(12, creator=self.user)
+        expected = [e.id for e in sorted(events, key=lambda e: (e.start_time, e.id))]
+
+        response = self.client.get(self.url)
+        ids = [event["id"] for event in response.data["results"]]
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(response.data["next"])
+        ids += [event["id"] for event in response.data["results"]]
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(ids, expected)
+
+
+class IdempotencyKeyTests(APITestCase):
+    """
+    Test suite for Idempotency-Key handling on event creation and registration.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('event-list')
+        self.data = {
+            "name": "Retry Event",
+            "location": "Pune",
+            "start_time": "2099-06-30T10:00:00Z",
+            "end_time": "2099-06-30T12:00:00Z",
+            "max_capacity": 5
+        }
+
+    def test_event_create_replayed(self):
+        first = self.client.post(self.url, self.data, format='json', HTTP_IDEMPOTENCY_KEY="abc")
+        second = self.client.post(self.url, self.data, format='json', HTTP_IDEMPOTENCY_KEY="abc")
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second["Idempotent-Replayed"], "true")
+        self.assertEqual(Event.objects.filter(name="Retry Event").count(), 1)
+
+    def test_key_reused_with_different_payload(self):
+        self.client.post(self.url, self.data, format='json', HTTP_IDEMPOTENCY_KEY="abc")
+        response = self.client.post(
+            self.url, {**self.data, "name": "Other"}, format='json', HTTP_IDEMPOTENCY_KEY="abc"
+        )
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+    def test_failed_request_is_not_stored(self):
+        invalid = {**self.data, "end_time": "2099-06-30T09:00:00Z"}
+        response = self.client.post(self.url, invalid, format='json', HTTP_IDEMPOTENCY_KEY="abc")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(self.url, self.data, format='json', HTTP_IDEMPOTENCY_KEY="abc")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    @override_settings(IDEMPOTENCY_WAIT_TIMEOUT=0)
+    def test_in_flight_duplicate_conflicts_after_wait(self):
+        digest = hashlib.sha256(b"abc").hexdigest()
+        payload = json.dumps(self.data, sort_keys=True)
+        fingerprint = salted_hmac('event_management.idempotency', payload, algorithm='sha256').hexdigest()
+        cache.set(
+            f"idempotency:{self.user.pk}:POST:{self.url}:{digest}",
+            {"state": "in_flight", "fingerprint": fingerprint},
+        )
+
+        response = self.client.post(self.url, self.data, format='json', HTTP_IDEMPOTENCY_KEY="abc")
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(Event.objects.filter(name="Retry Event").exists())
+
+    def test_registration_replayed_instead_of_already_registered(self):
+        event = EventFactory(max_capacity=5)
+        url = reverse('register_attendee-list', kwargs={'event_id': event.id})
+        attendee = UserFactory()
+
+        first = self.client.post(url, {"user": attendee.id}, HTTP_IDEMPOTENCY_KEY="reg-1")
+        second = self.client.post(url, {"user": attendee.id}, HTTP_IDEMPOTENCY_KEY="reg-1")
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.data["id"], first.data["id"])
+
+
+class EventBatchTests(APITestCase):
+    """
+    Test suite for the multi-get /events/batch/ endpoint.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('event-batch')
+
+    def test_returns_events_in_requested_order(self):
+        events = EventFactory.create_batch(3)
+        ids = [events[2].id, events[0].id, 999999, events[1].id]
+
+        response = self.client.get(self.url, {"ids": ",".join(map(str, ids))})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([e["id"] for e in response.data["results"]], [events[2].id, events[0].id, events[1].id])
+        self.assertEqual(response.data["missing"], [999999])
+
+    def test_fixed_query_count_and_cache_reuse(self):
+        events = EventFactory.create_batch(5)
+        ids = ",".join(str(e.id) for e in events)
+
+        with self.assertNumQueries(1):
+            self.client.get(self.url, {"ids": ids})
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {"ids": ids})
+        self.assertEqual(len(response.data["results"]), 5)
+
+        extra = EventFactory()
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"ids": f"{ids},{extra.id}"})
+        self.assertEqual(response.data["results"][-1]["id"], extra.id)
+
+    def test_honors_timezone(self):
+        event = EventFactory()
+        response = self.client.get(self.url, {"ids": str(event.id), "tz": "Asia/Kolkata"})
+        expected = convert_to_timezone(event.start_time, "Asia/Kolkata").isoformat()
+        self.assertEqual(response.data["results"][0]["start_time"], expected)
+
+    def test_cache_invalidated_on_change(self):
+        event = EventFactory(name="Before")
+        self.client.get(self.url, {"ids": str(event.id)})
+        event.name = "After"
+        event.save()
+
+        response = self.client.get(self.url, {"ids": str(event.id)})
+        self.assertEqual(response.data["results"][0]["name"], "After")
+
+    @override_settings(EVENTS_BATCH_MAX_IDS=2)
+    def test_rejects_too_many_or_invalid_ids(self):
+        response = self.client.get(self.url, {"ids": "1,2,3"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {"ids": "1,abc"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class EventStatsTests(APITestCase):
+    """
+    Test suite for the registration statistics rollup and endpoint.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.event = EventFactory(creator=self.user, max_capacity=2)
+
+    def register(self, user):
+        url = reverse('register_attendee-list', kwargs={'event_id': self.event.id})
+        return self.client.post(url, {"user": user.id})
+
+    def test_stats_follow_registrations(self):
+        self.register(UserFactory())
+        url = reverse('event-stats', kwargs={'pk': self.event.id})
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["registrations"], 1)
+        self.assertEqual(response.data["fill_rate"], 0.5)
+        self.assertIsNone(response.data["sold_out_at"])
+        self.assertEqual(len(response.data["buckets"]), 1)
+
+        self.register(UserFactory())
+        response = self.client.get(url, {"granularity": "hour"})
+        self.assertEqual(response.data["registrations"], 2)
+        self.assertEqual(response.data["fill_rate"], 1.0)
+        self.assertIsNotNone(response.data["sold_out_at"])
+        self.assertEqual(response.data["buckets"][-1]["cumulative"], 2)
+
+    def test_stats_read_is_independent_of_attendee_count(self):
+        for _ in range(2):
+            self.register(UserFactory())
+        url = reverse('event-stats', kwargs={'pk': self.event.id})
+
+        with self.assertNumQueries(3):
+            self.client.get(url)
+
+    def test_rebuild_command_matches_incremental_rollup(self):
+        self.register(UserFactory())
+        self.register(UserFactory())
+        incremental = sorted(RegistrationStat.objects.values_list('granularity', 'bucket_start', 'count'))
+
+        RegistrationStat.objects.all().delete()
+        call_command('rebuild_registration_stats', stdout=StringIO())
+        rebuilt = sorted(RegistrationStat.objects.values_list('granularity', 'bucket_start', 'count'))
+        self.assertEqual(rebuilt, incremental)
+
+    def test_stats_follow_registrations_outside_the_api(self):
+        url = reverse('event-stats', kwargs={'pk': self.event.id})
+        # Created directly, as the admin does.
+        attendees = AttendeeFactory.create_batch(2, event=self.event)
+        self.assertEqual(self.client.get(url).data["registrations"], 2)
+
+        attendees[0].delete()
+        self.assertEqual(self.client.get(url).data["registrations"], 1)
+        self.assertEqual(RegistrationStat.objects.filter(event=self.event, granularity=RegistrationStat.DAY).count(), 1)
+
+        # A user deletion cascades to their registrations.
+        attendees[1].user.delete()
+        response = self.client.get(url)
+        self.assertEqual(response.data["registrations"], 0)
+        self.assertEqual(response.data["buckets"], [])
+
+    def test_invalid_granularity(self):
+        url = reverse('event-stats', kwargs={'pk': self.event.id})
+        response = self.client.get(url, {"granularity": "week"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_stats_restricted_to_creator_and_staff(self):
+        url = reverse('event-stats', kwargs={'pk': self.event.id})
+
+        self.client.force_authenticate(user=UserFactory())
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=UserFactory(is_staff=True))
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(user=None)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+@override_settings(EVENTS_CHANGES_SETTLE_SECONDS=0)
+class EventChangesTests(APITestCase):
+    """
+    Test suite for the incremental /events/changes/ feed.
+    """
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('event-changes')
+
+    def sync(self, cursor=None, **params):
+        if cursor:
+            params["since"] = cursor
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_full_sync_then_delta(self):
+        first, second = EventFactory.create_batch(2)
+        data = self.sync()
+        self.assertEqual([e["id"] for e in data["events"]], [first.id, second.id])
+        self.assertFalse(data["has_more"])
+
+        self.assertEqual(self.sync(data["cursor"])["events"], [])
+
+        first.name = "Renamed"
+        first.save()
+        delta = self.sync(data["cursor"])
+        self.assertEqual([e["id"] for e in delta["events"]], [first.id])
+        self.assertEqual(delta["events"][0]["name"], "Renamed")
+
+    def test_deletions_are_tombstones(self):
+        event = EventFactory()
+        cursor = self.sync()["cursor"]
+        event_id = event.id
+        event.delete()
+
+        delta = self.sync(cursor)
+        self.assertEqual(delta["events"], [])
+        self.assertEqual([d["id"] for d in delta["deleted"]], [event_id])
+
+    def test_pagination_with_limit(self):
+        events = EventFactory.create_batch(3)
+        page = self.sync(limit=2)
+        self.assertTrue(page["has_more"])
+        rest = self.sync(page["cursor"], limit=2)
+        self.assertFalse(rest["has_more"])
+        ids = [e["id"] for e in page["events"] + rest["events"]]
+        self.assertEqual(ids, [e.id for e in events])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"since": "garbage"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(EVENTS_CHANGES_SETTLE_SECONDS=60)
+    def test_recent_changes_are_held_back(self):
+        EventFactory()
+        self.assertEqual(self.sync()["events"], [])
+
+
+class OverlappingRegistrationTests(APITestCase):
+    """
+    Test suite for double-booking detection on registration and at /accounts/me/conflicts/.
+    """
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.start = timezone.now() + timedelta(days=1)
+
+    def make_event(self, start_hours, end_hours):
+        return EventFactory(
+            start_time=self.start + timedelta(hours=start_hours),
+            end_time=self.start + timedelta(hours=end_hours),
+        )
+
+    def register(self, event):
+        url = reverse('register_attendee-list', kwargs={'event_id': event.id})
+        return self.client.post(url, {"user": self.user.id}, format='json')
+
+    def test_overlap_allowed_by_default(self):
+        AttendeeFactory(event=self.make_event(0, 2), user=self.user)
+        response = self.register(self.make_event(1, 3))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    @override_settings(EVENTS_REJECT_OVERLAPPING_REGISTRATIONS=True)
+    def test_overlap_rejected_when_enabled(self):
+        AttendeeFactory(event=self.make_event(0, 2), user=self.user)
+
+        response = self.register(self.make_event(1, 3))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("overlapping event", str(response.data))
+
+        # Periods are half-open: an event starting when another ends does not overlap.
+        response = self.register(self.make_event(2, 4))
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    @override_settings(EVENTS_REJECT_OVERLAPPING_REGISTRATIONS=True)
+    def test_overlap_checked_again_when_saving(self):
+        validate = AttendeeSerializer.validate
+
+        def validate_then_race(serializer, attrs):
+            attrs = validate(serializer, attrs)
+            # A concurrent request registers the user after this one was validated.
+            AttendeeFactory(event=self.make_event(0, 2), user=self.user)
+            return attrs
+
+        with mock.patch.object(AttendeeSerializer, 'validate', validate_then_race):
+            response = self.register(self.make_event(1, 3))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.user.attendees.count(), 1)
+
+    def test_rescheduling_updates_registration_periods(self):
+        event = self.make_event(0, 2)
+        attendee = AttendeeFactory(event=event, user=self.user)
+        event.end_time = self.start + timedelta(hours=5)
+        event.save()
+
+        attendee.refresh_from_db()
+        self.assertEqual(attendee.event_end, event.end_time)
+
+        # Other edits leave the registrations alone.
+        event = Event.objects.get(pk=event.pk)
+        event.name = "Renamed"
+        with CaptureQueriesContext(connection) as queries:
+            event.save()
+        self.assertFalse([query for query in queries if query['sql'].startswith('UPDATE "events_attendee"')])
+
+        # Saving the period explicitly resyncs it, e.g. after a bulk update left the copies behind.
+        Event.objects.filter(pk=event.pk).update(start_time=event.start_time - timedelta(hours=1))
+        event.refresh_from_db()
+        event.save(update_fields=['start_time', 'end_time'])
+        attendee.refresh_from_db()
+        self.assertEqual(attendee.event_start, event.start_time)
+
+    def test_conflicts_endpoint(self):
+        first = self.make_event(0, 3)
+        second = self.make_event(1, 2)
+        third = self.make_event(2, 4)
+        separate = self.make_event(10, 11)
+        past = EventFactory(
+            start_time=timezone.now() - timedelta(days=2),
+            end_time=timezone.now() - timedelta(days=1),
+        )
+        past_overlap = EventFactory(start_time=past.start_time, end_time=past.end_time)
+        for event in (first, second, third, separate, past, past_overlap):
+            AttendeeFactory(event=event, user=self.user)
+
+        response = self.client.get(reverse('me-conflicts'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        conflicts = {conflict["event"]["id"]: conflict["overlaps"] for conflict in response.data}
+        self.assertEqual(conflicts, {
+            first.id: [second.id, third.id],
+            second.id: [first.id],
+            third.id: [first.id],
+        })
+
+        response = self.client.get(reverse('me-conflicts'), {"include_past": "true"})
+        self.assertEqual(len(response.data), 5)
+
+
+class EventBulkCreateTests(APITestCase):
+    """
+    Test suite for the /events/bulk/ endpoint.
+    """
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('event-bulk')
+
+    def make_items(self, count):
+        start = timezone.now() + timedelta(days=1)
+        return [
+            {
+                "name": f"Session {i}",
+                "location": "Hall A",
+                "start_time": (start + timedelta(hours=i)).isoformat(),
+                "end_time": (start + timedelta(hours=i, minutes=45)).isoformat(),
+                "max_capacity": 50,
+            }
+            for i in range(count)
+        ]
+
+    def test_creates_events_in_order(self):
+        response = self.client.post(self.url, self.make_items(3), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([e["name"] for e in response.data], ["Session 0", "Session 1", "Session 2"])
+        self.assertTrue(all(e["creator"]["id"] == self.user.id for e in response.data))
+        ids = [e["id"] for e in response.data]
+        self.assertEqual(list(Event.objects.order_by('id').values_list('id', flat=True)), ids)
+
+    def test_per_item_errors_create_nothing(self):
+        items = self.make_items(3)
+        items[1]["end_time"] = items[1]["start_time"]
+        del items[2]["name"]
+
+        response = self.client.post(self.url, items, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn("End time must be after start time.", str(response.data[1]))
+        self.assertIn("name", response.data[2])
+        self.assertFalse(Event.objects.exists())
+
+    def test_rejects_non_list_and_empty_payloads(self):
+        response = self.client.post(self.url, self.make_items(1)[0], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(self.url, [], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(EVENTS_BULK_MAX_ITEMS=2)
+    def test_rejects_too_many_items(self):
+        response = self.client.post(self.url, self.make_items(3), format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Event.objects.exists())
+
+    def test_query_count_does_not_grow_with_items(self):
+        with self.assertNumQueries(3):  # SAVEPOINT/INSERT/RELEASE inside the test transaction
+            self.client.post(self.url, self.make_items(2), format='json')
+        with self.assertNumQueries(3):
+            self.client.post(self.url, self.make_items(50), format='json')
+
+
+class EventCalendarTests(APITestCase):
+    """
+    Test suite for the /events/calendar/ endpoint.
+    """
+
+    def setUp(self):
+        self.client.force_authenticate(user=UserFactory())
+        self.url = reverse('event-calendar')
+
+    def make_event(self, start):
+        return EventFactory(start_time=start, end_time=start + timedelta(hours=1))
+
+    def test_buckets_by_local_day(self):
+        # 20:00 UTC on Jan 10 is already Jan 11 in Kolkata (UTC+5:30).
+        late = self.make_event(datetime(2030, 1, 10, 20, 0, tzinfo=dt_timezone.utc))
+        morning = self.make_event(datetime(2030, 1, 10, 6, 0, tzinfo=dt_timezone.utc))
+
+        response = self.client.get(self.url, {"from": "2030-01-10", "to": "2030-01-11", "tz": "UTC"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        days = {day["date"]: [e["id"] for e in day["events"]] for day in response.data["days"]}
+        self.assertEqual(days, {"2030-01-10": [morning.id, late.id]})
+
+        response = self.client.get(self.url, {"from": "2030-01-10", "to": "2030-01-11", "tz": "Asia/Kolkata"})
+        days = {day["date"]: [e["id"] for e in day["events"]] for day in response.data["days"]}
+        self.assertEqual(days, {"2030-01-10": [morning.id], "2030-01-11": [late.id]})
+        self.assertTrue(response.data["days"][1]["events"][0]["start_time"].endswith("+05:30"))
+
+    def test_counts_all_events_but_returns_first_per_day(self):
+        start = datetime(2030, 3, 1, 9, 0, tzinfo=dt_timezone.utc)
+        events = [self.make_event(start + timedelta(hours=i)) for i in range(5)]
+
+        with self.assertNumQueries(3):  # Events, recurring series, then creators
+            response = self.client.get(self.url, {"from": "2030-03-01", "to": "2030-03-01", "per_day": 2})
+        day = response.data["days"][0]
+        self.assertEqual(day["count"], 5)
+        self.assertEqual([e["id"] for e in day["events"]], [events[0].id, events[1].id])
+
+    def test_invalid_parameters(self):
+        for params in (
+            {"tz": "Mars/Olympus"},
+            {"from": "10/01/2030"},
+            {"from": "2030-01-10", "to": "2030-01-09"},
+            {"from": "2030-01-01", "to": "2031-01-01"},
+        ):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
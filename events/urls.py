@@ -1,5 +1,7 @@
 from rest_framework.routers import DefaultRouter
-from events.views import EventViewSet, AttendeeRegisterViewSet, AttendeeListViewSet
+from django.urls import path
+
+from events.views import EventViewSet, AttendeeRegisterViewSet, AttendeeListViewSet, event_live_view
 
 # Register EventViewSet with the router at the root of 'events/' URL
 router = DefaultRouter()
@@ -7,4 +9,7 @@ router.register(r'', EventViewSet, basename='event')
 router.register(r'(?P<event_id>\d+)/register', AttendeeRegisterViewSet, basename='register_attendee')
 router.register(r'(?P<event_id>\d+)/attendees', AttendeeListViewSet, basename='list_attendee')
 
-urlpatterns = router.urls
+urlpatterns = router.urls + [
+    # Server-Sent Events stream, served by the ASGI application
+    path('<int:event_id>/live/', event_live_view, name='event-live'),
+]
@@ -1,16 +1,112 @@
-from rest_framework import mixins, viewsets
+import asyncio
+from datetime import date, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from asgiref.sync import sync_to_async
+from rest_framework import exceptions, generics, mixins, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiExample, OpenApiResponse
 
-from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.core import signing
+from django.http import Http404, HttpResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
+from django.db import transaction
+from django.db.models import Q
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import parse_etags
 
 from accounts.serializers import UserSerializer
-from accounts.models import User
-from events.serializers import EventSerializer, AttendeeSerializer
-from events.models import Event, Attendee
+from accounts.models import User, generate_feed_nonce
+from event_management.utils.idempotency import IdempotentCreateMixin
+from event_management.utils.throttling import UserBucketThrottle, IPBucketThrottle, EventBucketThrottle
+from event_management.utils.timezone import convert_to_timezone
+from events import feeds
+from events.archive import events_with_archive
+from events.cache import get_attendee_page, get_event, get_events_by_ids
+from events.calendar import get_calendar, get_local_day_bounds
+from events.changes import decode_cursor, encode_cursor, get_changes
+from events.live import broadcaster, format_sse, get_capacity_snapshot, make_live_token, read_live_token
+from events.authentication import FeedTokenAuthentication
+from events.pagination import EventCursorPagination, CachedPageNumberPagination
+from events.permissions import IsCreatorOrStaff
+from events.renderers import ICalendarRenderer
+from events.overlaps import get_conflicts
+from events.recurrence import EventWindow, get_occurrences
+from events.serializers import (
+    EventSerializer, AttendeeSerializer, EventStatsSerializer, EventConflictSerializer, CalendarDaySerializer
+)
+from events.models import Event, Attendee, ArchivedEvent, RegistrationStat
+from events.stats import get_event_stats
+from events.tasks import enqueue_event_created_jobs, enqueue_registration_jobs
+
+
+def is_truthy(value):
+    """
+    Interprets a query parameter as a boolean flag (e.g. ?upcoming=true).
+    """
+    return str(value).lower() in ('1', 'true', 'yes', 'on')
+
+
+def parse_day_range(params, default_days):
+    """
+    Reads the `tz`, `from` and `to` query parameters of a window of local days.
+
+    Returns:
+        tuple: (tz name, tzinfo, first day, last day); `to` defaults to `default_days` after `from`.
+    """
+    tz_name = params.get('tz') or settings.TIME_ZONE
+    try:
+        tzinfo = ZoneInfo(tz_name)
+    except (ValueError, ZoneInfoNotFoundError) as e:
+        raise ValidationError({"tz": f"Unknown timezone: {tz_name}"}) from e
+
+    try:
+        first_day = date.fromisoformat(params['from']) if params.get('from') else timezone.now().astimezone(tzinfo).date()
+        last_day = date.fromisoformat(params['to']) if params.get('to') else first_day + timedelta(days=default_days)
+    except ValueError as e:
+        raise ValidationError({"from": "Dates must be formatted as YYYY-MM-DD."}) from e
+    if last_day < first_day:
+        raise ValidationError({"to": "Must not be before `from`."})
+    if (last_day - first_day).days >= settings.EVENTS_CALENDAR_MAX_DAYS:
+        raise ValidationError({"to": f"At most {settings.EVENTS_CALENDAR_MAX_DAYS} days can be requested at once."})
+    return tz_name, tzinfo, first_day, last_day
+
+
+INCLUDE_PAST_PARAMETER = OpenApiParameter(
+    name='include_past',
+    description='Also include archived (past) events',
+    required=False,
+    type=bool,
+    location=OpenApiParameter.QUERY,
+)
+
+WINDOW_PARAMETERS = [
+    OpenApiParameter(
+        name='from',
+        description='List the events starting from this day, YYYY-MM-DD in `tz`, in start order, '
+                    'with the occurrences of recurring events (default: today when `to` is given)',
+        required=False,
+        type=OpenApiTypes.DATE,
+        location=OpenApiParameter.QUERY,
+    ),
+    OpenApiParameter(
+        name='to',
+        description='Last day of the window, inclusive (default: 30 days after `from`)',
+        required=False,
+        type=OpenApiTypes.DATE,
+        location=OpenApiParameter.QUERY,
+    ),
+]
 
 
+@extend_schema_view(list=extend_schema(parameters=[INCLUDE_PAST_PARAMETER, *WINDOW_PARAMETERS]))
 @extend_schema(
     tags=["Events"],
     description="API endpoint to manage events. Optional timezone support via ?tz=Europe/London.",
@@ -42,6 +138,7 @@ from events.models import Event, Attendee
     ]
 )
 class EventViewSet(
+    IdempotentCreateMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     mixins.CreateModelMixin,
@@ -54,39 +151,562 @@ class EventViewSet(
     - Authenticated users can list and create events.
     - Automatically associates the authenticated user as the event creator.
     - Supports optional timezone conversion for datetime fields via the `tz` query parameter (e.g., ?tz=Europe/London).
+    - Creation honors the `Idempotency-Key` header, so client retries never create duplicates.
+    - Lists only the hot table by default; `?include_past=true` also returns archived events.
+    - `?from=&to=` lists the events of a window of days in start order, including the
+      occurrences of recurring events, which are expanded per request rather than stored.
     """
-    queryset = Event.objects.all().order_by('-created_at')
+    queryset = Event.objects.order_by('-created_at')
     serializer_class = EventSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        if self.action == 'list' and is_truthy(self.request.query_params.get('include_past')):
+            return events_with_archive().order_by('-created_at')
+        return super().get_queryset()
+
+    def list(self, request, *args, **kwargs):
+        params = request.query_params
+        if not (params.get('from') or params.get('to')):
+            return super().list(request, *args, **kwargs)
+
+        _, tzinfo, first_day, last_day = parse_day_range(params, default_days=30)
+        start, end = get_local_day_bounds(first_day, last_day, tzinfo)
+        window = EventWindow(
+            Event.objects.filter(start_time__gte=start, start_time__lt=end, recurrence='').order_by('start_time', 'id'),
+            get_occurrences(start, end),
+        )
+        page = self.paginate_queryset(window)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Reads the event through the per-event cache, so an expiring hot event is
+        reloaded by one request while concurrent ones wait or get the stale copy.
+        """
+        try:
+            event = get_event(int(kwargs['pk']))
+        except (ValueError, Event.DoesNotExist) as e:
+            raise Http404 from e
+        return Response(self.get_serializer(event).data)
+
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            event = serializer.save()
+            enqueue_event_created_jobs([event])
+
+    @extend_schema(
+        description=(
+            "Create many events in one request (e.g. a conference schedule). Every item is "
+            "validated like `POST /events/`; if any fails, nothing is created and the 400 "
+            "response holds one error object per item, in request order (empty for valid items). "
+            "Created events are returned in request order."
+        ),
+        request=EventSerializer(many=True),
+        responses={201: EventSerializer(many=True)},
+    )
+    @action(detail=False, methods=['post'], url_path='bulk', url_name='bulk')
+    def bulk(self, request):
+        """
+        Validates the whole list, then inserts it with one `bulk_create` in a single transaction.
+        """
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=settings.EVENTS_BULK_MAX_ITEMS,
+        )
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            events = serializer.save()
+            enqueue_event_created_jobs(events)
+        # bulk_create sends no post_save signals: invalidate the creator's calendar feed here.
+        feeds.invalidate_feeds([request.user.pk])
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @extend_schema(
+        description=(
+            "Fetch many events by id in one call. Results follow the requested order; "
+            "unknown ids are reported under `missing`."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='ids',
+                description='Comma-separated event ids (e.g., 1,2,3)',
+                required=True,
+                type=str,
+                location=OpenApiParameter.QUERY,
+            ),
+        ],
+        responses={200: OpenApiResponse(description='Object with `results` and `missing` keys')},
+    )
+    @action(detail=False, methods=['get'], url_path='batch', url_name='batch')
+    def batch(self, request):
+        """
+        Returns the requested events with a fixed number of queries, reusing
+        per-event cache entries so only cache misses reach the database.
+        """
+        raw_ids = [value for value in request.query_params.get('ids', '').split(',') if value.strip()]
+        if not raw_ids:
+            raise ValidationError({"ids": "This query parameter is required."})
+        try:
+            ids = list(dict.fromkeys(int(value) for value in raw_ids))
+        except ValueError as e:
+            raise ValidationError({"ids": "Must be a comma-separated list of integers."}) from e
+        if len(ids) > settings.EVENTS_BATCH_MAX_IDS:
+            raise ValidationError({"ids": f"At most {settings.EVENTS_BATCH_MAX_IDS} ids can be requested at once."})
+
+        events = get_events_by_ids(ids)
+        found = {event.id for event in events}
+        serializer = self.get_serializer(events, many=True)
+        return Response({
+            "results": serializer.data,
+            "missing": [event_id for event_id in ids if event_id not in found],
+        })
+
+    @extend_schema(
+        description=(
+            "Incremental sync: events created or updated after the `since` cursor, in "
+            "(updated_at, id) order, plus tombstones of deleted events. Pass the returned "
+            "`cursor` as `since` on the next call; omit it for a full sync."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='since',
+                description='Cursor returned by the previous call',
+                required=False,
+                type=str,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name='limit',
+                description='Maximum number of changes to return',
+                required=False,
+                type=int,
+                location=OpenApiParameter.QUERY,
+            ),
+        ],
+        responses={200: OpenApiResponse(description='Object with `events`, `deleted`, `cursor` and `has_more` keys')},
+    )
+    @action(detail=False, methods=['get'], url_path='changes', url_name='changes')
+    def changes(self, request):
+        since = request.query_params.get('since')
+        position = decode_cursor(since) if since else None
+
+        try:
+            limit = int(request.query_params.get('limit', settings.EVENTS_CHANGES_PAGE_SIZE))
+        except ValueError as e:
+            raise ValidationError({"limit": "Must be an integer."}) from e
+        limit = max(1, min(limit, settings.EVENTS_CHANGES_MAX_PAGE_SIZE))
+
+        events, tombstones, next_position, has_more = get_changes(position, limit)
+        return Response({
+            "events": self.get_serializer(events, many=True).data,
+            "deleted": [
+                {"id": tombstone.event_id, "deleted_at": tombstone.deleted_at}
+                for tombstone in tombstones
+            ],
+            "cursor": encode_cursor(*next_position) if next_position else None,
+            "has_more": has_more,
+        })
+
+    @extend_schema(
+        description=(
+            "Calendar grid: events bucketed by local start day in the `tz` timezone, with the "
+            "number of events of each day and the first `per_day` of them (by start time). "
+            "Days without events are omitted."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='from',
+                description='First day, YYYY-MM-DD in `tz` (default: today)',
+                required=False,
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name='to',
+                description='Last day, inclusive (default: 30 days after `from`)',
+                required=False,
+                type=OpenApiTypes.DATE,
+                location=OpenApiParameter.QUERY,
+            ),
+            OpenApiParameter(
+                name='per_day',
+                description='Events returned per day',
+                required=False,
+                type=int,
+                location=OpenApiParameter.QUERY,
+            ),
+        ],
+        responses={200: OpenApiResponse(
+            response=CalendarDaySerializer(many=True),
+            description='Object with `timezone`, `from`, `to` and `days` keys',
+        )},
+    )
+    @action(detail=False, methods=['get'], url_path='calendar', url_name='calendar')
+    def calendar(self, request):
+        """
+        Buckets and truncates in SQL (one query, plus one for the creators), instead of converting every event in Python.
+        """
+        params = request.query_params
+        tz_name, tzinfo, first_day, last_day = parse_day_range(params, default_days=30)
+
+        try:
+            per_day = int(params.get('per_day', settings.EVENTS_CALENDAR_PER_DAY))
+        except ValueError as e:
+            raise ValidationError({"per_day": "Must be an integer."}) from e
+        per_day = max(1, min(per_day, settings.EVENTS_CALENDAR_MAX_PER_DAY))
+
+        days = get_calendar(first_day, last_day, tzinfo, per_day)
+        return Response({
+            "timezone": tz_name,
+            "from": first_day,
+            "to": last_day,
+            "days": CalendarDaySerializer(days, many=True, context=self.get_serializer_context()).data,
+        })
+
+    @extend_schema(
+        description=(
+            "Registration statistics of an event: registrations over time, fill rate and "
+            "time to sell-out (hour resolution). Buckets use UTC boundaries. "
+            "Restricted to the event's creator and staff."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='granularity',
+                description='Bucket size of the time series',
+                required=False,
+                type=str,
+                enum=[RegistrationStat.HOUR, RegistrationStat.DAY],
+                default=RegistrationStat.DAY,
+                location=OpenApiParameter.QUERY,
+            ),
+        ],
+        responses={200: EventStatsSerializer},
+    )
+    @action(
+        detail=True,
+        methods=['get'],
+        url_path='stats',
+        url_name='stats',
+        permission_classes=[IsAuthenticated, IsCreatorOrStaff],
+    )
+    def stats(self, request, pk=None):
+        """
+        Reads the incrementally maintained rollup, so the cost is O(buckets) rather than O(attendees).
+        Only the event's creator and staff may read it.
+        """
+        granularity = request.query_params.get('granularity', RegistrationStat.DAY)
+        if granularity not in (RegistrationStat.HOUR, RegistrationStat.DAY):
+            raise ValidationError({"granularity": "Must be 'hour' or 'day'."})
+
+        try:
+            event = self.get_object()
+        except Http404:
+            event = generics.get_object_or_404(ArchivedEvent, pk=pk)
+            self.check_object_permissions(request, event)
+        serializer = EventStatsSerializer(get_event_stats(event, granularity), context=self.get_serializer_context())
+        return Response(serializer.data)
+
+    @extend_schema(
+        description=(
+            "iCalendar feed of the events the user created or is registered for. "
+            "Calendar apps authenticate with the signed `token` from `/events/feed-url/`. "
+            "Supports conditional GET via `If-None-Match`."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='token',
+                description='Signed feed token, for clients that cannot send a bearer token',
+                required=False,
+                type=str,
+                location=OpenApiParameter.QUERY,
+            ),
+        ],
+        responses={(200, 'text/calendar'): OpenApiTypes.STR, 304: OpenApiResponse(description='Not modified')},
+    )
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path=r'feed\.ics',
+        url_name='feed',
+        renderer_classes=[ICalendarRenderer],
+        authentication_classes=[JWTAuthentication, FeedTokenAuthentication],
+    )
+    def feed(self, request):
+        """
+        Streams the user's events as iCalendar, cached per (user, tz).
+
+        The cache entry and ETag are keyed on a per-user version that is bumped
+        whenever the user's registrations or their events change, so a poll with
+        a current ETag costs a single cache read.
+        """
+        tz = request.query_params.get('tz', '')
+        if tz:
+            convert_to_timezone(timezone.now(), tz)  # Rejects unknown timezones with a 400
+
+        user_id = request.user.pk
+        version = feeds.get_feed_version(user_id)
+        etag = feeds.get_feed_etag(user_id, version, tz)
+
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            response = HttpResponseNotModified()
+        else:
+            content_type = f'{ICalendarRenderer.media_type}; charset={ICalendarRenderer.charset}'
+            body = feeds.get_cached_feed(user_id, version, tz)
+            if body is not None:
+                response = HttpResponse(body, content_type=content_type)
+            else:
+                chunks = feeds.render_feed(feeds.get_feed_events(request.user), tz or None)
+                response = StreamingHttpResponse(
+                    feeds.cache_feed_while_streaming(chunks, user_id, version, tz),
+                    content_type=content_type,
+                )
+
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    @extend_schema(
+        description=(
+            "Returns the calendar subscription URL of the authenticated user's iCalendar feed. "
+            "`POST` issues a new URL and revokes every URL issued before."
+        ),
+        request=None,
+        responses={200: OpenApiResponse(description='Object with a `url` key')},
+    )
+    @action(detail=False, methods=['get', 'post'], url_path='feed-url', url_name='feed-url')
+    def feed_url(self, request):
+        if request.method == 'POST':
+            request.user.feed_nonce = generate_feed_nonce()
+            request.user.save(update_fields=['feed_nonce'])
+        path = f"{reverse('event-feed')}?token={feeds.make_feed_token(request.user)}"
+        return Response({"url": request.build_absolute_uri(path)})
+
+    @extend_schema(
+        description=(
+            "Returns a URL of the event's live capacity stream carrying a signed token, for "
+            "browsers' `EventSource`, which cannot send an Authorization header. The URL must be "
+            "opened within `EVENTS_LIVE_TOKEN_MAX_AGE` seconds."
+        ),
+        responses={200: OpenApiResponse(description='Object with `url` and `expires_in` keys')},
+    )
+    @action(detail=True, methods=['get'], url_path='live-url', url_name='live-url')
+    def live_url(self, request, pk=None):
+        event_id = int(pk) if pk.isdigit() else None
+        if event_id is None or not Event.objects.filter(pk=event_id).exists():
+            raise Http404
+        path = f"{reverse('event-live', kwargs={'event_id': event_id})}?token={make_live_token(request.user, event_id)}"
+        return Response({
+            "url": request.build_absolute_uri(path),
+            "expires_in": settings.EVENTS_LIVE_TOKEN_MAX_AGE,
+        })
+
+
+@extend_schema(
+    tags=["Events"],
+    description="Events the authenticated user created or is registered for, ordered by start time.",
+    parameters=[
+        OpenApiParameter(
+            name='upcoming',
+            description='Only return events that have not started yet',
+            required=False,
+            type=bool,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name='tz',
+            description='Optional timezone string (e.g., Asia/Kolkata, Europe/London)',
+            required=False,
+            type=str,
+            location=OpenApiParameter.QUERY,
+        ),
+    ]
+)
+class MyEventsView(generics.ListAPIView):
+    """
+    API endpoint listing the events of the authenticated user (created plus attending).
+
+    Registrations are looked up through the user-first `attendee_user_event_idx`
+    index and the result is cursor-paginated on `(start_time, id)`.
+    """
+    serializer_class = EventSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = EventCursorPagination
+
+    def get_queryset(self):
+        user = self.request.user
+        attending = Attendee.objects.filter(user=user).values('event_id')
+        queryset = Event.objects.filter(Q(creator=user) | Q(id__in=attending))
+
+        if is_truthy(self.request.query_params.get('upcoming')):
+            queryset = queryset.filter(start_time__gte=timezone.now())
+
+        return queryset
+
+
+@extend_schema(
+    tags=["Events"],
+    description=(
+        "Events the authenticated user is registered for that overlap another of their "
+        "registrations ([start_time, end_time) periods), each with the ids of the events it overlaps."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name='include_past',
+            description='Also check events that have already ended',
+            required=False,
+            type=bool,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name='tz',
+            description='Optional timezone string (e.g., Asia/Kolkata, Europe/London)',
+            required=False,
+            type=str,
+            location=OpenApiParameter.QUERY,
+        ),
+    ],
+    responses={200: EventConflictSerializer(many=True)},
+)
+class MyConflictsView(generics.GenericAPIView):
+    """
+    API endpoint listing the double bookings of the authenticated user.
+
+    Registrations are read in start order from `attendee_user_period_idx` and
+    compared in a single sweep, so the cost does not depend on other users' data.
+    """
+    serializer_class = EventConflictSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        conflicts = get_conflicts(request.user, include_past=is_truthy(request.query_params.get('include_past')))
+        return Response(self.get_serializer(conflicts, many=True).data)
+
 
 @extend_schema(
     tags=["Attendees"],
     description="API endpoint to register attendees for an event."
 )
-class AttendeeRegisterViewSet(mixins.CreateModelMixin, viewsets.GenericViewSet):
+class AttendeeRegisterViewSet(IdempotentCreateMixin, mixins.CreateModelMixin, viewsets.GenericViewSet):
     """
     API endpoint to register an attendee for a specific event.
     Enforces constraints such as duplicate registration, max capacity, and creator restriction.
+    Retries carrying the same `Idempotency-Key` header replay the first response.
     """
     serializer_class = AttendeeSerializer
     permission_classes = [IsAuthenticated]
+    throttle_classes = [UserBucketThrottle, IPBucketThrottle, EventBucketThrottle]
+    throttle_scope = 'registration'
     queryset = Attendee.objects.all()
 
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            attendee = serializer.save()
+            enqueue_registration_jobs(attendee)
+
 
 @extend_schema(
     tags=["Attendees"],
-    description="API endpoint to list attendees for an event."
+    description="API endpoint to list attendees for an event.",
+    parameters=[INCLUDE_PAST_PARAMETER],
 )
 class AttendeeListViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
     """
     API endpoint to list all registered users (attendees) for a specific event.
     Returns a list of user profiles associated with that event.
+    Attendees of archived events are returned when `?include_past=true` is given.
+    Pages are cached per event and filled single-flight (see `events.cache.get_attendee_page`).
     """
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
-    queryset = User.objects.all().prefetch_related('attendees')
+    pagination_class = CachedPageNumberPagination
+    queryset = User.objects.all()
+
+    def list(self, request, *args, **kwargs):
+        page_key = self.paginator.get_page_key(request)
+        if page_key is None:
+            return super().list(request, *args, **kwargs)
+
+        def compute():
+            data = super(AttendeeListViewSet, self).list(request, *args, **kwargs).data
+            return {'count': data['count'], 'results': data['results']}
+
+        include_past = is_truthy(request.query_params.get('include_past'))
+        data = get_attendee_page(int(self.kwargs['event_id']), (*page_key, int(include_past)), compute)
+        return self.paginator.get_cached_response(request, page_key, data['count'], data['results'])
 
     def get_queryset(self):
-        event = get_object_or_404(Event, pk=self.kwargs['event_id'])
-        return super().get_queryset().filter(attendees__event_id=event.id).distinct().order_by('id')
+        queryset = super().get_queryset()
+        event_id = self.kwargs['event_id']
+
+        if Event.objects.filter(pk=event_id).exists():
+            return queryset.filter(attendees__event_id=event_id).distinct().order_by('id')
+
+        include_past = is_truthy(self.request.query_params.get('include_past'))
+        if include_past and ArchivedEvent.objects.filter(pk=event_id).exists():
+            return queryset.filter(archived_attendees__event_id=event_id).distinct().order_by('id')
+
+        raise Http404
+
+
+def _authenticate_live(request, event_id):
+    """
+    Returns the user of a live stream request, from a `?token=` issued by
+    `EventViewSet.live_url` or a bearer token, or None.
+    """
+    token = request.GET.get('token')
+    if token:
+        try:
+            user_id = read_live_token(token, event_id)
+        except signing.BadSignature:
+            return None
+        return User.objects.filter(pk=user_id, is_active=True).first()
+
+    try:
+        result = JWTAuthentication().authenticate(request)
+    except exceptions.AuthenticationFailed:
+        return None
+    return result[0] if result else None
+
+
+async def event_live_view(request, event_id):
+    """
+    Server-Sent Events stream of the attendee count of an event ("spots left").
+
+    Sends a `capacity` event on connect and whenever a registration for the event
+    commits, plus keep-alive comments. Must be served by the ASGI application:
+    each client is a coroutine awaiting the shared broadcaster, not a thread, and
+    updates are computed once per registration rather than once per client.
+    Browsers connect with the signed URL from `/events/{id}/live-url/`.
+    """
+    user = await sync_to_async(_authenticate_live)(request, event_id)
+    if user is None:
+        return JsonResponse({"detail": "Authentication credentials were not provided."}, status=401)
+
+    subscription = broadcaster.subscribe(event_id)
+    snapshot = broadcaster.latest(event_id) or await sync_to_async(get_capacity_snapshot)(event_id)
+    if snapshot is None:
+        broadcaster.unsubscribe(subscription)
+        return JsonResponse({"detail": "Not found."}, status=404)
+
+    heartbeat = settings.EVENTS_LIVE_HEARTBEAT_SECONDS
+
+    async def stream():
+        try:
+            yield format_sse(snapshot)
+            while True:
+                try:
+                    payload = await asyncio.wait_for(subscription.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                else:
+                    yield format_sse(payload)
+        finally:
+            broadcaster.unsubscribe(subscription)
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
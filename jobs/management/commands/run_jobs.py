@@ -0,0 +1,63 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from jobs.queue import claim_jobs, get_queue_stats, requeue_stale_jobs, run_job
+
+
+class Command(BaseCommand):
+    help = "Runs background jobs from the database queue. Start as many workers as needed."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.JOBS_BATCH_SIZE,
+            help=f"Jobs claimed per round trip (default: {settings.JOBS_BATCH_SIZE}).",
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=settings.JOBS_POLL_INTERVAL,
+            help=f"Seconds to sleep when the queue is empty (default: {settings.JOBS_POLL_INTERVAL}).",
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help="Exit once no job is due instead of polling.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        succeeded = failed = 0
+        try:
+            while True:
+                close_old_connections()
+                requeued, stale_failed = requeue_stale_jobs()
+                if requeued or stale_failed:
+                    self.stdout.write(f"Requeued {requeued} stale jobs, marked {stale_failed} failed")
+
+                jobs = claim_jobs(batch_size)
+                for job in jobs:
+                    if run_job(job):
+                        succeeded += 1
+                    else:
+                        failed += 1
+
+                if not jobs:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll_interval'])
+        except KeyboardInterrupt:
+            pass
+
+        stats = get_queue_stats()
+        self.stdout.write(self.style.SUCCESS(
+            f"Ran {succeeded + failed} jobs ({failed} failed). "
+            f"Queue: {stats['due']} due, {stats['pending']} pending, {stats['failed']} failed."
+        ))
@@ -0,0 +1,52 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    A unit of background work, stored in the application database.
+
+    Jobs are written in the transaction of the request that creates them, so a
+    worker can only claim them once that transaction has committed, and they
+    disappear with it on rollback. Succeeded jobs are deleted; failed jobs are
+    kept for inspection and manual retry from the admin.
+
+    Fields:
+        - name: Registered handler to run (see `jobs.registry`).
+        - payload: Keyword arguments passed to the handler.
+        - status: pending, running or failed.
+        - attempts: Number of times the job has been claimed.
+        - max_attempts: Attempts after which the job is marked failed.
+        - run_at: Earliest time the job may run (pushed back after each failure).
+        - locked_at: When a worker claimed the job; stale claims are requeued.
+        - last_error: Traceback of the last failed attempt.
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (FAILED, 'Failed'),
+    ]
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Claim order of the worker; only pending rows are indexed, so the index stays small.
+            models.Index(fields=['run_at', 'id'], condition=Q(status='pending'), name='job_pending_idx'),
+            models.Index(fields=['locked_at'], condition=Q(status='running'), name='job_running_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
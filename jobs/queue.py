@@ -0,0 +1,143 @@
+import logging
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.registry import get_handler
+
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(name, **payload):
+    """
+    Adds a job in the current transaction.
+
+    Workers only see the row once the surrounding transaction commits, and it is
+    discarded if the transaction rolls back, so side effects never run for work
+    that did not happen (and are not lost if the process dies right after the commit).
+    """
+    return Job.objects.create(name=name, payload=payload, max_attempts=settings.JOBS_MAX_ATTEMPTS)
+
+
+def enqueue_many(name, payloads):
+    """
+    Adds one job per payload with a single INSERT, in the current transaction.
+    """
+    return Job.objects.bulk_create([
+        Job(name=name, payload=payload, max_attempts=settings.JOBS_MAX_ATTEMPTS)
+        for payload in payloads
+    ])
+
+
+def claim_jobs(batch_size):
+    """
+    Claims up to `batch_size` due jobs for this worker, oldest first.
+
+    Rows are selected with `FOR UPDATE SKIP LOCKED`, so concurrent workers claim
+    disjoint batches without waiting on each other, and marked running in the
+    same short transaction.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            Job.objects
+            .select_for_update(skip_locked=True)
+            .filter(status=Job.PENDING, run_at__lte=now)
+            .order_by('run_at', 'id')[:batch_size]
+        )
+        if jobs:
+            Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+                status=Job.RUNNING, locked_at=now, attempts=F('attempts') + 1,
+            )
+    for job in jobs:
+        job.status, job.locked_at, job.attempts = Job.RUNNING, now, job.attempts + 1
+    return jobs
+
+
+STALE_ERROR = "Worker stopped while running the job (claimed more than JOBS_LOCK_TIMEOUT seconds ago)."
+
+
+def requeue_stale_jobs():
+    """
+    Returns jobs whose worker died mid-run (claimed more than `JOBS_LOCK_TIMEOUT` seconds ago) to the queue.
+
+    The lost run counts as an attempt (`claim_jobs` counted it), so a job that
+    keeps killing its worker is marked failed once it has used up `max_attempts`
+    instead of being requeued forever.
+
+    Returns:
+        tuple: Number of (requeued, failed) jobs.
+    """
+    now = timezone.now()
+    stale = Job.objects.filter(status=Job.RUNNING, locked_at__lt=now - timedelta(seconds=settings.JOBS_LOCK_TIMEOUT))
+    with transaction.atomic():
+        failed = stale.filter(attempts__gte=F('max_attempts')).update(
+            status=Job.FAILED, locked_at=None, last_error=STALE_ERROR,
+        )
+        requeued = stale.update(status=Job.PENDING, locked_at=None, run_at=now, last_error=STALE_ERROR)
+    if failed:
+        logger.error("%s stale jobs failed after their last attempt", failed)
+    return requeued, failed
+
+
+def get_retry_delay(attempts):
+    """
+    Exponential backoff: `JOBS_RETRY_BACKOFF_SECONDS` doubled per failed attempt, capped at `JOBS_RETRY_BACKOFF_MAX_SECONDS`.
+    """
+    delay = settings.JOBS_RETRY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0)
+    return timedelta(seconds=min(delay, settings.JOBS_RETRY_BACKOFF_MAX_SECONDS))
+
+
+def run_job(job):
+    """
+    Runs a claimed job. Succeeded jobs are deleted; failed ones are rescheduled
+    with backoff, or marked failed once they have used up their attempts.
+
+    Returns:
+        bool: Whether the job succeeded.
+    """
+    try:
+        get_handler(job.name)(**job.payload)
+    except Exception:
+        job.last_error = traceback.format_exc()
+        job.locked_at = None
+        if job.attempts >= job.max_attempts:
+            job.status = Job.FAILED
+            logger.error("Job %s failed after %s attempts", job, job.attempts)
+        else:
+            job.status = Job.PENDING
+            job.run_at = timezone.now() + get_retry_delay(job.attempts)
+            logger.warning("Job %s failed, retrying at %s", job, job.run_at)
+        job.save(update_fields=['status', 'run_at', 'locked_at', 'last_error'])
+        return False
+
+    job.delete()
+    return True
+
+
+def get_queue_stats():
+    """
+    Queue-depth metrics, computed with one aggregate query.
+
+    Returns:
+        dict: Number of pending (and of those, due) jobs, running and failed jobs,
+        and the age in seconds of the oldest due job (0 when none is waiting).
+    """
+    now = timezone.now()
+    due = Q(status=Job.PENDING, run_at__lte=now)
+    stats = Job.objects.aggregate(
+        pending=Count('id', filter=Q(status=Job.PENDING)),
+        due=Count('id', filter=due),
+        running=Count('id', filter=Q(status=Job.RUNNING)),
+        failed=Count('id', filter=Q(status=Job.FAILED)),
+        oldest_due=Min('run_at', filter=due),
+    )
+    oldest_due = stats.pop('oldest_due')
+    stats['oldest_due_age_seconds'] = (now - oldest_due).total_seconds() if oldest_due else 0
+    return stats
@@ -0,0 +1,24 @@
+_handlers = {}
+
+
+def job(name):
+    """
+    Registers a function as the handler of jobs called `name`.
+
+    Handlers receive the job payload as keyword arguments and must be idempotent:
+    a job is retried after a failure or after a worker dies mid-run.
+    """
+    def register(func):
+        if name in _handlers and _handlers[name] is not func:
+            raise ValueError(f"Job handler {name!r} is already registered.")
+        _handlers[name] = func
+        return func
+    return register
+
+
+def get_handler(name):
+    """
+    Raises:
+        KeyError: If no handler is registered under `name`.
+    """
+    return _handlers[name]
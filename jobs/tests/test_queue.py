@@ -0,0 +1,204 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from django.core import mail
+from django.core.management import call_command
+from django.db import transaction
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.tests.factories import UserFactory
+from events.tasks import DELIVER_WEBHOOK, SEND_REGISTRATION_CONFIRMATION
+from events.tests.factories import EventFactory
+from jobs.models import Job
+from jobs.queue import claim_jobs, enqueue, get_queue_stats, requeue_stale_jobs, run_job
+from jobs.registry import job
+
+
+calls = []
+
+
+@job('tests.record')
+def record(value):
+    calls.append(value)
+
+
+@job('tests.fail')
+def fail():
+    raise RuntimeError("boom")
+
+
+class JobQueueTests(APITestCase):
+    """
+    Test suite for claiming, running and retrying jobs.
+    """
+
+    def setUp(self):
+        calls.clear()
+
+    def test_run_deletes_succeeded_jobs(self):
+        enqueue('tests.record', value=1)
+        enqueue('tests.record', value=2)
+
+        jobs = claim_jobs(10)
+        self.assertEqual([j.status for j in jobs], [Job.RUNNING, Job.RUNNING])
+        self.assertEqual(claim_jobs(10), [])
+
+        for claimed in jobs:
+            self.assertTrue(run_job(claimed))
+        self.assertEqual(calls, [1, 2])
+        self.assertFalse(Job.objects.exists())
+
+    def test_claims_only_due_jobs_in_batches(self):
+        for value in range(3):
+            enqueue('tests.record', value=value)
+        Job.objects.create(name='tests.record', payload={"value": 9}, run_at=timezone.now() + timedelta(hours=1))
+
+        self.assertEqual([j.payload["value"] for j in claim_jobs(2)], [0, 1])
+        self.assertEqual([j.payload["value"] for j in claim_jobs(2)], [2])
+
+    @override_settings(JOBS_MAX_ATTEMPTS=2, JOBS_RETRY_BACKOFF_SECONDS=30)
+    def test_failures_retry_with_backoff_then_fail(self):
+        enqueue('tests.fail')
+
+        failed = claim_jobs(1)[0]
+        before = timezone.now()
+        with self.assertLogs('jobs.queue', 'WARNING'):
+            self.assertFalse(run_job(failed))
+        failed.refresh_from_db()
+        self.assertEqual(failed.status, Job.PENDING)
+        self.assertGreaterEqual(failed.run_at, before + timedelta(seconds=30))
+        self.assertIn("boom", failed.last_error)
+
+        Job.objects.update(run_at=timezone.now())
+        with self.assertLogs('jobs.queue', 'ERROR'):
+            self.assertFalse(run_job(claim_jobs(1)[0]))
+        failed.refresh_from_db()
+        self.assertEqual((failed.status, failed.attempts), (Job.FAILED, 2))
+
+    @override_settings(JOBS_LOCK_TIMEOUT=60)
+    def test_stale_running_jobs_are_requeued(self):
+        enqueue('tests.record', value=1)
+        claim_jobs(1)
+        Job.objects.update(locked_at=timezone.now() - timedelta(minutes=5))
+
+        self.assertEqual(requeue_stale_jobs(), (1, 0))
+        self.assertEqual(len(claim_jobs(1)), 1)
+
+    @override_settings(JOBS_LOCK_TIMEOUT=60, JOBS_MAX_ATTEMPTS=2)
+    def test_jobs_killing_their_worker_fail_after_max_attempts(self):
+        enqueue('tests.record', value=1)
+
+        def crash():
+            claim_jobs(1)
+            Job.objects.update(locked_at=timezone.now() - timedelta(minutes=5))
+
+        crash()
+        self.assertEqual(requeue_stale_jobs(), (1, 0))
+        crash()
+        with self.assertLogs('jobs.queue', 'ERROR'):
+            self.assertEqual(requeue_stale_jobs(), (0, 1))
+
+        job = Job.objects.get()
+        self.assertEqual((job.status, job.attempts), (Job.FAILED, 2))
+        self.assertEqual(claim_jobs(1), [])
+
+    def test_queue_stats(self):
+        enqueue('tests.record', value=1)
+        Job.objects.create(name='tests.record', run_at=timezone.now() + timedelta(hours=1))
+        Job.objects.create(name='tests.fail', status=Job.FAILED)
+
+        stats = get_queue_stats()
+        self.assertEqual(
+            {key: stats[key] for key in ('pending', 'due', 'running', 'failed')},
+            {'pending': 2, 'due': 1, 'running': 0, 'failed': 1},
+        )
+        self.assertGreaterEqual(stats['oldest_due_age_seconds'], 0)
+
+    def test_stats_endpoint_is_staff_only(self):
+        user = UserFactory()
+        self.client.force_authenticate(user=user)
+        self.assertEqual(self.client.get(reverse('job-stats')).status_code, status.HTTP_403_FORBIDDEN)
+
+        user.is_staff = True
+        user.save()
+        response = self.client.get(reverse('job-stats'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['due'], 0)
+
+    def test_worker_command_drains_queue(self):
+        enqueue('tests.record', value=1)
+        enqueue('tests.fail')
+
+        out = StringIO()
+        with self.assertLogs('jobs.queue', 'WARNING'):
+            call_command('run_jobs', '--once', stdout=out)
+        self.assertEqual(calls, [1])
+        self.assertIn("Ran 2 jobs (1 failed)", out.getvalue())
+        self.assertEqual(Job.objects.get().status, Job.PENDING)
+
+
+class RegistrationJobTests(APITestCase):
+    """
+    Test suite for the jobs enqueued by registrations and event creation.
+    """
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.client.force_authenticate(user=self.user)
+
+    def register(self, event):
+        url = reverse('register_attendee-list', kwargs={'event_id': event.id})
+        return self.client.post(url, {"user": self.user.id}, format='json')
+
+    def test_registration_sends_confirmation_through_queue(self):
+        event = EventFactory()
+        response = self.register(event)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(mail.outbox), 0)
+
+        queued = Job.objects.get()
+        self.assertEqual(queued.name, SEND_REGISTRATION_CONFIRMATION)
+
+        call_command('run_jobs', '--once', stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn(event.name, mail.outbox[0].subject)
+        self.assertEqual(mail.outbox[0].to, [self.user.email])
+
+    def test_failed_registration_enqueues_nothing(self):
+        event = EventFactory(creator=self.user)
+        response = self.register(event)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Job.objects.exists())
+
+    def test_rolled_back_jobs_disappear(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            enqueue('tests.record', value=1)
+            raise RuntimeError
+        self.assertFalse(Job.objects.exists())
+
+    @override_settings(EVENTS_WEBHOOK_URL='https://example.com/hook')
+    def test_event_creation_delivers_webhooks(self):
+        start = timezone.now() + timedelta(days=1)
+        item = {
+            "name": "Keynote",
+            "location": "Hall A",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(hours=1)).isoformat(),
+            "max_capacity": 10,
+        }
+        self.client.post(reverse('event-list'), item, format='json')
+        self.client.post(reverse('event-bulk'), [item, item], format='json')
+        self.assertEqual(Job.objects.filter(name=DELIVER_WEBHOOK).count(), 3)
+
+        with mock.patch('urllib.request.urlopen') as urlopen:
+            call_command('run_jobs', '--once', stdout=StringIO())
+        self.assertEqual(urlopen.call_count, 3)
+        request = urlopen.call_args.args[0]
+        self.assertEqual(request.full_url, 'https://example.com/hook')
+        self.assertIn(b'"event.created"', request.data)
+        self.assertFalse(Job.objects.exists())
@@ -0,0 +1,25 @@
+from rest_framework import generics
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+
+from jobs.queue import get_queue_stats
+
+
+@extend_schema(
+    tags=["Jobs"],
+    description=(
+        "Staff only. Queue-depth metrics of the background job queue: pending, due, running "
+        "and failed jobs, and the age of the oldest due job in seconds."
+    ),
+    responses={200: OpenApiResponse(description='Object with `pending`, `due`, `running`, `failed` and `oldest_due_age_seconds` keys')},
+)
+class JobStatsView(generics.GenericAPIView):
+    """
+    Exposes `get_queue_stats()` for dashboards and alerting.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(get_queue_stats())